@@ -0,0 +1,94 @@
+"""
+Import time and per-call cost of the EDA functions with and without plotting.
+
+Run from the project root:
+    python -m benchmarks.headless_benchmark --rows 100000
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+from src.eda.correlation.analyze_correlation import analyze_correlation_matrix
+from src.eda.skewness.analyze_skewness import analyze_skewness
+
+# Statements timed in a fresh interpreter; the plotting stack is loaded only by the second
+IMPORT_STATEMENTS = {
+    "utils.visualization (lazy)": "import utils.visualization",
+    "matplotlib.pyplot + seaborn": "import matplotlib.pyplot, seaborn",
+}
+
+
+def import_seconds(statement, repeats=3):
+    """Best wall time of `statement` in a fresh interpreter, minus the bare interpreter start."""
+
+    def best(code):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], check=True)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    return best(statement) - best("pass")
+
+
+def call_seconds(func, *args, repeats=3, **kwargs):
+    """Best wall time of one call, closing any figures it opened."""
+    from matplotlib import pyplot as plt
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+        plt.close("all")
+    return min(times)
+
+
+def run(rows):
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "Quantity": rng.lognormal(1.5, 1.0, rows),
+            "UnitPrice": rng.lognormal(1.0, 0.8, rows),
+            "TotalPrice": rng.lognormal(2.0, 1.0, rows),
+        }
+    )
+
+    print("Import time:")
+    for name, statement in IMPORT_STATEMENTS.items():
+        print(f"  {name}: {import_seconds(statement):.3f}s")
+
+    records = []
+    for name, func in [
+        ("analyze_skewness", analyze_skewness),
+        ("analyze_correlation_matrix", analyze_correlation_matrix),
+    ]:
+        plotted = call_seconds(func, df, plot=True)
+        headless = call_seconds(func, df, plot=False)
+        records.append(
+            {
+                "function": name,
+                "plot_s": round(plotted, 3),
+                "headless_s": round(headless, 3),
+                "saved_s": round(plotted - headless, 3),
+            }
+        )
+
+    print(f"Per call on {rows} rows:")
+    print(pd.DataFrame(records).to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    run(parser.parse_args().rows)
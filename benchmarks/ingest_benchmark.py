@@ -0,0 +1,80 @@
+"""
+Throughput of multi-file `create_dataframe` against a serial loop over the files.
+
+Run from the project root:
+    python -m benchmarks.ingest_benchmark --files 12 --rows-per-file 200000 --workers 4
+
+Synthetic daily exports are written once per format under .cache/benchmarks/ingest.
+"""
+
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from src.data_preprocessing.create_dataframe import create_dataframe
+from utils.config import CACHE_DIR
+from .synthetic_retail import write_transactions
+
+INGEST_DATA_DIR = os.path.join(CACHE_DIR, "benchmarks", "ingest")
+
+
+def export_files(files, rows_per_file, file_ext, seed=42):
+    """Writes `files` synthetic exports of one format, reusing existing ones."""
+    paths = []
+    for i in range(files):
+        path = os.path.join(
+            INGEST_DATA_DIR, f"export_{rows_per_file}_{i:03d}.{file_ext}"
+        )
+        if not os.path.exists(path):
+            os.makedirs(INGEST_DATA_DIR, exist_ok=True)
+            write_transactions(rows_per_file, path, seed + i)
+        paths.append(path)
+    return paths
+
+
+def measure(paths, workers):
+    """
+    Times a serial loop over `create_dataframe` and one multi-file call.
+
+    Returns:
+        dict: Rows, serial and parallel seconds and rows per second of each.
+    """
+    start = time.perf_counter()
+    serial = pd.concat([create_dataframe(path) for path in paths], ignore_index=True)
+    serial_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = create_dataframe(paths, workers=workers)
+    parallel_s = time.perf_counter() - start
+
+    if len(serial) != len(parallel):
+        raise RuntimeError("Serial and multi-file reads returned different row counts.")
+
+    return {
+        "rows": len(parallel),
+        "serial_s": serial_s,
+        "parallel_s": parallel_s,
+        "serial_rows_per_s": len(serial) / serial_s,
+        "parallel_rows_per_s": len(parallel) / parallel_s,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=12)
+    parser.add_argument("--rows-per-file", type=int, default=200_000)
+    parser.add_argument("--formats", nargs="+", default=["csv", "parquet"])
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}")
+    for file_ext in args.formats:
+        paths = export_files(args.files, args.rows_per_file, file_ext)
+        result = measure(paths, args.workers)
+        print(
+            f"{file_ext}: {result['rows']} rows | serial {result['serial_s']:.2f}s "
+            f"({result['serial_rows_per_s']:,.0f} rows/s) | multi-file "
+            f"{result['parallel_s']:.2f}s ({result['parallel_rows_per_s']:,.0f} rows/s)"
+        )
@@ -0,0 +1,20 @@
+"""
+Reference implementations copied from the notebooks, used by the benchmarks and tests
+to check the optimized modules against.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def notebook_rfm(df):
+    """The RFM aggregation as written in notebooks/segmentation.ipynb."""
+    df = df.dropna(subset=["CustomerID"])
+    reference_date = df["InvoiceDate"].max() + pd.Timedelta(days=1)
+    rfm = df.groupby("CustomerID").agg(
+        Recency=("InvoiceDate", lambda x: (reference_date - x.max()).days),
+        Frequency=("InvoiceNo", "nunique"),
+        Monetary=("TotalPrice", "sum"),
+    )
+    rfm["Monetary_log"] = np.log1p(rfm["Monetary"])
+    return rfm
@@ -0,0 +1,124 @@
+"""
+Latency and throughput of online cluster assignment under a local load generator.
+
+Run from the project root:
+    python -m benchmarks.online_scoring_benchmark --clients 64 --requests 200
+
+Compares per-request sklearn scoring (scaler.transform + KMeans.predict on one row)
+with the micro-batching scorer, called in-process and over its TCP JSON-lines server.
+Customers are sampled from the clustered RFM table the model was trained on.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+
+from src.data_preprocessing.create_dataframe import create_dataframe
+from src.modeling.online_scoring import (
+    ClusterAssigner,
+    MicroBatchScorer,
+    record_features,
+    serve,
+)
+from src.modeling.scoring import load_scoring_artifacts, predict_clusters
+from utils.config import KMEANS_MODEL_PATH, RFM_CLUSTERS_PATH, SCALER_PATH
+from utils.constants import RFM
+
+
+def load_records(count, seed=0):
+    """Samples `count` RFM records (dicts) from the clustered RFM table."""
+    rfm = create_dataframe(RFM_CLUSTERS_PATH)
+    rows = rfm.sample(count, replace=True, random_state=seed)
+    return rows[[RFM["RECENCY"], RFM["FREQUENCY"], RFM["MONETARY"]]].to_dict("records")
+
+
+def summarize(name, latencies, elapsed):
+    """Prints p50/p99 latency in milliseconds and requests per second."""
+    latencies = np.asarray(latencies) * 1000
+    print(
+        f"{name}: p50 {np.percentile(latencies, 50):.3f} ms | "
+        f"p99 {np.percentile(latencies, 99):.3f} ms | "
+        f"{len(latencies) / elapsed:,.0f} req/s"
+    )
+
+
+def run_sklearn(records, model, scaler):
+    """One request at a time through sklearn, as without the service."""
+    latencies = []
+    start = time.perf_counter()
+    for record in records:
+        sent = time.perf_counter()
+        predict_clusters(model, scaler, np.asarray([record_features(record)]))
+        latencies.append(time.perf_counter() - sent)
+    summarize("sklearn per request", latencies, time.perf_counter() - start)
+
+
+async def run_clients(records, clients, send):
+    """Closed-loop load: `clients` concurrent callers, each awaiting its previous reply."""
+    latencies = []
+
+    async def client(batch):
+        for record in batch:
+            sent = time.perf_counter()
+            await send(record)
+            latencies.append(time.perf_counter() - sent)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(records[i::clients]) for i in range(clients)))
+    return latencies, time.perf_counter() - start
+
+
+async def run_service(records, clients, assigner, port):
+    """Micro-batching scorer, in-process and over TCP."""
+    async with MicroBatchScorer(assigner) as scorer:
+        latencies, elapsed = await run_clients(records, clients, scorer.assign)
+        summarize("micro-batch in-process", latencies, elapsed)
+        print(f"  mean batch size {scorer.scored / scorer.batches:.1f}")
+
+        server = asyncio.create_task(serve(scorer, port=port))
+        await asyncio.sleep(0.1)
+        connections = [
+            await asyncio.open_connection("127.0.0.1", port) for _ in range(clients)
+        ]
+        free = asyncio.Queue()
+        for connection in connections:
+            free.put_nowait(connection)
+
+        async def send(record):
+            reader, writer = await free.get()
+            writer.write(json.dumps(record).encode() + b"\n")
+            await writer.drain()
+            await reader.readline()
+            free.put_nowait((reader, writer))
+
+        latencies, elapsed = await run_clients(records, clients, send)
+        summarize("micro-batch over TCP", latencies, elapsed)
+
+        for _, writer in connections:
+            writer.close()
+        server.cancel()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=200, help="Per client.")
+    parser.add_argument("--model", default=KMEANS_MODEL_PATH)
+    parser.add_argument("--scaler", default=SCALER_PATH)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    model, scaler = load_scoring_artifacts(args.model, args.scaler)
+    assigner = ClusterAssigner(model.cluster_centers_, scaler.mean_, scaler.scale_)
+
+    records = load_records(args.clients * args.requests)
+    features = np.array([record_features(record) for record in records])
+    expected = predict_clusters(model, scaler, features)
+    if not np.array_equal(assigner.assign(features), expected):
+        raise RuntimeError("Vectorized assignment differs from KMeans.predict.")
+
+    run_sklearn(records[: min(len(records), 2_000)], model, scaler)
+    asyncio.run(run_service(records, args.clients, assigner, args.port))
@@ -0,0 +1,262 @@
+"""
+Wall time and peak RSS of every pipeline stage on synthetic Online Retail data.
+
+Run from the project root:
+    python -m benchmarks.pipeline_benchmark --rows 1m --save-baseline benchmarks/baseline.json
+    python -m benchmarks.pipeline_benchmark --rows 1m --baseline benchmarks/baseline.json --threshold 0.25
+
+Every stage runs in a fresh process, so its peak RSS is not inflated by earlier
+stages; inputs are prepared in that process before the clock starts. A run against a
+baseline exits with status 1 when a stage is slower or larger than the baseline by
+more than the threshold. Peak RSS is read with the `resource` module (Unix only).
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+import pandas as pd
+
+from utils.config import CACHE_DIR
+from utils.constants import TRANSACTIONS
+from .synthetic_retail import DATASET_SIZES, write_transactions
+
+BENCHMARK_DATA_DIR = os.path.join(CACHE_DIR, "benchmarks")
+
+# Stages shorter than this in the baseline are too noisy to check for time regressions
+MIN_CHECKED_SECONDS = 0.2
+DEFAULT_THRESHOLD = 0.25
+
+NUMERIC_COLUMNS = [
+    TRANSACTIONS["QUANTITY"],
+    TRANSACTIONS["UNIT_PRICE"],
+    TRANSACTIONS["TOTAL_PRICE"],
+]
+
+
+def _load_transactions(path):
+    """Transactions with positive quantities and prices and a TotalPrice column, as in the notebook."""
+    df = pd.read_parquet(path)
+    df = df[(df[TRANSACTIONS["QUANTITY"]] > 0) & (df[TRANSACTIONS["UNIT_PRICE"]] > 0)]
+    return df.assign(
+        **{
+            TRANSACTIONS["TOTAL_PRICE"]: df[TRANSACTIONS["QUANTITY"]]
+            * df[TRANSACTIONS["UNIT_PRICE"]]
+        }
+    )
+
+
+def _prepare_create_dataframe(path):
+    from src.data_preprocessing.create_dataframe import create_dataframe
+
+    return lambda: create_dataframe(path)
+
+
+def _prepare_analyze_dataset(path):
+    from src.data_preprocessing.data_analysis import analyze_dataset
+
+    df = _load_transactions(path)
+    return lambda: analyze_dataset(df, exclude_columns=[TRANSACTIONS["CUSTOMER_ID"]])
+
+
+def _prepare_analyze_skewness(path):
+    from src.eda.skewness.analyze_skewness import analyze_skewness
+
+    df = _load_transactions(path)[NUMERIC_COLUMNS]
+    return lambda: analyze_skewness(df, plot=False)
+
+
+def _prepare_analyze_correlation_matrix(path):
+    from src.eda.correlation.analyze_correlation import analyze_correlation_matrix
+
+    df = _load_transactions(path)[NUMERIC_COLUMNS]
+    return lambda: analyze_correlation_matrix(df, plot=False)
+
+
+def _prepare_handle_outliers_in_data(path):
+    from src.eda.outliers.outlier_handling import handle_outliers_in_data
+
+    df = _load_transactions(path)[NUMERIC_COLUMNS]
+    return lambda: handle_outliers_in_data(df, method="remove")
+
+
+def _prepare_best_transformation_with_outliers(path):
+    from src.eda.outliers.transformations import best_transformation_with_outliers
+    from src.eda.skewness.analyze_skewness import analyze_skewness
+
+    df = _load_transactions(path)[NUMERIC_COLUMNS]
+    skew_categories = analyze_skewness(df, plot=False)
+    return lambda: best_transformation_with_outliers(
+        df, skew_categories, handle_outliers=True
+    )
+
+
+def _prepare_rfm(path):
+    from src.features.rfm import compute_rfm
+
+    df = _load_transactions(path)
+    return lambda: compute_rfm(df)
+
+
+def _prepare_kmeans(path):
+    from sklearn.cluster import KMeans
+
+    from src.features.rfm import compute_rfm
+    from src.modeling.scaling import scale_rfm_features
+
+    scaled = scale_rfm_features(compute_rfm(_load_transactions(path)))
+    return lambda: KMeans(n_clusters=3, random_state=42, n_init=10).fit(scaled)
+
+
+# Stage name -> function that loads the stage's input and returns the timed call
+STAGES = {
+    "create_dataframe": _prepare_create_dataframe,
+    "analyze_dataset": _prepare_analyze_dataset,
+    "analyze_skewness": _prepare_analyze_skewness,
+    "analyze_correlation_matrix": _prepare_analyze_correlation_matrix,
+    "handle_outliers_in_data": _prepare_handle_outliers_in_data,
+    "best_transformation_with_outliers": _prepare_best_transformation_with_outliers,
+    "rfm": _prepare_rfm,
+    "kmeans": _prepare_kmeans,
+}
+
+
+def dataset_path(rows, seed=42):
+    """Returns the Parquet file of the synthetic dataset, generating it on first use."""
+    path = os.path.join(BENCHMARK_DATA_DIR, f"retail_{rows}_{seed}.parquet")
+    if not os.path.exists(path):
+        os.makedirs(BENCHMARK_DATA_DIR, exist_ok=True)
+        print(f"Generating {rows} rows into {path}...")
+        write_transactions(rows, f"{path}.tmp.parquet", seed)
+        os.replace(f"{path}.tmp.parquet", path)
+    return path
+
+
+def _run_stage(stage, path, queue):
+    """Child process body: prepares the input, times one call and reports wall time and RSS."""
+    call = STAGES[stage](path)
+    input_rss = _peak_rss_bytes()
+
+    start = time.perf_counter()
+    call()
+    wall = time.perf_counter() - start
+
+    queue.put(
+        {
+            "wall_s": wall,
+            "peak_rss_mb": _peak_rss_bytes() / 1024**2,
+            "input_rss_mb": input_rss / 1024**2,
+        }
+    )
+
+
+def _peak_rss_bytes():
+    """Peak resident set size of the current process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_stage(stage, path):
+    """Runs one stage in a fresh process and returns its measurements."""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_run_stage, args=(stage, path, queue))
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+        raise RuntimeError(f"Stage '{stage}' failed with exit code {process.exitcode}.")
+    return queue.get()
+
+
+def run(rows_list, stages=None, seed=42):
+    """
+    Runs the selected stages on each dataset size.
+
+    Returns:
+        dict: {rows: {stage: {'wall_s', 'peak_rss_mb', 'input_rss_mb'}}}, with string keys.
+    """
+    results = {}
+    for rows in rows_list:
+        path = dataset_path(rows, seed)
+        results[str(rows)] = {}
+        for stage in stages or STAGES:
+            measurement = run_stage(stage, path)
+            results[str(rows)][stage] = measurement
+            print(
+                f"{rows} rows | {stage}: {measurement['wall_s']:.3f}s, "
+                f"peak RSS {measurement['peak_rss_mb']:.0f} MB"
+            )
+    return results
+
+
+def find_regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares results with a baseline of the same layout.
+
+    Returns:
+        list: One message per stage and metric that exceeds the baseline by more than
+              `threshold` (a fraction, e.g. 0.25 for 25%).
+    """
+    regressions = []
+    for rows, stages in results.items():
+        for stage, measurement in stages.items():
+            reference = baseline.get(rows, {}).get(stage)
+            if reference is None:
+                continue
+
+            checks = [("peak_rss_mb", "peak RSS")]
+            if reference["wall_s"] >= MIN_CHECKED_SECONDS:
+                checks.append(("wall_s", "wall time"))
+
+            for key, label in checks:
+                limit = reference[key] * (1 + threshold)
+                if measurement[key] > limit:
+                    regressions.append(
+                        f"{rows} rows | {stage}: {label} {measurement[key]:.3f} "
+                        f"exceeds baseline {reference[key]:.3f} by more than {threshold:.0%}"
+                    )
+    return regressions
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        nargs="+",
+        default=["1m"],
+        help="Dataset sizes: row counts or 1m, 10m, 50m.",
+    )
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", help="JSON results to compare against.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save-baseline", help="Write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    rows_list = [DATASET_SIZES.get(rows.lower()) or int(rows) for rows in args.rows]
+    results = run(rows_list, args.stages, args.seed)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved results to {args.save_baseline}.")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(results, json.load(f), args.threshold)
+        if regressions:
+            print("Regressions:\n" + "\n".join(regressions))
+            return 1
+        print(f"No stage regressed by more than {args.threshold:.0%}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
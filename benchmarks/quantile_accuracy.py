@@ -0,0 +1,102 @@
+"""
+Accuracy versus memory of the quantile sketch backend against the exact path.
+
+Run from the project root:
+    python -m benchmarks.quantile_accuracy
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from src.data_preprocessing.data_analysis import compute_summary_statistics
+from src.eda.outliers.outlier_handling import compute_iqr_bounds
+from utils.quantiles import create_quantile_estimator
+
+QUANTILES = [0.25, 0.5, 0.75]
+ERRORS = [0.05, 0.01, 0.002]
+ROWS = 2_000_000
+CHUNKS = 200
+
+
+def make_distributions(rows, seed=42):
+    """Synthetic columns shaped like the retail data (heavy-tailed, discrete, uniform)."""
+    rng = np.random.default_rng(seed)
+    return {
+        "UnitPrice (lognormal)": rng.lognormal(1.0, 1.2, rows),
+        "Quantity (discrete)": rng.geometric(0.08, rows).astype("float64"),
+        "Uniform": rng.random(rows),
+    }
+
+
+def rank_error(sorted_values, estimate, q):
+    """Distance between `q` and the rank interval occupied by `estimate`."""
+    n = len(sorted_values)
+    low = np.searchsorted(sorted_values, estimate, side="left") / n
+    high = np.searchsorted(sorted_values, estimate, side="right") / n
+    return 0.0 if low <= q <= high else min(abs(low - q), abs(high - q))
+
+
+def run(rows=ROWS, chunks=CHUNKS):
+    """Prints one row per (distribution, backend) and returns False if a bound is violated."""
+    records = []
+    for name, values in make_distributions(rows).items():
+        sorted_values = np.sort(values)
+
+        for backend, error in [("exact", None)] + [("kll", e) for e in ERRORS]:
+            estimator = create_quantile_estimator(backend, error)
+            for chunk in np.array_split(values, chunks):
+                estimator.update(chunk)
+
+            estimates = estimator.quantile(QUANTILES)
+            records.append(
+                {
+                    "distribution": name,
+                    "backend": backend,
+                    "error_bound": error,
+                    "max_rank_error": max(
+                        rank_error(sorted_values, v, q)
+                        for v, q in zip(estimates, QUANTILES)
+                    ),
+                    "memory_bytes": estimator.nbytes,
+                }
+            )
+
+    report = pd.DataFrame(records)
+    print(report.to_string(index=False))
+
+    violations = report[
+        report["error_bound"].notna()
+        & (report["max_rank_error"] > report["error_bound"])
+    ]
+    return violations.empty
+
+
+def check_entry_points(rows=200_000, error=0.01):
+    """Compares describe()-style stats and IQR bounds from the sketch path to the exact path."""
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(
+        {
+            "Quantity": rng.geometric(0.08, rows),
+            "UnitPrice": rng.lognormal(1.0, 1.2, rows),
+        }
+    )
+    chunks = [df.iloc[i : i + 10_000] for i in range(0, rows, 10_000)]
+
+    exact_stats = compute_summary_statistics(df, None)
+    sketch_stats = compute_summary_statistics(iter(chunks), None, "kll", error)
+    print("\nExact statistics:\n" + exact_stats.to_string())
+    print("\nKLL statistics (chunked):\n" + sketch_stats.to_string())
+
+    exact_bounds = compute_iqr_bounds(df, df.columns)
+    sketch_bounds = compute_iqr_bounds(iter(chunks), df.columns, 1.5, "kll", error)
+    print("\nIQR bounds (exact vs KLL):")
+    for col in df.columns:
+        print(f"  - {col}: {exact_bounds[col]} vs {sketch_bounds[col]}")
+
+
+if __name__ == "__main__":
+    ok = run()
+    check_entry_points()
+    sys.exit(0 if ok else 1)
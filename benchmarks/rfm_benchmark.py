@@ -0,0 +1,55 @@
+"""
+Equivalence check and benchmark of the vectorized RFM module against the notebook logic.
+
+Run from the project root:
+    python -m benchmarks.rfm_benchmark --rows 1000000 10000000
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from src.features.rfm import compute_rfm
+from .notebook_reference import notebook_rfm
+from .synthetic_retail import generate_transactions
+
+DEFAULT_ROWS = [1_000_000, 10_000_000]
+
+
+def timed(func, *args):
+    """Returns (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run(rows_list):
+    """Checks equivalence and prints the timing table for each dataset size."""
+    records = []
+    for rows in rows_list:
+        df = generate_transactions(rows, total_price=True)
+
+        expected, notebook_seconds = timed(notebook_rfm, df)
+        result, vectorized_seconds = timed(compute_rfm, df)
+
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+        records.append(
+            {
+                "rows": rows,
+                "customers": len(result),
+                "notebook_s": round(notebook_seconds, 3),
+                "vectorized_s": round(vectorized_seconds, 3),
+                "speedup": round(notebook_seconds / vectorized_seconds, 1),
+            }
+        )
+        print(f"{rows} rows: outputs match.")
+
+    print(pd.DataFrame(records).to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    run(parser.parse_args().rows)
@@ -0,0 +1,227 @@
+"""
+Deterministic generator of Online Retail-shaped transactions.
+
+Run from the project root to write a dataset:
+    python -m benchmarks.synthetic_retail 10000000 .cache/benchmarks/retail_10m.parquet
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import TRANSACTIONS
+from utils.helpers import get_file_extension_from_path
+
+# Standard dataset sizes of the benchmark suite
+DATASET_SIZES = {"1m": 1_000_000, "10m": 10_000_000, "50m": 50_000_000}
+
+# Rows generated per block; the output for a seed does not depend on how it is consumed
+BLOCK_ROWS = 1_000_000
+# Random stream of the product catalog (blocks use streams 0, 1, 2, ...)
+CATALOG_STREAM = 2**32 - 1
+
+FIRST_INVOICE = 536365
+START_DATE = pd.Timestamp("2010-12-01 08:00")
+PERIOD_MINUTES = 373 * 24 * 60
+LINES_PER_INVOICE = 20
+ROWS_PER_CUSTOMER = 120
+CATALOG_SIZE = 4_000
+MISSING_CUSTOMER_SHARE = 0.25
+CANCELLED_SHARE = 0.02
+
+COUNTRIES = [
+    "United Kingdom",
+    "Germany",
+    "France",
+    "EIRE",
+    "Spain",
+    "Netherlands",
+    "Belgium",
+    "Switzerland",
+    "Portugal",
+    "Australia",
+]
+COUNTRY_WEIGHTS = [0.89, 0.02, 0.02, 0.02, 0.01, 0.01, 0.01, 0.01, 0.005, 0.005]
+
+WORDS = [
+    "WHITE",
+    "HANGING",
+    "HEART",
+    "T-LIGHT",
+    "HOLDER",
+    "VINTAGE",
+    "JUMBO",
+    "BAG",
+    "RED",
+    "RETROSPOT",
+    "LUNCH",
+    "BOX",
+    "CERAMIC",
+    "CAKE",
+    "STAND",
+    "PAPER",
+    "CHAIN",
+    "KIT",
+    "SET",
+    "OF",
+    "3",
+    "6",
+    "GLASS",
+    "LANTERN",
+    "CHRISTMAS",
+    "DOORMAT",
+    "ALARM",
+    "CLOCK",
+    "BAKELIKE",
+    "PINK",
+]
+
+
+def iter_transactions(rows, seed=42, customers=None):
+    """
+    Yields Online Retail-shaped transactions in blocks of BLOCK_ROWS rows.
+
+    Invoices are numbered and dated in increasing order and never span two blocks;
+    about 2% are cancellations ('C' prefix, negative quantities) and 25% of the invoices
+    have no CustomerID, as in the original dataset. Every block has its own random
+    stream derived from `seed`, so the data is identical however it is consumed.
+
+    Args:
+        rows (int): Total number of rows.
+        seed (int): Random seed.
+        customers (int, optional): Number of distinct customers; defaults to one per
+                                   ROWS_PER_CUSTOMER rows.
+
+    Yields:
+        pd.DataFrame: InvoiceNo, StockCode, Description, Quantity, InvoiceDate,
+                      UnitPrice, CustomerID and Country.
+    """
+    customers = customers or max(rows // ROWS_PER_CUSTOMER, 10)
+    catalog = _catalog(seed)
+
+    rng = np.random.default_rng([seed, 0])
+    customer_country = rng.choice(len(COUNTRIES), customers, p=COUNTRY_WEIGHTS)
+    countries = np.array(COUNTRIES, dtype=object)
+
+    total_invoices = max(rows // LINES_PER_INVOICE, 1)
+    for block, start in enumerate(range(0, rows, BLOCK_ROWS)):
+        block_rows = min(BLOCK_ROWS, rows - start)
+        rng = np.random.default_rng([seed, block + 1])
+
+        # Invoices of this block, in time order
+        first_invoice = start // LINES_PER_INVOICE
+        invoices = max(block_rows // LINES_PER_INVOICE, 1)
+        invoice_of_row = np.sort(rng.integers(0, invoices, block_rows))
+        invoice_minutes = (
+            (first_invoice + np.arange(invoices)) * PERIOD_MINUTES // total_invoices
+        )
+        invoice_customer = rng.integers(0, customers, invoices)
+        cancelled = rng.random(invoices) < CANCELLED_SHARE
+        anonymous = rng.random(invoices) < MISSING_CUSTOMER_SHARE
+
+        invoice_numbers = (FIRST_INVOICE + first_invoice + np.arange(invoices)).astype(
+            str
+        )
+        invoice_numbers = np.where(
+            cancelled, np.char.add("C", invoice_numbers), invoice_numbers
+        ).astype(object)
+
+        customer_ids = (12346 + invoice_customer).astype("float64")
+        customer_ids[anonymous] = np.nan
+
+        # Line items
+        items = rng.zipf(1.3, block_rows) % CATALOG_SIZE
+        quantity = rng.geometric(0.25, block_rows)
+        quantity = np.where(cancelled[invoice_of_row], -quantity, quantity)
+        unit_price = np.round(
+            catalog["price"][items] * rng.uniform(0.9, 1.1, block_rows), 2
+        )
+
+        yield pd.DataFrame(
+            {
+                TRANSACTIONS["INVOICE_NO"]: invoice_numbers[invoice_of_row],
+                TRANSACTIONS["STOCK_CODE"]: catalog["code"][items],
+                TRANSACTIONS["DESCRIPTION"]: catalog["description"][items],
+                TRANSACTIONS["QUANTITY"]: quantity.astype("int64"),
+                TRANSACTIONS["INVOICE_DATE"]: START_DATE
+                + pd.to_timedelta(invoice_minutes[invoice_of_row], unit="min"),
+                TRANSACTIONS["UNIT_PRICE"]: unit_price,
+                TRANSACTIONS["CUSTOMER_ID"]: customer_ids[invoice_of_row],
+                TRANSACTIONS["COUNTRY"]: countries[
+                    customer_country[invoice_customer[invoice_of_row]]
+                ],
+            },
+            index=pd.RangeIndex(start, start + block_rows),
+        )
+
+
+def generate_transactions(rows, seed=42, customers=None, total_price=False):
+    """
+    Returns `rows` synthetic transactions as one DataFrame (see `iter_transactions`),
+    with a TotalPrice column (Quantity * UnitPrice, as in the notebook) if `total_price`.
+    """
+    df = pd.concat(iter_transactions(rows, seed, customers))
+    if total_price:
+        df[TRANSACTIONS["TOTAL_PRICE"]] = (
+            df[TRANSACTIONS["QUANTITY"]] * df[TRANSACTIONS["UNIT_PRICE"]]
+        )
+    return df
+
+
+def write_transactions(rows, path, seed=42, customers=None):
+    """
+    Writes synthetic transactions to a CSV or Parquet file one block at a time,
+    so datasets larger than memory can be produced.
+
+    Returns:
+        str: The written path.
+    """
+    file_ext = get_file_extension_from_path(path)
+    if file_ext not in ["csv", "parquet"]:
+        raise ValueError(f"Unsupported output format: {file_ext}")
+
+    writer = None
+    try:
+        for i, block in enumerate(iter_transactions(rows, seed, customers)):
+            if file_ext == "csv":
+                block.to_csv(path, mode="a" if i else "w", header=not i, index=False)
+                continue
+
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(block, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return path
+
+
+def _catalog(seed):
+    """Stock codes with a fixed description and base price each."""
+    rng = np.random.default_rng([seed, CATALOG_STREAM])
+    numbers = rng.choice(np.arange(10000, 99999), CATALOG_SIZE, replace=False)
+    suffixes = rng.choice(np.array(["", "", "", "A", "B", "C"]), CATALOG_SIZE)
+    words = rng.choice(np.array(WORDS, dtype=object), (CATALOG_SIZE, 4))
+
+    return {
+        "code": np.char.add(numbers.astype(str), suffixes).astype(object),
+        "description": np.array([" ".join(w) for w in words], dtype=object),
+        "price": np.round(rng.lognormal(1.0, 0.9, CATALOG_SIZE), 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("rows", help="Number of rows or one of 1m, 10m, 50m.")
+    parser.add_argument("output_path", help="Output file (CSV or Parquet).")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rows = DATASET_SIZES.get(args.rows.lower()) or int(args.rows)
+    print(f"Wrote {write_transactions(rows, args.output_path, args.seed)}.")
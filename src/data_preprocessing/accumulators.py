@@ -0,0 +1,191 @@
+import numpy as np
+import pandas as pd
+
+from utils.constants import MISSING_VALUES
+from utils.quantiles import create_quantile_estimator
+from .duplicates import DuplicateDetector
+
+# Column order of the statistics table, matching DataFrame.describe()
+STAT_COLUMNS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+# Positions inside a per-column moments array
+COUNT, MEAN, M2, MIN, MAX = range(5)
+
+
+class DatasetAccumulator:
+    """
+    Single-pass, mergeable accumulator for the statistics reported by `analyze_dataset`.
+
+    Feed it chunks with `update`, combine accumulators built on other chunks or workers
+    with `merge`, and read the totals with the summary methods once all data has been seen.
+    """
+
+    def __init__(
+        self, exclude_columns=None, quantile_backend="exact", quantile_error=None
+    ):
+        self.exclude_columns = set(exclude_columns or [])
+        self.quantile_backend = quantile_backend
+        self.quantile_error = quantile_error
+        self.rows = 0
+        self.dtypes = {}
+        self.missing = {}
+        # Column -> [count, mean, M2, min, max] (Welford / Chan et al. running moments)
+        self.moments = {}
+        # Column -> quantile estimator (see utils.quantiles), used for the quartiles
+        self.quantiles = {}
+        # Seen-set of row fingerprints, used for duplicate counting
+        self.duplicate_detector = DuplicateDetector()
+
+    def update(self, chunk):
+        """Folds one DataFrame chunk into the accumulator."""
+        self.rows += len(chunk)
+
+        for col, dtype in chunk.dtypes.items():
+            self.dtypes[col] = _common_dtype(self.dtypes.get(col), dtype)
+
+        for col, count in chunk.isnull().sum().items():
+            self.missing[col] = self.missing.get(col, 0) + int(count)
+
+        self.duplicate_detector.update(chunk)
+
+        numeric_columns = [
+            col
+            for col in chunk.select_dtypes(include=["number"]).columns
+            if col not in self.exclude_columns
+        ]
+        if not numeric_columns:
+            return self
+
+        # Moments for every numeric column of the chunk in one vectorized pass
+        values = chunk[numeric_columns].to_numpy(dtype="float64", na_value=np.nan)
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(valid, values, 0.0).sum(axis=0) / counts
+            m2 = np.where(valid, (values - means) ** 2, 0.0).sum(axis=0)
+        mins = np.where(valid, values, np.inf).min(axis=0)
+        maxs = np.where(valid, values, -np.inf).max(axis=0)
+
+        for i, col in enumerate(numeric_columns):
+            chunk_moments = np.array([counts[i], means[i], m2[i], mins[i], maxs[i]])
+            self.moments[col] = _combine_moments(self.moments.get(col), chunk_moments)
+            if col not in self.quantiles:
+                self.quantiles[col] = create_quantile_estimator(
+                    self.quantile_backend, self.quantile_error
+                )
+            self.quantiles[col].update(values[valid[:, i], i])
+
+        return self
+
+    def merge(self, other):
+        """Combines another accumulator (e.g. from a different chunk or worker) into this one."""
+        self.rows += other.rows
+
+        for col, dtype in other.dtypes.items():
+            self.dtypes[col] = _common_dtype(self.dtypes.get(col), dtype)
+
+        for col, count in other.missing.items():
+            self.missing[col] = self.missing.get(col, 0) + count
+
+        for col, moments in other.moments.items():
+            self.moments[col] = _combine_moments(self.moments.get(col), moments)
+
+        for col, estimator in other.quantiles.items():
+            if col in self.quantiles:
+                self.quantiles[col].merge(estimator)
+            else:
+                self.quantiles[col] = estimator
+
+        self.duplicate_detector.merge(other.duplicate_detector)
+        return self
+
+    def missing_summary(self):
+        """Returns the missing-value summary in the format of `summarize_missing_values`."""
+        missing_count = pd.Series(
+            [self.missing.get(col, 0) for col in self.dtypes],
+            index=list(self.dtypes),
+            dtype="int64",
+        )
+        missing_data = missing_count[missing_count > 0]
+        size = self.rows * len(self.dtypes)
+
+        return {
+            MISSING_VALUES["TOTAL"]: missing_data.sum(),
+            MISSING_VALUES["PERCENTAGE"]: (missing_data.sum() / size) * 100,
+            MISSING_VALUES["DETAILS"]: missing_data.to_dict(),
+        }
+
+    def duplicate_count(self):
+        """Returns the number of rows that repeat an earlier row."""
+        return self.duplicate_detector.duplicates
+
+    def data_types(self):
+        """Returns the column data types as a two-column DataFrame."""
+        return pd.DataFrame(
+            {"Column": list(self.dtypes), "DataType": list(self.dtypes.values())}
+        )
+
+    def summary_statistics(self):
+        """Returns describe()-style statistics for the accumulated numeric columns."""
+        rows = {}
+        for col, (count, mean, m2, col_min, col_max) in self.moments.items():
+            if count == 0:
+                rows[col] = [0.0] + [np.nan] * (len(STAT_COLUMNS) - 1)
+                continue
+
+            std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+            q1, median, q3 = self.quantiles[col].quantile([0.25, 0.5, 0.75])
+            rows[col] = [count, mean, std, col_min, q1, median, q3, col_max]
+
+        stats = pd.DataFrame.from_dict(rows, orient="index", columns=STAT_COLUMNS)
+        return stats.round(2)
+
+
+def accumulate_dataset(
+    chunks, exclude_columns=None, quantile_backend="exact", quantile_error=None
+):
+    """
+    Builds a DatasetAccumulator from a DataFrame or an iterable of DataFrame chunks.
+
+    Args:
+        chunks (pd.DataFrame | Iterable[pd.DataFrame]): Data to accumulate.
+        exclude_columns (list, optional): Columns to exclude from numerical statistics.
+        quantile_backend (str, optional): Quantile backend for the quartiles ('exact' or 'kll').
+        quantile_error (float, optional): Target rank error of sketch backends.
+
+    Returns:
+        DatasetAccumulator: The filled accumulator.
+    """
+    if isinstance(chunks, pd.DataFrame):
+        chunks = [chunks]
+
+    accumulator = DatasetAccumulator(exclude_columns, quantile_backend, quantile_error)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator
+
+
+def _combine_moments(left, right):
+    """Merges two [count, mean, M2, min, max] arrays with the parallel variance formula."""
+    if left is None or left[COUNT] == 0:
+        return right.copy()
+    if right[COUNT] == 0:
+        return left.copy()
+
+    count = left[COUNT] + right[COUNT]
+    delta = right[MEAN] - left[MEAN]
+    mean = left[MEAN] + delta * right[COUNT] / count
+    m2 = left[M2] + right[M2] + delta**2 * left[COUNT] * right[COUNT] / count
+
+    return np.array(
+        [count, mean, m2, min(left[MIN], right[MIN]), max(left[MAX], right[MAX])]
+    )
+
+
+def _common_dtype(current, new):
+    """Returns a dtype able to hold values of both `current` and `new`."""
+    if current is None or current == new:
+        return new
+    if isinstance(current, np.dtype) and isinstance(new, np.dtype):
+        return np.result_type(current, new)
+    return np.dtype("object")
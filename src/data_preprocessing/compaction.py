@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from utils.constants import MEMORY_REPORT
+from utils.instrumentation import instrumented
+
+
+@instrumented()
+def compact_dtypes(
+    df, category_threshold=0.5, exclude_columns=None, allow_precision_loss=False
+):
+    """
+    Shrinks the memory footprint of a DataFrame by choosing smaller dtypes.
+
+    Integers are downcast to the smallest type that holds their range, floats are
+    downcast to float32 when that is lossless (or always with `allow_precision_loss`),
+    and text columns whose share of unique values is at most `category_threshold`
+    are converted to `category`.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to compact. It is not modified.
+        category_threshold (float, optional): Maximum unique-to-rows ratio for a text
+                                              column to become categorical.
+        exclude_columns (list, optional): Columns to leave untouched.
+        allow_precision_loss (bool, optional): Downcast floats to float32 even when
+                                               values change.
+
+    Returns:
+        pd.DataFrame: The compacted DataFrame.
+        dict: Memory report with per-column details and totals before and after.
+    """
+    exclude_columns = set(exclude_columns or [])
+    before = df.memory_usage(deep=True, index=False)
+
+    compacted = {}
+    for col in df.columns:
+        series = df[col]
+        if col not in exclude_columns:
+            series = _compact_series(series, category_threshold, allow_precision_loss)
+        compacted[col] = series
+
+    compacted_df = pd.DataFrame(compacted, index=df.index)
+    after = compacted_df.memory_usage(deep=True, index=False)
+
+    details = pd.DataFrame(
+        {
+            "Column": df.columns,
+            "DataTypeBefore": df.dtypes.to_numpy(),
+            "DataTypeAfter": compacted_df.dtypes.to_numpy(),
+            "MemoryBefore": before.to_numpy(),
+            "MemoryAfter": after.to_numpy(),
+        }
+    )
+    details["Savings%"] = (
+        (1 - details["MemoryAfter"] / details["MemoryBefore"].replace(0, np.nan)) * 100
+    ).round(2)
+
+    report = {
+        MEMORY_REPORT["DETAILS"]: details,
+        MEMORY_REPORT["TOTAL_BEFORE"]: int(before.sum()),
+        MEMORY_REPORT["TOTAL_AFTER"]: int(after.sum()),
+    }
+
+    return compacted_df, report
+
+
+def _compact_series(series, category_threshold, allow_precision_loss):
+    """Returns `series` converted to the smallest suitable dtype."""
+    if pd.api.types.is_bool_dtype(series) or isinstance(
+        series.dtype, pd.CategoricalDtype
+    ):
+        return series
+
+    if pd.api.types.is_integer_dtype(series):
+        return pd.to_numeric(series, downcast="integer")
+
+    if pd.api.types.is_float_dtype(series):
+        downcast = series.astype("float32")
+        lossless = np.array_equal(
+            downcast.to_numpy(dtype="float64"), series.to_numpy(), equal_nan=True
+        )
+        return downcast if lossless or allow_precision_loss else series
+
+    if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+        if (
+            len(series)
+            and series.nunique(dropna=True) / len(series) <= category_threshold
+        ):
+            return series.astype("category")
+
+    return series
@@ -1,37 +1,478 @@
+import functools
+import glob
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Union
+
+import numpy as np
 import pandas as pd
-from utils.helpers import get_file_extension_from_path
+
+from utils.config import CACHE_DIR
+from utils.helpers import get_file_extension_from_path, get_file_fingerprint
+from utils.instrumentation import instrumented
+
+# Mapping extensions to Pandas read functions
+READ_FUNCTIONS = {
+    "csv": pd.read_csv,
+    "xlsx": pd.read_excel,
+    "json": pd.read_json,
+    "parquet": pd.read_parquet,
+}
+
+# Rows per chunk used while converting a source file into the Parquet cache
+CACHE_CHUNKSIZE = 500_000
+
+# Comparison operators of `filters`, as accepted by the Parquet reader
+FILTER_OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# Operators of `filters` testing for missing values; the filter value is ignored
+NULL_FILTER_OPERATORS = ["is null", "is not null"]
 
 
-def create_dataframe(data_url: str, **kwargs) -> pd.DataFrame:
+@instrumented()
+def create_dataframe(
+    data_url: Union[str, os.PathLike, List[str]],
+    chunksize: int = None,
+    use_cache: bool = False,
+    cache_dir: str = CACHE_DIR,
+    columns: list = None,
+    filters: list = None,
+    workers: int = None,
+    **kwargs,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Reads data from a file path or URL and returns a DataFrame.
 
+    A directory is read as a (hive-partitioned) Parquet dataset, such as the month
+    partitions written by `write_transaction_store`.
+
+    A glob pattern or a list of paths (in any mix of formats) is read file by file
+    and concatenated like `pd.concat` of the individual reads: every file is cast to
+    the dtypes of the first one where that is lossless, and a column is widened
+    otherwise (e.g. int64 to float64 when a later file holds floats). The files
+    are read concurrently: Parquet files (and CSV with engine='pyarrow') in a thread
+    pool, since pyarrow releases the GIL, and the pure-pandas CSV, Excel and JSON
+    parsers in a process pool.
+
     Args:
-        data_url (str): Path to the data file (local or remote).
+        data_url (str | os.PathLike | list): Path to the data file (local or remote), a
+                                            glob pattern such as 'exports/*.csv', or a
+                                            list or tuple of paths.
+        chunksize (int, optional): If given, return an iterator of DataFrames with at most
+                                   this many rows each instead of a single DataFrame.
+                                   Every chunk is cast to the dtypes of the first one where
+                                   that is lossless; otherwise the column is widened
+                                   (e.g. int64 to float64) from that chunk on.
+        use_cache (bool, optional): Convert a local source file to Parquet once and read the
+                                    cached copy on later calls. The cache is keyed on the path,
+                                    size and modification time of the file and on **kwargs.
+        cache_dir (str, optional): Directory holding the Parquet cache.
+        columns (list, optional): Columns to return. Parquet files and directories only
+                                  read these columns; CSV and Excel files only parse them.
+        filters (list, optional): Row predicates in the Parquet reader's form, e.g.
+                                  [('Quantity', '>', 0), ('month', '>=', '2011-06')]:
+                                  a list of (column, op, value) tuples that must all hold,
+                                  or a list of such lists of which one must hold. Supported
+                                  ops are =, ==, !=, <, <=, >, >=, in and not in, which never
+                                  match missing values, and 'is null' and 'is not null'
+                                  (e.g. ('CustomerID', 'is not null', None)). For Parquet
+                                  the predicates are pushed down, so partitions and row groups that cannot
+                                  match are skipped; other formats are filtered after parsing.
+        workers (int, optional): Concurrent readers for several files; defaults to the
+                                 CPU count, 0 or 1 reads them one after another. With
+                                 `chunksize`, files are always streamed one at a time.
         **kwargs: Additional arguments for Pandas read functions (e.g., encoding, separator).
 
     Returns:
-        pd.DataFrame: Loaded DataFrame.
+        pd.DataFrame | Iterator[pd.DataFrame]: Loaded DataFrame, or an iterator of chunks
+                                               when `chunksize` is given.
 
     Raises:
         ValueError: If the file format is unsupported.
         RuntimeError: If data loading fails.
     """
-    # Mapping extensions to Pandas read functions
-    read_functions = {
-        "csv": pd.read_csv,
-        "xlsx": pd.read_excel,
-        "json": pd.read_json,
-        "parquet": pd.read_parquet,
-    }
+    if isinstance(data_url, os.PathLike):
+        data_url = os.fspath(data_url)
+    if isinstance(data_url, (list, tuple)) or glob.has_magic(data_url):
+        paths = _expand_paths(data_url)
+        read_kwargs = dict(
+            use_cache=use_cache,
+            cache_dir=cache_dir,
+            columns=columns,
+            filters=filters,
+            **kwargs,
+        )
+        if chunksize is not None:
+            return _typed_chunks(
+                chunk
+                for path in paths
+                for chunk in _read_file(path, chunksize=chunksize, **read_kwargs)
+            )
+        return _read_files(paths, workers, read_kwargs)
 
-    file_ext = get_file_extension_from_path(data_url)
+    if os.path.isdir(data_url):
+        file_ext = "parquet"
+    else:
+        file_ext = get_file_extension_from_path(data_url)
 
-    if file_ext not in read_functions:
+    if file_ext not in READ_FUNCTIONS:
         raise ValueError(f"Unsupported file format: {file_ext}")
 
+    if chunksize is not None and chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer.")
+
     try:
-        df = read_functions[file_ext](data_url, **kwargs)
-        return df
+        if use_cache and file_ext != "parquet" and os.path.isfile(data_url):
+            data_url = _get_parquet_cache(data_url, file_ext, cache_dir, **kwargs)
+            file_ext, kwargs = "parquet", {}
+
+        if file_ext == "parquet":
+            # The Parquet reader prunes columns, partitions and row groups itself;
+            # `filters` is passed on as the equivalent dataset expression
+            kwargs.update(columns=columns, filters=filters_to_expression(filters))
+            select = None
+        else:
+            kwargs.update(_parse_columns(file_ext, columns, filters))
+            select = functools.partial(_select, columns=columns, filters=filters)
+
+        if chunksize is not None:
+            chunks = _read_chunks(data_url, file_ext, chunksize, **kwargs)
+            if select is not None:
+                chunks = map(select, chunks)
+            return _typed_chunks(chunks)
+
+        df = READ_FUNCTIONS[file_ext](data_url, **kwargs)
+        return df if select is None else select(df)
     except Exception as e:
         raise RuntimeError(f"Error loading data from {data_url}: {e}")
+
+
+def _expand_paths(data_url):
+    """Resolves a glob pattern or a list of paths (which may contain patterns) to files."""
+    patterns = [data_url] if isinstance(data_url, str) else map(os.fspath, data_url)
+    paths = []
+    for pattern in patterns:
+        paths.extend(
+            sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        )
+
+    if not paths:
+        raise ValueError(f"No files match {data_url}.")
+    return paths
+
+
+def _read_file(path, **kwargs):
+    """Reads one file of a multi-file read; not instrumented, as it runs in worker threads."""
+    return create_dataframe.__wrapped__(path, **kwargs)
+
+
+def _read_files(paths, workers, kwargs):
+    """Reads several files concurrently and concatenates them in the given order."""
+    workers = os.cpu_count() if workers is None else workers
+    if workers <= 1 or len(paths) == 1:
+        frames = [_read_file(path, **kwargs) for path in paths]
+    else:
+        executors = {}
+        try:
+            futures = []
+            for path in paths:
+                pool = (
+                    ThreadPoolExecutor
+                    if _is_arrow_backed(path, kwargs)
+                    else ProcessPoolExecutor
+                )
+                if pool not in executors:
+                    executors[pool] = pool(max_workers=min(workers, len(paths)))
+                futures.append(executors[pool].submit(_read_file, path, **kwargs))
+            frames = [future.result() for future in futures]
+        finally:
+            for executor in executors.values():
+                executor.shutdown()
+
+    # One concatenation into the final frame; no intermediate partial results
+    return pd.concat(_typed_chunks(frames), ignore_index=True)
+
+
+def _is_arrow_backed(path, kwargs):
+    """Whether a file is parsed by pyarrow, which releases the GIL and suits threads."""
+    if kwargs.get("use_cache") or os.path.isdir(path):
+        return True
+    file_ext = get_file_extension_from_path(path)
+    return file_ext == "parquet" or (
+        file_ext == "csv" and kwargs.get("engine") == "pyarrow"
+    )
+
+
+def _read_chunks(data_url, file_ext, chunksize, **kwargs):
+    """Returns an iterator of raw chunks using the native streaming reader where one exists."""
+    if file_ext == "csv":
+        return pd.read_csv(data_url, chunksize=chunksize, **kwargs)
+
+    if file_ext == "json" and kwargs.get("lines"):
+        return pd.read_json(data_url, chunksize=chunksize, **kwargs)
+
+    if file_ext == "parquet":
+        return _read_parquet_batches(
+            data_url, chunksize, kwargs.get("columns"), kwargs.get("filters")
+        )
+
+    # Excel and non line-delimited JSON have no incremental parser; slice a full read
+    df = READ_FUNCTIONS[file_ext](data_url, **kwargs)
+    return (
+        df.iloc[start : start + chunksize] for start in range(0, len(df), chunksize)
+    )
+
+
+def _read_parquet_batches(data_url, chunksize, columns=None, expression=None):
+    """
+    Yields DataFrames from a Parquet file or dataset one record batch at a time,
+    keeping the rows matching `expression` (see `filters_to_expression`).
+    """
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(data_url, format="parquet", partitioning="hive")
+    for batch in dataset.to_batches(
+        columns=columns, filter=expression, batch_size=chunksize
+    ):
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+def filters_to_expression(filters):
+    """
+    Converts `filters` (see `create_dataframe`) to a pyarrow dataset expression.
+
+    Args:
+        filters (list, optional): (column, op, value) tuples, or a list of such lists.
+
+    Returns:
+        pyarrow.dataset.Expression | None: The expression, or None without filters.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    expression = None
+    for group in _filter_groups(filters):
+        group_expression = None
+        for column, op, value in group:
+            if op == "is null":
+                term = pc.field(column).is_null()
+            elif op == "is not null":
+                term = pc.field(column).is_valid()
+            else:
+                term = pq.filters_to_expression([(column, op, value)])
+            group_expression = (
+                term if group_expression is None else group_expression & term
+            )
+        expression = (
+            group_expression if expression is None else expression | group_expression
+        )
+    return expression
+
+
+def _parse_columns(file_ext, columns, filters):
+    """Reader arguments limiting CSV and Excel parsing to the requested and filtered columns."""
+    if columns is None or file_ext not in ["csv", "xlsx"]:
+        return {}
+    return {"usecols": list(dict.fromkeys([*columns, *_filter_columns(filters)]))}
+
+
+def _filter_groups(filters):
+    """Normalizes `filters` to a list of AND groups of (column, op, value) tuples."""
+    if not filters:
+        return []
+    return (
+        [list(group) for group in filters]
+        if isinstance(filters[0], list)
+        else [filters]
+    )
+
+
+def _filter_columns(filters):
+    """Columns referenced by `filters`."""
+    return [column for group in _filter_groups(filters) for column, _, _ in group]
+
+
+def _select(df, columns=None, filters=None):
+    """Applies `filters` and `columns` to an already parsed DataFrame."""
+    groups = _filter_groups(filters)
+    if groups:
+        mask = np.zeros(len(df), dtype=bool)
+        for group in groups:
+            group_mask = np.ones(len(df), dtype=bool)
+            for column, op, value in group:
+                group_mask &= _predicate(df[column], op, value)
+            mask |= group_mask
+        df = df[mask]
+
+    return df if columns is None else df[list(columns)]
+
+
+def _predicate(values, op, value):
+    """Boolean mask of one (column, op, value) filter, matching the Parquet reader's semantics."""
+    if op == "in":
+        return values.isin(value).to_numpy()
+    if op == "not in":
+        return ~values.isin(value).to_numpy()
+    if op in NULL_FILTER_OPERATORS:
+        missing = values.isna().to_numpy()
+        return missing if op == "is null" else ~missing
+    if op not in FILTER_OPERATORS:
+        raise ValueError(f"Unsupported filter operator: {op}")
+    # Comparisons with a missing value are null in Arrow, so those rows never match
+    return (FILTER_OPERATORS[op](values, value) & values.notna()).to_numpy()
+
+
+def _typed_chunks(chunks):
+    """
+    Casts every chunk to the dtypes first seen for each column so all chunks share one
+    schema, as long as the cast loses nothing. A chunk whose values do not fit (e.g.
+    floats after an int64 chunk) widens the column to a common dtype for itself and all
+    later chunks instead; chunks already yielded keep the narrower dtype.
+    """
+    schema = {}
+    for chunk in chunks:
+        for col, dtype in chunk.dtypes.items():
+            if col not in schema:
+                # An all-null column says nothing about its type; wait for a chunk with values
+                if chunk[col].notna().any():
+                    schema[col] = dtype
+                continue
+
+            if dtype == schema[col]:
+                continue
+            values = _lossless_cast(chunk[col], schema[col])
+            if values is None:
+                schema[col] = _common_dtype(schema[col], dtype)
+                values = chunk[col].astype(schema[col])
+            chunk[col] = values
+        yield chunk
+
+
+def _lossless_cast(values, dtype):
+    """Returns `values` cast to `dtype`, or None if the cast fails or changes any value."""
+    try:
+        cast = values.astype(dtype)
+        restored = cast.astype(values.dtype)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return cast if restored.equals(values) else None
+
+
+def _common_dtype(first, second):
+    """Dtype holding the values of both: the NumPy promotion of numeric dtypes, else object."""
+    if all(
+        isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+        for dtype in [first, second]
+    ):
+        return np.result_type(first, second)
+    return np.dtype(object)
+
+
+def _get_parquet_cache(data_url, file_ext, cache_dir, **kwargs):
+    """Returns the path of the Parquet copy of `data_url`, building it on a cache miss."""
+    fingerprint = get_file_fingerprint(data_url, **kwargs)
+    cache_path = os.path.join(cache_dir, f"{Path(data_url).stem}-{fingerprint}.parquet")
+
+    if not os.path.exists(cache_path):
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_parquet_cache(data_url, file_ext, cache_path, **kwargs)
+
+    return cache_path
+
+
+def _write_parquet_cache(data_url, file_ext, cache_path, **kwargs):
+    """Converts the source file to Parquet chunk by chunk so the full file never sits in memory."""
+    tmp_path = f"{cache_path}.tmp"
+    read_kwargs = dict(kwargs)
+    # A column widened by a later chunk (e.g. int64 to float64) does not fit the schema
+    # already written; convert again, reading it with the wider dtype from the start
+    while widened := _write_parquet_file(data_url, file_ext, tmp_path, **read_kwargs):
+        dtype = read_kwargs.get("dtype")
+        read_kwargs["dtype"] = {**(dtype if isinstance(dtype, dict) else {}), **widened}
+
+    # Publish atomically so an interrupted conversion never leaves a partial cache file
+    os.replace(tmp_path, cache_path)
+
+
+def _write_parquet_file(data_url, file_ext, path, **kwargs):
+    """
+    Writes the source file to one Parquet file with the schema of its first chunk.
+
+    Returns:
+        dict: Columns a later chunk widened, with their wider dtypes; the file is then
+              incomplete. Empty once every chunk was written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    string_columns = []
+
+    try:
+        chunks = _typed_chunks(
+            _read_chunks(data_url, file_ext, CACHE_CHUNKSIZE, **kwargs)
+        )
+        for chunk in chunks:
+            if writer is None:
+                # Text columns are stored as strings so mixed or all-null first chunks keep one schema
+                string_columns = chunk.select_dtypes(
+                    include=["object", "string"]
+                ).columns
+                first_dtypes = chunk.dtypes
+                chunk = stringify_columns(chunk, string_columns)
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                schema = pa.schema(
+                    (
+                        field.with_type(pa.string())
+                        if field.name in string_columns
+                        else field
+                    )
+                    for field in schema
+                )
+                writer = pq.ParquetWriter(path, schema)
+            else:
+                widened = {}
+                for col, dtype in chunk.dtypes.items():
+                    if col in string_columns or dtype == first_dtypes[col]:
+                        continue
+                    common = _common_dtype(first_dtypes[col], dtype)
+                    if common == first_dtypes[col]:
+                        chunk[col] = chunk[col].astype(common)
+                    else:
+                        widened[col] = common
+                if widened:
+                    return widened
+                chunk = stringify_columns(chunk, string_columns)
+
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        raise ValueError(f"No rows found in {data_url}; nothing to cache.")
+    return {}
+
+
+def stringify_columns(chunk, columns):
+    """Converts non-null values in the given columns to str, leaving missing values untouched."""
+    if len(columns) == 0:
+        return chunk
+    chunk = chunk.copy()
+    for col in columns:
+        values = chunk[col]
+        chunk[col] = values.astype(object).where(values.isna(), values.astype(str))
+    return chunk
@@ -1,30 +1,53 @@
-from utils.constants import MISSING_VALUES, DATASET_KEYS, SUMMARIES, SKEWNESS
-
-
-def analyze_dataset(df, exclude_columns=None, include_stats=True):
+from utils.constants import DATASET_KEYS, SUMMARIES, SKEWNESS
+from utils.cache import cached_result
+from utils.instrumentation import instrumented
+
+from .accumulators import accumulate_dataset
+
+
+@instrumented()
+@cached_result()
+def analyze_dataset(
+    df,
+    exclude_columns=None,
+    include_stats=True,
+    quantile_backend="exact",
+    quantile_error=None,
+):
     """
     Performs exploratory analysis on the dataset.
 
+    All statistics are gathered in a single pass by a mergeable accumulator, so the
+    dataset can also be passed as an iterator of chunks (e.g. from
+    `create_dataframe(..., chunksize=...)`) that never fits in memory at once.
+
     Args:
-        df (pd.DataFrame): The DataFrame to analyze.
+        df (pd.DataFrame | Iterable[pd.DataFrame]): The DataFrame, or chunks of it, to analyze.
         exclude_columns (list, optional): List of columns to exclude from numerical analysis.
         include_stats (bool, optional): Whether to compute summary statistics.
+        quantile_backend (str, optional): 'exact' keeps every value for the quartiles;
+                                          'kll' uses a fixed-size mergeable sketch.
+        quantile_error (float, optional): Target rank error of the sketch backend.
 
     Returns:
         dict: A dictionary containing dataset insights.
     """
+    accumulator = accumulate_dataset(
+        df, exclude_columns, quantile_backend, quantile_error
+    )
+
     results = {
-        DATASET_KEYS["MISSING_VALUES"]: summarize_missing_values(df),
-        DATASET_KEYS["DUPLICATE_ROWS"]: df.duplicated().sum(),
-        DATASET_KEYS["DATA_TYPES"]: df.dtypes.reset_index(),
+        DATASET_KEYS["MISSING_VALUES"]: accumulator.missing_summary(),
+        DATASET_KEYS["DUPLICATE_ROWS"]: accumulator.duplicate_count(),
+        DATASET_KEYS["DATA_TYPES"]: accumulator.data_types(),
     }
 
     # General dataset info
-    results[DATASET_KEYS["ROWS"]], results[DATASET_KEYS["COLUMNS"]] = df.shape
-    results[DATASET_KEYS["DATA_TYPES"]].columns = ["Column", "DataType"]
+    results[DATASET_KEYS["ROWS"]] = accumulator.rows
+    results[DATASET_KEYS["COLUMNS"]] = len(accumulator.dtypes)
 
     if include_stats:
-        stats = compute_summary_statistics(df, exclude_columns)
+        stats = accumulator.summary_statistics()
 
         results[SUMMARIES["STATISTICS"]] = stats
         results[SUMMARIES["OBSERVATIONS"]] = analyze_skewness(stats)
@@ -33,26 +56,17 @@ def analyze_dataset(df, exclude_columns=None, include_stats=True):
 
 
 def summarize_missing_values(df):
-    """Summarizes missing values in the dataset."""
-    missing_count = df.isnull().sum()
-    missing_data = missing_count[missing_count > 0]
-
-    return {
-        MISSING_VALUES["TOTAL"]: missing_data.sum(),
-        MISSING_VALUES["PERCENTAGE"]: (missing_data.sum() / df.size) * 100,
-        MISSING_VALUES["DETAILS"]: missing_data.to_dict(),
-    }
-
-
-def compute_summary_statistics(df, exclude_columns):
-    """Computes descriptive statistics for numerical columns."""
-    numeric_df = df.select_dtypes(include=["number"])
-    if exclude_columns:
-        numeric_df = numeric_df.drop(columns=exclude_columns, errors="ignore")
+    """Summarizes missing values in the dataset (or an iterator of chunks)."""
+    return accumulate_dataset(df).missing_summary()
 
-    stats = numeric_df.describe().T
 
-    return stats.round(2)
+def compute_summary_statistics(
+    df, exclude_columns, quantile_backend="exact", quantile_error=None
+):
+    """Computes describe()-style statistics for numerical columns (see `accumulate_dataset`)."""
+    return accumulate_dataset(
+        df, exclude_columns, quantile_backend, quantile_error
+    ).summary_statistics()
 
 
 def analyze_skewness(stats):
@@ -0,0 +1,206 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from utils.helpers import sorted_isin
+from utils.instrumentation import instrumented
+
+# Default false-positive rate of the Bloom prefilter
+DEFAULT_BLOOM_ERROR = 0.01
+
+
+def row_fingerprints(df, columns=None):
+    """
+    Returns a 64-bit fingerprint per row, computed from the values of `columns`.
+
+    Fingerprints depend on the column dtypes, so every chunk of a stream must share
+    one schema (as the chunks of `create_dataframe` do). Two different rows collide
+    with probability about 2**-64 per pair.
+
+    Args:
+        df (pd.DataFrame): The rows to fingerprint.
+        columns (list, optional): Columns that define a duplicate; all columns if None.
+
+    Returns:
+        np.ndarray: uint64 fingerprints, one per row.
+    """
+    data = df if columns is None else df[columns]
+    return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+
+class BloomFilter:
+    """
+    Bit-array Bloom filter over uint64 keys.
+
+    Answers "possibly seen" or "definitely not seen"; used to skip the exact seen-set
+    lookup for keys that are certainly new.
+    """
+
+    def __init__(self, capacity, error_rate=DEFAULT_BLOOM_ERROR):
+        self.n_bits = max(
+            int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)), 8
+        )
+        self.n_hashes = max(int(round(self.n_bits / capacity * math.log(2))), 1)
+        self.bits = np.zeros((self.n_bits + 7) // 8, dtype="uint8")
+
+    def add(self, keys):
+        """Sets the bits of every key."""
+        positions = self._positions(keys).ravel()
+        np.bitwise_or.at(
+            self.bits, positions >> 3, (1 << (positions & 7)).astype("uint8")
+        )
+
+    def might_contain(self, keys):
+        """Returns a bool mask: False where a key has certainly not been added."""
+        positions = self._positions(keys)
+        bits = (self.bits[positions >> 3] >> (positions & 7)) & 1
+        return bits.all(axis=0)
+
+    def _positions(self, keys):
+        """Bit positions of the keys, shape (n_hashes, len(keys)), by double hashing."""
+        keys = np.asarray(keys, dtype="uint64")
+        low = keys & np.uint64(0xFFFFFFFF)
+        high = (keys >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.n_hashes, dtype="uint64")[:, None]
+        return ((low + steps * high) % np.uint64(self.n_bits)).astype("int64")
+
+
+class DuplicateDetector:
+    """
+    Streaming duplicate detector over 64-bit row fingerprints.
+
+    The fingerprints of the distinct rows seen so far are kept in a few sorted runs
+    (8 bytes per distinct row), merged in size-doubling steps so a lookup touches at
+    most about log2(rows / chunk) runs. An optional Bloom filter skips the lookup for
+    rows that are certainly new. Feed chunks in order with `update`; the first
+    occurrence of a row is kept, like `DataFrame.duplicated(keep="first")`.
+    """
+
+    def __init__(
+        self, columns=None, bloom_capacity=None, bloom_error=DEFAULT_BLOOM_ERROR
+    ):
+        self.columns = columns
+        self.rows = 0
+        self.duplicates = 0
+        self.runs = []
+        self.bloom = (
+            BloomFilter(bloom_capacity, bloom_error) if bloom_capacity else None
+        )
+
+    @property
+    def unique_count(self):
+        """Number of distinct rows seen so far."""
+        return sum(len(run) for run in self.runs)
+
+    @property
+    def nbytes(self):
+        """Memory held by the seen-set and the Bloom filter."""
+        bloom_bytes = self.bloom.bits.nbytes if self.bloom is not None else 0
+        return sum(run.nbytes for run in self.runs) + bloom_bytes
+
+    def update(self, chunk):
+        """
+        Processes the next chunk of rows.
+
+        Args:
+            chunk (pd.DataFrame): The next rows of the stream.
+
+        Returns:
+            np.ndarray: Keep-mask of the chunk; False for rows seen earlier in this
+                        chunk or in a previous one.
+        """
+        keys = row_fingerprints(chunk, self.columns)
+        unique_keys, first_rows = np.unique(keys, return_index=True)
+
+        seen = self._contains(unique_keys)
+        keep = np.zeros(len(keys), dtype=bool)
+        keep[first_rows[~seen]] = True
+
+        self._add(unique_keys[~seen])
+        self.rows += len(keys)
+        self.duplicates += len(keys) - int(keep.sum())
+        return keep
+
+    def merge(self, other):
+        """Combines a detector built on a different part of the data into this one."""
+        other_keys = np.sort(np.concatenate(other.runs)) if other.runs else None
+        overlap = 0
+        if other_keys is not None:
+            seen = self._contains(other_keys)
+            overlap = int(seen.sum())
+            self._add(other_keys[~seen])
+
+        self.rows += other.rows
+        self.duplicates += other.duplicates + overlap
+        return self
+
+    def _contains(self, sorted_keys):
+        """Exact membership of sorted unique keys in the seen-set."""
+        seen = np.zeros(len(sorted_keys), dtype=bool)
+        candidates = np.arange(len(sorted_keys))
+        if self.bloom is not None:
+            candidates = candidates[self.bloom.might_contain(sorted_keys)]
+
+        for run in self.runs:
+            if len(candidates) == 0:
+                break
+            found = sorted_isin(sorted_keys[candidates], run)
+            seen[candidates[found]] = True
+            candidates = candidates[~found]
+        return seen
+
+    def _add(self, new_keys):
+        """Adds sorted keys that are not in the seen-set yet."""
+        if len(new_keys) == 0:
+            return
+        if self.bloom is not None:
+            self.bloom.add(new_keys)
+
+        self.runs.append(new_keys)
+        # Merge while the previous run is not larger than the newest one
+        while len(self.runs) > 1 and len(self.runs[-2]) <= len(self.runs[-1]):
+            newest = self.runs.pop()
+            self.runs[-1] = np.sort(np.concatenate([self.runs[-1], newest]))
+
+
+@instrumented()
+def count_duplicates(data, columns=None, bloom_capacity=None):
+    """
+    Counts the rows that repeat an earlier row, in a single streaming pass.
+
+    Args:
+        data (pd.DataFrame | iterable): A DataFrame or an iterable of DataFrame chunks
+                                        (e.g. `create_dataframe(..., chunksize=...)`).
+        columns (list, optional): Columns that define a duplicate; all columns if None.
+        bloom_capacity (int, optional): Expected number of distinct rows; enables the
+                                        Bloom prefilter.
+
+    Returns:
+        int: Number of duplicate rows, as `df.duplicated().sum()`.
+    """
+    detector = DuplicateDetector(columns, bloom_capacity)
+    for chunk in [data] if isinstance(data, pd.DataFrame) else data:
+        detector.update(chunk)
+    return detector.duplicates
+
+
+def drop_duplicates_streaming(chunks, columns=None, bloom_capacity=None):
+    """
+    Yields every chunk without the rows seen before, as `drop_duplicates()` over the stream.
+
+    Memory is bounded by one chunk and the seen-set, so files larger than RAM can be
+    deduplicated by writing the yielded chunks out as they arrive.
+
+    Args:
+        chunks (iterable): DataFrame chunks, e.g. `create_dataframe(..., chunksize=...)`.
+        columns (list, optional): Columns that define a duplicate; all columns if None.
+        bloom_capacity (int, optional): Expected number of distinct rows; enables the
+                                        Bloom prefilter.
+
+    Yields:
+        pd.DataFrame: The rows of each chunk that were not seen before.
+    """
+    detector = DuplicateDetector(columns, bloom_capacity)
+    for chunk in chunks:
+        yield chunk[detector.update(chunk)]
@@ -0,0 +1,192 @@
+"""
+Month-partitioned Parquet store of transactions.
+
+Run from the project root to convert the raw file:
+    python -m src.data_preprocessing.transaction_store data/data.csv data/transactions
+
+Read it back with `create_dataframe`, pushing columns and predicates down:
+    create_dataframe(
+        "data/transactions",
+        columns=["CustomerID", "InvoiceNo", "InvoiceDate", "Quantity", "UnitPrice"],
+        filters=CLEAN_TRANSACTION_FILTERS + month_filters("2011-06", "2011-11"),
+    )
+"""
+
+import argparse
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import TRANSACTIONS
+from .create_dataframe import (
+    create_dataframe,
+    filters_to_expression,
+    stringify_columns,
+)
+
+# Hive partition column holding the invoice month as 'YYYY-MM'
+MONTH_COLUMN = "month"
+
+# Rows read from the source and written per batch
+STORE_CHUNKSIZE = 500_000
+
+# The notebook's cleaning filters: transactions with a customer and positive quantities
+# and prices
+CLEAN_TRANSACTION_FILTERS = [
+    (TRANSACTIONS["CUSTOMER_ID"], "is not null", None),
+    (TRANSACTIONS["QUANTITY"], ">", 0),
+    (TRANSACTIONS["UNIT_PRICE"], ">", 0),
+]
+
+
+def write_transaction_store(
+    data_url, store_dir, date_format=None, chunksize=STORE_CHUNKSIZE, **kwargs
+):
+    """
+    Lays transactions out as Parquet files partitioned by invoice month
+    (`store_dir/month=2011-06/part-0.parquet`), streaming the source in chunks.
+
+    InvoiceDate is stored as a timestamp and text columns as strings, so readers get
+    typed columns and row-group statistics on the dates. Months present in the source
+    replace the same months in an existing store; other months are kept, so new data
+    can be added month by month.
+
+    Args:
+        data_url (str): Source transactions (any format `create_dataframe` reads).
+        store_dir (str): Root directory of the store.
+        date_format (str, optional): Format used to parse InvoiceDate if it is text.
+        chunksize (int): Rows read and written per batch.
+        **kwargs: Additional arguments for the source reader.
+
+    Returns:
+        list: The months written, sorted.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    chunks = create_dataframe(data_url, chunksize=chunksize, **kwargs)
+    first = next(chunks, None)
+    if first is None:
+        raise ValueError(f"No rows found in {data_url}; nothing to store.")
+
+    string_columns = first.select_dtypes(include=["object", "string"]).columns.drop(
+        TRANSACTIONS["INVOICE_DATE"], errors="ignore"
+    )
+    schema = pa.Schema.from_pandas(
+        _with_month(first, date_format, string_columns), preserve_index=False
+    )
+    schema = pa.schema(
+        field.with_type(pa.string()) if field.name in string_columns else field
+        for field in schema
+    )
+
+    months = set()
+
+    def batches():
+        for chunk in itertools.chain([first], chunks):
+            chunk = _with_month(chunk, date_format, string_columns)
+            months.update(chunk[MONTH_COLUMN].dropna().unique())
+            try:
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                # Arrow refuses lossy casts, e.g. floats into a column stored as int64
+                raise ValueError(
+                    f"A chunk of {data_url} does not fit the store schema taken from "
+                    f"the first chunk ({e}). Pass dtype= for the column so every "
+                    "chunk is read with one type."
+                ) from e
+            yield from table.to_batches()
+
+    ds.write_dataset(
+        batches(),
+        store_dir,
+        schema=schema,
+        format="parquet",
+        partitioning=ds.partitioning(
+            pa.schema([(MONTH_COLUMN, pa.string())]), flavor="hive"
+        ),
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="delete_matching",
+    )
+    return sorted(months)
+
+
+def month_filters(start=None, end=None):
+    """
+    Filters selecting the months from `start` to `end` (inclusive), for `create_dataframe`.
+
+    Args:
+        start (datetime-like | str, optional): First month, e.g. '2011-06' or a date in it.
+        end (datetime-like | str, optional): Last month.
+
+    Returns:
+        list: Predicates on the month partition column; only matching partitions are read.
+    """
+    filters = []
+    if start is not None:
+        filters.append((MONTH_COLUMN, ">=", pd.Timestamp(start).strftime("%Y-%m")))
+    if end is not None:
+        filters.append((MONTH_COLUMN, "<=", pd.Timestamp(end).strftime("%Y-%m")))
+    return filters
+
+
+def latest_invoice_date(store_dir, filters=None):
+    """
+    Returns the latest InvoiceDate in the store from the Parquet footers alone,
+    without reading any rows (e.g. to derive the RFM reference date).
+
+    Args:
+        store_dir (str): Root directory of the store.
+        filters (list, optional): Partition filters, e.g. `month_filters(end='2011-06')`.
+
+    Returns:
+        pd.Timestamp: Latest invoice date, or NaT if the store has no dates.
+    """
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(store_dir, format="parquet", partitioning="hive")
+    expression = filters_to_expression(filters)
+
+    maxima = []
+    for fragment in dataset.get_fragments(filter=expression):
+        metadata = fragment.metadata
+        column = metadata.schema.names.index(TRANSACTIONS["INVOICE_DATE"])
+        for i in range(metadata.num_row_groups):
+            statistics = metadata.row_group(i).column(column).statistics
+            if statistics is not None and statistics.has_min_max:
+                maxima.append(pd.Timestamp(statistics.max))
+    return max(maxima, default=pd.NaT)
+
+
+def _with_month(chunk, date_format, string_columns):
+    """Parses InvoiceDate, adds the month partition column and stringifies text columns."""
+    dates = chunk[TRANSACTIONS["INVOICE_DATE"]]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format=date_format)
+
+    chunk = stringify_columns(chunk, string_columns)
+    chunk[TRANSACTIONS["INVOICE_DATE"]] = dates
+    # Label each distinct month once; strftime on every row dominates the write otherwise
+    months, month_codes = np.unique(
+        dates.to_numpy().astype("datetime64[M]"), return_inverse=True
+    )
+    labels = np.where(np.isnat(months), None, months.astype(str)).astype(object)
+    chunk[MONTH_COLUMN] = labels[month_codes.ravel()]
+    return chunk
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Write transactions as month-partitioned Parquet."
+    )
+    parser.add_argument("data_url", help="Source transactions file.")
+    parser.add_argument("store_dir", help="Root directory of the store.")
+    parser.add_argument("--date-format", default=None)
+    parser.add_argument("--chunksize", type=int, default=STORE_CHUNKSIZE)
+    args = parser.parse_args()
+
+    months = write_transaction_store(
+        args.data_url, args.store_dir, args.date_format, args.chunksize
+    )
+    print(f"Wrote {len(months)} months to {args.store_dir}.")
@@ -1,7 +1,16 @@
+import pandas as pd
+
+from utils.cache import cached_result
+from utils.visualization import LazyFigure, resolve_plot_mode
+from utils.instrumentation import instrumented
+from .correlation_engine import compute_correlation, correlation_edges
 from .visualize_correlation import visualize_correlation_matrix
 
 
-def analyze_correlation_matrix(df, columns=None, threshold=None):
+@instrumented()
+def analyze_correlation_matrix(
+    df, columns=None, threshold=None, plot=None, method="pearson", sparse=False
+):
     """
     Analyze the correlation matrix of a DataFrame and optionally filter correlations by a threshold.
 
@@ -9,16 +18,47 @@ def analyze_correlation_matrix(df, columns=None, threshold=None):
         df (pd.DataFrame): The DataFrame to analyze.
         columns (list, optional): List of columns to include in the correlation analysis. If None, all numeric columns are used.
         threshold (float, optional): Correlation threshold to filter significant correlations. If None, no filtering is applied.
+        plot (bool | str, optional): True draws the heatmap, False returns only the matrices and 'lazy' adds
+                                     a `LazyFigure` under 'figure'. If None, plots unless HEADLESS is set.
+        method (str): 'pearson' or 'spearman'.
+        sparse (bool): With a threshold, return only the edge list of significant pairs
+                       instead of dense matrices (for thousands of columns, e.g. one-hot
+                       features). Nothing is plotted in this mode.
 
     Returns:
-        dict: A dictionary containing the full correlation matrix and the filtered correlation matrix.
+        dict: A dictionary containing the full correlation matrix and the filtered correlation matrix,
+              or, when sparse, 'correlation_edges' with one row per significant pair.
     """
+    result = _compute_correlation_matrix(df, columns, threshold, method, sparse)
+    if "correlation_matrix" not in result:
+        return result
+
+    plot = resolve_plot_mode(plot)
+    if plot == "lazy":
+        result["figure"] = LazyFigure(
+            visualize_correlation_matrix,
+            df,
+            correlation_matrix=result["correlation_matrix"],
+        )
+    elif plot:
+        visualize_correlation_matrix(
+            df, correlation_matrix=result["correlation_matrix"]
+        )
+
+    return result
+
+
+@cached_result()
+def _compute_correlation_matrix(
+    df, columns=None, threshold=None, method="pearson", sparse=False
+):
+    """Computes the full and filtered correlation matrices; the cached, plot-free part of `analyze_correlation_matrix`."""
 
     # Use only the specified columns or default to all numeric columns
     if columns is not None:
         # Check if the provided columns are numeric
         non_numeric_columns = [
-            col for col in columns if df[col].dtype not in ["int64", "float64"]
+            col for col in columns if not pd.api.types.is_numeric_dtype(df[col])
         ]
 
         if non_numeric_columns:
@@ -34,9 +74,14 @@ def analyze_correlation_matrix(df, columns=None, threshold=None):
     if not columns:
         raise ValueError("No numeric columns available for correlation analysis.")
 
-    # Compute the correlation matrix for the selected columns
     filtered_df = df[columns]
-    correlation_matrix = filtered_df.corr()
+
+    # Only the significant pairs, without building a dense matrix
+    if sparse and threshold is not None:
+        return {"correlation_edges": correlation_edges(filtered_df, threshold, method)}
+
+    # Compute the correlation matrix for the selected columns
+    correlation_matrix = compute_correlation(filtered_df, method)
 
     # Filter the correlation matrix based on the threshold
     if threshold is not None:
@@ -48,8 +93,6 @@ def analyze_correlation_matrix(df, columns=None, threshold=None):
             correlation_matrix  # No filtering applied if threshold is None
         )
 
-    visualize_correlation_matrix(df, correlation_matrix=correlation_matrix)
-
     # Return both the full and filtered correlation matrices
     return {
         "correlation_matrix": correlation_matrix,
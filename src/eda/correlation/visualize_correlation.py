@@ -1,6 +1,8 @@
 from utils.visualization import visualize_chart, plot_functions
+from utils.instrumentation import instrumented
 
 
+@instrumented()
 def visualize_correlation_matrix(df, columns=None, correlation_matrix=None):
     """
     Visualize the correlation matrix of numeric columns using a heatmap.
@@ -1,44 +1,143 @@
+import numpy as np
 import pandas as pd
 
+from utils.cache import cached_result
+from utils.quantiles import create_quantile_estimator
+from utils.instrumentation import instrumented
 
-def remove_outliers(df, col, lower, upper):
-    """Remove rows with outliers for the given column."""
-    return df[(df[col] >= lower) & (df[col] <= upper)]
 
+def outlier_mask(df, columns, lower, upper):
+    """
+    Return a 2-D boolean mask of values outside the bounds, one column per checked column.
+
+    The mask is filled column by column into one preallocated array, so the checked
+    columns are never combined into a temporary 2-D block.
+    """
+    columns = _as_list(columns)
+    lower, upper = np.broadcast_to(lower, len(columns)), np.broadcast_to(
+        upper, len(columns)
+    )
 
-def flag_outliers(df, col, lower, upper):
-    """Flag outliers for the given column by adding a new column."""
-    df[f"{col}_outlier"] = (df[col] < lower) | (df[col] > upper)
+    mask = np.empty((len(df), len(columns)), dtype=bool, order="F")
+    for i, col in enumerate(columns):
+        values = df[col].to_numpy()
+        np.less(values, lower[i], out=mask[:, i])
+        np.logical_or(mask[:, i], values > upper[i], out=mask[:, i])
+
+    return pd.DataFrame(mask, index=df.index, columns=columns, copy=False)
+
+
+def remove_outliers(df, columns, lower, upper, mask=None):
+    """Remove rows with outliers (or missing values) in any of the given columns."""
+    columns = _as_list(columns)
+    mask = outlier_mask(df, columns, lower, upper) if mask is None else mask
+    keep = ~mask.to_numpy().any(axis=1)
+    for col in columns:
+        keep &= df[col].notna().to_numpy()
+    return df[keep]
+
+
+def flag_outliers(df, columns, lower, upper, mask=None):
+    """Flag outliers for the given columns by adding one boolean `<col>_outlier` column each."""
+    columns = _as_list(columns)
+    mask = outlier_mask(df, columns, lower, upper) if mask is None else mask
+    for i, col in enumerate(columns):
+        df[f"{col}_outlier"] = mask.iloc[:, i]
     return df
 
 
-def transform_outliers(df, col, lower, upper):
-    """Clip outliers for the given column to the bounds."""
-    df[col] = df[col].clip(lower=lower, upper=upper)
+def transform_outliers(df, columns, lower, upper, mask=None):
+    """Clip outliers for the given columns to the bounds."""
+    columns = _as_list(columns)
+    lower, upper = np.broadcast_to(lower, len(columns)), np.broadcast_to(
+        upper, len(columns)
+    )
+
+    # Python float bounds keep float32 columns in float32
+    for i, col in enumerate(columns):
+        df[col] = df[col].clip(lower=float(lower[i]), upper=float(upper[i]))
     return df
 
 
-def handle_outliers_in_data(df, columns=None, method="remove", threshold=1.5):
+def compute_iqr_bounds(
+    data, columns, threshold=1.5, quantile_backend="exact", quantile_error=None
+):
+    """
+    Compute IQR outlier bounds for the given columns in one pass over the data.
+
+    Args:
+        data (pd.DataFrame | Iterable[pd.DataFrame]): The DataFrame, or chunks of it.
+        columns (list): Columns to compute bounds for.
+        threshold (float): The IQR multiplier for detecting outliers.
+        quantile_backend (str): 'exact' or a sketch backend such as 'kll' (see utils.quantiles).
+        quantile_error (float, optional): Target rank error of the sketch backend.
+
+    Returns:
+        dict: Column name mapped to a (lower_bound, upper_bound) tuple.
+    """
+    if isinstance(data, pd.DataFrame):
+        if quantile_backend == "exact":
+            # All quartiles in a single quantile call
+            quartiles = data[columns].quantile([0.25, 0.75])
+            return _bounds_from_quartiles(
+                quartiles.loc[0.25], quartiles.loc[0.75], threshold
+            )
+        data = [data]
+
+    estimators = {
+        col: create_quantile_estimator(quantile_backend, quantile_error)
+        for col in columns
+    }
+    for chunk in data:
+        for col, estimator in estimators.items():
+            estimator.update(chunk[col].to_numpy(dtype="float64", na_value=np.nan))
+
+    quartiles = {
+        col: estimator.quantile([0.25, 0.75]) for col, estimator in estimators.items()
+    }
+    Q1 = pd.Series({col: q[0] for col, q in quartiles.items()}, dtype="float64")
+    Q3 = pd.Series({col: q[1] for col, q in quartiles.items()}, dtype="float64")
+    return _bounds_from_quartiles(Q1, Q3, threshold)
+
+
+@instrumented()
+@cached_result(bypass_kwargs=("inplace",))
+def handle_outliers_in_data(
+    df,
+    columns=None,
+    method="remove",
+    threshold=1.5,
+    bounds=None,
+    quantile_backend="exact",
+    quantile_error=None,
+    inplace=False,
+):
     """
     Detect and handle outliers in the DataFrame using the IQR method without using if-else.
 
+    All columns are handled together: the bounds come from one quantile call, outliers
+    are marked in a single 2-D mask and the frame is filtered, flagged or clipped once.
+
     Args:
         df (pd.DataFrame): The DataFrame to check for outliers.
         columns (list, optional): List of columns to check for outliers. If None, all numeric columns are used.
         method (str): Method to handle outliers - 'remove', 'flag', or 'transform'.
         threshold (float): The IQR multiplier for detecting outliers.
+        bounds (dict, optional): Precomputed (lower, upper) bounds per column, e.g. from
+                                 `compute_iqr_bounds` over all chunks of a larger dataset.
+                                 Columns missing from it are computed from `df`.
+        quantile_backend (str): Quantile backend used to compute missing bounds ('exact' or 'kll').
+        quantile_error (float, optional): Target rank error of the sketch backend.
+        inplace (bool): Flag or clip outliers in `df` itself instead of a copy.
 
     Returns:
         pd.DataFrame: DataFrame with outliers handled (removed, flagged, or transformed).
-        pd.DataFrame: DataFrame containing only the outliers.
+        pd.Series: Boolean mask aligned with `df.index`, True for rows with an outlier in
+                   any checked column. Use `df[mask]` to materialize the outlier rows.
     """
     # Select numeric columns if no specific columns are provided
     columns = columns or df.select_dtypes(include=["number"]).columns.tolist()
 
-    # DataFrames for results
-    df_result = df.copy()
-    outliers_list = []
-
     # Map methods to functions
     method_actions = {
         "remove": remove_outliers,
@@ -52,35 +151,44 @@ def handle_outliers_in_data(df, columns=None, method="remove", threshold=1.5):
             f"Invalid method '{method}'. Choose from 'remove', 'flag', or 'transform'."
         )
 
-    # Loop through each column and handle outliers
-    for col in columns:
-        if col not in df.columns:
-            print(f"Warning: Column '{col}' not found in the DataFrame. Skipping...")
-            continue
+    missing_columns = [col for col in columns if col not in df.columns]
+    for col in missing_columns:
+        print(f"Warning: Column '{col}' not found in the DataFrame. Skipping...")
+    columns = [col for col in columns if col in df.columns]
 
-        # Calculate IQR bounds
-        Q1, Q3 = df[col].quantile([0.25, 0.75])
-        IQR = Q3 - Q1
-        lower_bound = Q1 - threshold * IQR
-        upper_bound = Q3 + threshold * IQR
+    if not columns:
+        return df.copy(), pd.Series(False, index=df.index)
 
-        # Identify outliers
-        outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
+    # Calculate IQR bounds for every column not covered by the precomputed ones
+    bounds = dict(bounds or {})
+    pending = [col for col in columns if col not in bounds]
+    if pending:
+        bounds.update(
+            compute_iqr_bounds(df, pending, threshold, quantile_backend, quantile_error)
+        )
+    lower = np.array([bounds[col][0] for col in columns], dtype="float64")
+    upper = np.array([bounds[col][1] for col in columns], dtype="float64")
 
-        if not outliers.empty:
-            outliers_list.append(outliers)
+    # Identify outliers for all columns at once
+    mask = outlier_mask(df, columns, lower, upper)
+    for col, count in mask.sum().items():
+        print(f"Outliers detected for '{col}': {count}")
 
-        print(f"Outliers detected for '{col}': {len(outliers)}")
+    # Removal filters without mutating; flag/transform write into a single copy
+    df_result = df if method == "remove" or inplace else df.copy()
+    df_result = method_actions[method](df_result, columns, lower, upper, mask=mask)
 
-        # Call the appropriate method
-        df_result = method_actions[method](df_result, col, lower_bound, upper_bound)
+    return df_result, mask.any(axis=1)
+
+
+def _bounds_from_quartiles(Q1, Q3, threshold):
+    """Turn per-column quartile Series into a {column: (lower, upper)} dict."""
+    IQR = Q3 - Q1
+    lower = Q1 - threshold * IQR
+    upper = Q3 + threshold * IQR
+    return {col: (lower[col], upper[col]) for col in Q1.index}
 
-    # Concatenate all outliers into a single DataFrame
-    # df_outliers = pd.concat(outliers_list).drop_duplicates()
-    df_outliers = (
-        pd.concat(outliers_list, ignore_index=True).drop_duplicates()
-        if outliers_list
-        else pd.DataFrame()
-    )
 
-    return df_result, df_outliers
+def _as_list(columns):
+    """Wrap a single column label in a list."""
+    return list(columns) if pd.api.types.is_list_like(columns) else [columns]
@@ -1,9 +1,12 @@
 import numpy as np
 
+from utils.memory import format_bytes, track_peak_memory
+from utils.instrumentation import instrumented
 from .outlier_handling import handle_outliers_in_data
 
 
-def apply_transformation(df, column, transformation_type):
+@instrumented()
+def apply_transformation(df, column, transformation_type, out=None):
     """
     Apply the specified transformation to a column in the DataFrame.
 
@@ -12,9 +15,11 @@ def apply_transformation(df, column, transformation_type):
         column (str): The name of the column to transform.
         transformation_type (str): The type of transformation to apply.
                                    Supported: 'log', 'sqrt', 'square', 'reciprocal'.
+        out (np.ndarray, optional): Preallocated buffer of len(df) to write the result into.
+                                    Its dtype (e.g. float32) sets the output precision.
 
     Returns:
-        pd.Series: Transformed column as a pandas Series.
+        pd.Series | np.ndarray: Transformed column as a pandas Series, or `out` when given.
     """
     if column not in df.columns:
         raise ValueError(f"Column '{column}' does not exist in the DataFrame.")
@@ -27,16 +32,36 @@ def apply_transformation(df, column, transformation_type):
         "reciprocal": lambda x: 1 / x.replace(0, np.nan),
     }
 
+    # Same transformations writing straight into a preallocated buffer
+    buffer_transformations = {
+        "log": lambda x, out: np.log1p(x, out=out),
+        "sqrt": lambda x, out: np.sqrt(np.clip(x, 0, None, out=out), out=out),
+        "square": lambda x, out: np.square(x, out=out),
+        "reciprocal": _reciprocal_into,
+    }
+
     # Get the transformation function
     transform_func = transformations.get(transformation_type)
     if not transform_func:
         raise ValueError(f"Unsupported transformation type: '{transformation_type}'.")
 
+    if out is not None:
+        return buffer_transformations[transformation_type](df[column].to_numpy(), out)
+
     # Apply the transformation
     return transform_func(df[column])
 
 
-def best_transformation_with_outliers(df, skew_categories, handle_outliers=False, method="remove"):
+@instrumented()
+def best_transformation_with_outliers(
+    df,
+    skew_categories,
+    handle_outliers=False,
+    method="remove",
+    inplace=False,
+    dtype=None,
+    memory_budget=None,
+):
     """
     Apply the best transformation based on skewness for each column already categorized into high, moderate, or low skew.
     Optionally, handle outliers by removing or transforming them.
@@ -45,13 +70,49 @@ def best_transformation_with_outliers(df, skew_categories, handle_outliers=False
         df (pd.DataFrame): The DataFrame containing numeric columns.
         skew_categories (dict): Dictionary with keys 'high', 'moderate', 'low' mapping to lists of column names.
         handle_outliers (bool): Whether to handle outliers by removal after transformation.
-        skew_threshold (float): The threshold for determining the degree of skewness for transformation.
-        outlier_threshold (float): The threshold for detecting outliers based on IQR method.
+        method (str): Outlier handling method - 'remove', 'flag', or 'transform'.
+        inplace (bool): Transform `df` itself instead of a copy. Each column is written
+                        through one preallocated buffer and no full-frame copy is made.
+        dtype (str, optional): Dtype of the transformed columns, e.g. 'float32' to halve
+                               their memory. Defaults to float64.
+        memory_budget (int, optional): Budget in bytes. When given, the peak memory
+                                       allocated by the call is measured, printed, stored in
+                                       `result.attrs['peak_memory_bytes']` and compared
+                                       against the budget.
 
     Returns:
-        pd.DataFrame: DataFrame with transformations applied to columns and outliers handled (if applicable).
+        pd.DataFrame: DataFrame with transformations applied to columns, or a
+                      (DataFrame, outlier mask) tuple when `handle_outliers` is True.
     """
-    transformed_df = df.copy()  # Create a copy to apply transformations
+    if memory_budget is None:
+        return _transform_columns(
+            df, skew_categories, handle_outliers, method, inplace, dtype
+        )
+
+    with track_peak_memory() as memory:
+        result = _transform_columns(
+            df, skew_categories, handle_outliers, method, inplace, dtype
+        )
+
+    peak = memory["peak_bytes"]
+    print(
+        f"Peak memory during transformation: {format_bytes(peak)} (budget {format_bytes(memory_budget)})."
+    )
+    if peak > memory_budget:
+        print(
+            f"Warning: Transformation exceeded the memory budget by {format_bytes(peak - memory_budget)}."
+        )
+
+    transformed_df = result[0] if handle_outliers else result
+    transformed_df.attrs["peak_memory_bytes"] = peak
+    transformed_df.attrs["memory_budget_bytes"] = memory_budget
+    return result
+
+
+def _transform_columns(df, skew_categories, handle_outliers, method, inplace, dtype):
+    """Apply the skew-based transformations and optional outlier handling."""
+    # Create a copy to apply transformations unless working in place
+    transformed_df = df if inplace else df.copy()
 
     # Dictionary of transformations for each skew category
     transformations = {"high_skew": "log", "moderate_skew": "sqrt"}
@@ -66,13 +127,34 @@ def best_transformation_with_outliers(df, skew_categories, handle_outliers=False
             print(
                 f"Applying {transformation_type} transformation to {col} due to {skew_category} skewness."
             )
-            transformed_df[col] = apply_transformation(
-                transformed_df, col, transformation_type
-            )
+            if inplace or dtype is not None:
+                # Write the result into a single column-sized buffer and swap it in
+                buffer = np.empty(len(transformed_df), dtype=dtype or "float64")
+                apply_transformation(
+                    transformed_df, col, transformation_type, out=buffer
+                )
+                if inplace and transformed_df[col].dtype == buffer.dtype:
+                    # Write into the existing block; replacing the column would split
+                    # the block and copy its other columns
+                    transformed_df.loc[:, col] = buffer
+                else:
+                    transformed_df[col] = buffer
+            else:
+                transformed_df[col] = apply_transformation(
+                    transformed_df, col, transformation_type
+                )
             transformed_col.append(col)
 
     # Handle outliers if required
     if handle_outliers:
-        transformed_df = handle_outliers_in_data(transformed_df, transformed_col, method=method)
+        transformed_df = handle_outliers_in_data(
+            transformed_df, transformed_col, method=method, inplace=inplace
+        )
 
     return transformed_df
+
+
+def _reciprocal_into(x, out):
+    """Write 1 / x into `out`, with NaN where x is zero."""
+    out.fill(np.nan)
+    return np.divide(1, x, out=out, where=(x != 0))
@@ -0,0 +1,172 @@
+import numpy as np
+import pandas as pd
+
+# Second central moments below this are treated as zero (constant column), as in pandas
+ZERO_MOMENT = 1e-14
+
+
+class SkewnessMoments:
+    """
+    Mergeable per-column count, mean and second and third central moment sums.
+
+    Every `update` processes all columns of a chunk in one NumPy pass; partial results
+    from different chunks or workers are combined with `merge` using the pairwise
+    update formulas, so the skewness of a stream equals that of the whole data.
+    """
+
+    def __init__(self, columns=None):
+        self.columns = None if columns is None else list(columns)
+        self.count = None
+        self.mean = None
+        self.m2 = None
+        self.m3 = None
+
+    def update(self, chunk):
+        """
+        Adds the rows of a chunk.
+
+        Args:
+            chunk (pd.DataFrame): A chunk of the data. The columns are fixed on the first
+                                  chunk with `select_skewness_columns`.
+
+        Returns:
+            SkewnessMoments: The updated moments.
+        """
+        if self.columns is None:
+            self.columns = select_skewness_columns(chunk)
+
+        values = chunk[self.columns].to_numpy(dtype="float64", na_value=np.nan)
+        present = ~np.isnan(values)
+        count = present.sum(axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(present, values, 0.0).sum(axis=0) / count
+        mean = np.nan_to_num(mean)
+
+        deviations = np.where(present, values - mean, 0.0)
+        squared = deviations**2
+        partial = SkewnessMoments(self.columns)
+        partial.count = count
+        partial.mean = mean
+        partial.m2 = squared.sum(axis=0)
+        partial.m3 = (squared * deviations).sum(axis=0)
+
+        return self.merge(partial)
+
+    def merge(self, other):
+        """Combines the moments of another part of the same columns into this one."""
+        if other.count is None:
+            return self
+        if self.count is None:
+            self.columns = other.columns
+            self.count, self.mean = other.count.copy(), other.mean.copy()
+            self.m2, self.m3 = other.m2.copy(), other.m3.copy()
+            return self
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge skewness moments of different columns.")
+
+        n_a, n_b = self.count.astype("float64"), other.count.astype("float64")
+        n = n_a + n_b
+        delta = other.mean - self.mean
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nan_to_num(self.mean + delta * n_b / n)
+            m2 = self.m2 + other.m2 + np.nan_to_num(delta**2 * n_a * n_b / n)
+            m3 = (
+                self.m3
+                + other.m3
+                + np.nan_to_num(delta**3 * n_a * n_b * (n_a - n_b) / n**2)
+                + np.nan_to_num(3 * delta * (n_a * other.m2 - n_b * self.m2) / n)
+            )
+
+        self.count = self.count + other.count
+        self.mean, self.m2, self.m3 = mean, m2, m3
+        return self
+
+    def skewness(self):
+        """
+        Returns the bias-corrected sample skewness of every column, as `pd.Series.skew`.
+
+        Columns with fewer than three values get NaN, constant columns 0.
+        """
+        if self.count is None:
+            return pd.Series(dtype="float64")
+
+        n = self.count.astype("float64")
+        m2 = np.where(np.abs(self.m2) < ZERO_MOMENT, 0.0, self.m2)
+        m3 = np.where(np.abs(self.m3) < ZERO_MOMENT, 0.0, self.m3)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = (n * np.sqrt(n - 1) / (n - 2)) * (m3 / m2**1.5)
+        result = np.where(m2 == 0, 0.0, result)
+        result = np.where(n < 3, np.nan, result)
+
+        return pd.Series(result, index=self.columns, dtype="float64")
+
+
+def compute_skewness(data, columns=None):
+    """
+    Computes the skewness of the selected columns in a single pass over the data.
+
+    Args:
+        data (pd.DataFrame | iterable): A DataFrame or an iterable of DataFrame chunks
+                                        (e.g. `create_dataframe(..., chunksize=...)`).
+        columns (list, optional): Columns to analyze; see `select_skewness_columns`.
+
+    Returns:
+        pd.Series: Skewness per column.
+    """
+    moments = SkewnessMoments()
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+
+    for chunk in chunks:
+        if moments.columns is None:
+            moments.columns = select_skewness_columns(chunk, columns)
+        moments.update(chunk)
+
+    return moments.skewness()
+
+
+def select_skewness_columns(df, columns=None):
+    """
+    Returns the columns to analyze: all numeric columns if `columns` is None, otherwise
+    the given columns without the non-numeric ones (with a warning).
+    """
+    if columns is None:
+        return df.select_dtypes(include="number").columns.tolist()
+
+    # Check if the provided columns are numeric
+    non_numeric_columns = [
+        col for col in columns if not pd.api.types.is_numeric_dtype(df[col])
+    ]
+
+    if non_numeric_columns:
+        print(
+            f"Warning: The following non-numeric columns were excluded from skewness analysis: {', '.join(non_numeric_columns)}"
+        )
+
+    return [col for col in columns if col not in non_numeric_columns]
+
+
+def categorize_skewness(skewness_values):
+    """
+    Categorizes columns by their absolute skewness.
+
+    Args:
+        skewness_values (pd.Series | dict): Skewness per column.
+
+    Returns:
+        dict: 'high_skew' (> 1), 'moderate_skew' (0.5 to 1) and 'low_skew' (<= 0.5) column
+              lists, and 'skewness_values' with the value of each column.
+    """
+    if isinstance(skewness_values, pd.Series):
+        skewness_values = skewness_values.to_dict()
+
+    return {
+        "high_skew": [col for col, skew in skewness_values.items() if abs(skew) > 1],
+        "moderate_skew": [
+            col for col, skew in skewness_values.items() if 0.5 < abs(skew) <= 1
+        ],
+        "low_skew": [col for col, skew in skewness_values.items() if abs(skew) <= 0.5],
+        "skewness_values": skewness_values,  # For detailed skewness values of each column
+    }
@@ -1,12 +1,18 @@
 from utils.visualization import visualize_chart, plot_functions
+from utils.instrumentation import instrumented
+from .skewness_engine import compute_skewness
 
 
-def visualize_skewness_with_chart(df, numeric_columns):
+@instrumented()
+def visualize_skewness_with_chart(df, numeric_columns, skewness=None):
     """
     Visualize skewness of all numeric columns using histograms with KDE.
 
     Args:
         df (pd.DataFrame): The DataFrame to analyze and visualize.
+        numeric_columns (list): Columns to plot.
+        skewness (pd.Series, optional): Precomputed skewness per column, e.g. from
+                                        `analyze_skewness`. Computed if not given.
 
     Returns:
         fig: The generated figure object.
@@ -14,8 +20,10 @@ def visualize_skewness_with_chart(df, numeric_columns):
     # Identify numeric columns
     # numeric_columns = df.select_dtypes(include=['number']).columns
 
-    # Calculate skewness for each numeric column
-    skewness = df[numeric_columns].skew().round(2)
+    # Calculate skewness for each numeric column unless it was passed in
+    if skewness is None:
+        skewness = compute_skewness(df, numeric_columns)
+    skewness = skewness.round(2)
 
     # print(skewness)
 
@@ -0,0 +1,266 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import TRANSACTIONS, RFM
+from .rfm import total_price
+
+CUSTOMER_ID = TRANSACTIONS["CUSTOMER_ID"]
+INVOICE_NO = TRANSACTIONS["INVOICE_NO"]
+INVOICE_DATE = TRANSACTIONS["INVOICE_DATE"]
+
+# Sentinel for "no purchase seen yet" in the int64 nanosecond date column
+NO_DATE = np.iinfo("int64").min
+
+
+class IncrementalRFM:
+    """
+    RFM state store keyed by CustomerID that is updated from transaction deltas.
+
+    Per customer it keeps the last purchase date, the number of distinct invoices and
+    the monetary sum in array-backed columns. Each call to `update` only touches the
+    customers present in the new batch; Recency is derived from the last purchase date
+    when the table is produced, so it never has to be rewritten.
+
+    Distinct invoices are tracked as 64-bit (customer, invoice) fingerprints, so an
+    invoice split across two batches is still counted once.
+
+    Customers and fingerprints are held in `_SortedRuns`: new entries go into a small
+    sorted run that is merged into larger runs lazily, so an update costs about the
+    size of the batch, not of the whole history.
+    """
+
+    def __init__(self):
+        self.customers = _SortedRuns("float64", ["int64", "int64", "float64"])
+        self.invoice_keys = _SortedRuns("uint64")
+        self.max_date = NO_DATE
+
+    def __len__(self):
+        return len(self.customers)
+
+    def update(self, transactions, date_format=None):
+        """
+        Folds a batch of transactions into the state.
+
+        Args:
+            transactions (pd.DataFrame): New transactions with CustomerID, InvoiceNo,
+                                         InvoiceDate and either TotalPrice or
+                                         Quantity and UnitPrice.
+            date_format (str, optional): Format used to parse InvoiceDate if it is text.
+
+        Returns:
+            IncrementalRFM: The updated store.
+        """
+        batch = transactions[transactions[CUSTOMER_ID].notna()]
+        if batch.empty:
+            return self
+
+        dates = to_datetime_ns(batch[INVOICE_DATE], date_format)
+        amounts = total_price(batch)
+
+        # Per-customer aggregates of the batch via integer codes
+        codes, batch_customers = pd.factorize(
+            batch[CUSTOMER_ID].to_numpy(dtype="float64"), sort=True
+        )
+        batch_last = np.full(len(batch_customers), NO_DATE, dtype="int64")
+        np.maximum.at(batch_last, codes, dates)
+        batch_monetary = np.bincount(
+            codes, weights=amounts, minlength=len(batch_customers)
+        )
+
+        # Distinct (customer, invoice) pairs that were not seen in earlier batches;
+        # rows without an InvoiceNo are not an invoice, as nunique ignores them
+        invoices = batch[INVOICE_NO]
+        has_invoice = invoices.notna().to_numpy()
+        invoice_codes = codes[has_invoice]
+        pairs = pd.DataFrame(
+            {
+                CUSTOMER_ID: batch_customers[invoice_codes],
+                INVOICE_NO: invoices[has_invoice].astype(str).to_numpy(),
+            }
+        )
+        pair_keys = pd.util.hash_pandas_object(pairs, index=False).to_numpy()
+        pair_keys, first_rows = np.unique(pair_keys, return_index=True)
+        is_new = self.invoice_keys.lookup(pair_keys)[0] < 0
+        batch_frequency = np.bincount(
+            invoice_codes[first_rows[is_new]], minlength=len(batch_customers)
+        )
+        self.invoice_keys.append(pair_keys[is_new])
+
+        # Update customers already in the store in place, run by run
+        run_index, positions = self.customers.lookup(batch_customers)
+        for i, (_, last_purchase, frequency, monetary) in enumerate(
+            self.customers.runs
+        ):
+            in_run = run_index == i
+            idx = positions[in_run]
+            last_purchase[idx] = np.maximum(last_purchase[idx], batch_last[in_run])
+            frequency[idx] += batch_frequency[in_run]
+            monetary[idx] += batch_monetary[in_run]
+
+        # New customers form a new run
+        new = run_index < 0
+        self.customers.append(
+            batch_customers[new],
+            batch_last[new],
+            batch_frequency[new],
+            batch_monetary[new],
+        )
+
+        self.max_date = max(self.max_date, int(batch_last.max()))
+        return self
+
+    def to_frame(self, reference_date=None):
+        """
+        Produces the RFM table for all customers in the store.
+
+        Args:
+            reference_date (datetime-like, optional): Date Recency is measured from.
+                                                      Defaults to the latest purchase
+                                                      seen plus one day.
+
+        Returns:
+            pd.DataFrame: Recency, Frequency, Monetary and Monetary_log indexed by CustomerID.
+        """
+        if reference_date is None:
+            reference = self.max_date + pd.Timedelta(days=1).value
+        else:
+            reference = pd.Timestamp(reference_date).as_unit("ns").value
+
+        customer_ids, last_purchase, frequency, monetary = self.customers.compact()
+        recency = (reference - last_purchase) // pd.Timedelta(days=1).value
+
+        return pd.DataFrame(
+            {
+                RFM["RECENCY"]: recency,
+                RFM["FREQUENCY"]: frequency,
+                RFM["MONETARY"]: monetary,
+                RFM["MONETARY_LOG"]: np.log1p(monetary),
+            },
+            index=pd.Index(customer_ids, name=CUSTOMER_ID),
+        )
+
+    def save(self, path):
+        """
+        Persists the store to a compressed NumPy archive.
+
+        Args:
+            path (str): Archive path; '.npz' is appended if missing, as NumPy does.
+
+        Returns:
+            str: The path written.
+        """
+        path = _npz_path(path)
+        customer_ids, last_purchase, frequency, monetary = self.customers.compact()
+        (invoice_keys,) = self.invoice_keys.compact()
+        np.savez_compressed(
+            path,
+            customer_ids=customer_ids,
+            last_purchase=last_purchase,
+            frequency=frequency,
+            monetary=monetary,
+            invoice_keys=invoice_keys,
+            max_date=np.array([self.max_date], dtype="int64"),
+        )
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Loads a store previously written with `save` to the same `path`."""
+        store = cls()
+        with np.load(_npz_path(path)) as data:
+            store.customers.append(
+                data["customer_ids"],
+                data["last_purchase"],
+                data["frequency"],
+                data["monetary"],
+            )
+            store.invoice_keys.append(data["invoice_keys"])
+            store.max_date = int(data["max_date"][0])
+        return store
+
+
+class _SortedRuns:
+    """
+    Unique sorted keys with value columns, held as a few sorted runs.
+
+    Each run is at least twice as large as the next one. Appending a run merges it
+    with its predecessors only while that rule is broken, so every entry takes part
+    in O(log n) merges in total and a lookup searches O(log n) runs, instead of
+    re-sorting or inserting into all entries on every update.
+    """
+
+    def __init__(self, key_dtype, value_dtypes=()):
+        self.dtypes = [key_dtype, *value_dtypes]
+        self.runs = []
+
+    def __len__(self):
+        return sum(len(run[0]) for run in self.runs)
+
+    def lookup(self, keys):
+        """
+        Finds keys in the runs.
+
+        Returns:
+            tuple: (index of the run holding each key, or -1 if absent; its position
+                   in that run).
+        """
+        run_index = np.full(len(keys), -1, dtype="int64")
+        positions = np.zeros(len(keys), dtype="int64")
+        for i, run in enumerate(self.runs):
+            pending = np.flatnonzero(run_index < 0)
+            if not len(pending):
+                break
+            found, pos = _search(run[0], keys[pending])
+            run_index[pending[found]] = i
+            positions[pending[found]] = pos[found]
+        return run_index, positions
+
+    def append(self, keys, *values):
+        """Adds sorted keys that are in no run yet, with their value columns."""
+        if not len(keys):
+            return
+        run = [
+            np.asarray(a, dtype=dtype) for a, dtype in zip([keys, *values], self.dtypes)
+        ]
+        self.runs.append(run)
+        while len(self.runs) > 1 and len(self.runs[-2][0]) < 2 * len(self.runs[-1][0]):
+            self.runs[-2:] = [_merge_runs(*self.runs[-2:])]
+
+    def compact(self):
+        """Merges all runs into one and returns its columns: keys, then values."""
+        if not self.runs:
+            return [np.empty(0, dtype=dtype) for dtype in self.dtypes]
+        while len(self.runs) > 1:
+            self.runs[-2:] = [_merge_runs(*self.runs[-2:])]
+        return self.runs[0]
+
+
+def _search(sorted_keys, keys):
+    """Whether each key is in `sorted_keys`, and its insertion position."""
+    positions = np.searchsorted(sorted_keys, keys)
+    if not len(sorted_keys):
+        return np.zeros(len(keys), dtype=bool), positions
+    found = sorted_keys[np.minimum(positions, len(sorted_keys) - 1)] == keys
+    return found, positions
+
+
+def _merge_runs(first, second):
+    """Merges two sorted runs with disjoint keys into one."""
+    merged = [np.concatenate(columns) for columns in zip(first, second)]
+    order = np.argsort(merged[0], kind="stable")
+    return [column[order] for column in merged]
+
+
+def _npz_path(path):
+    """`path` with the '.npz' suffix `np.savez_compressed` adds when it is missing."""
+    path = os.fspath(path)
+    return path if path.endswith(".npz") else f"{path}.npz"
+
+
+def to_datetime_ns(dates, date_format=None):
+    """Returns dates as int64 nanoseconds since the epoch."""
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format=date_format)
+    return dates.dt.as_unit("ns").to_numpy().view("int64")
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from utils.constants import TRANSACTIONS, RFM
+
+CUSTOMER_ID = TRANSACTIONS["CUSTOMER_ID"]
+INVOICE_NO = TRANSACTIONS["INVOICE_NO"]
+INVOICE_DATE = TRANSACTIONS["INVOICE_DATE"]
+
+
+def compute_rfm(df, reference_date=None, date_format=None):
+    """
+    Computes Recency, Frequency and Monetary values per customer with vectorized operations.
+
+    Produces the same table as the notebook's
+    `groupby('CustomerID').agg(Recency=lambda..., Frequency='nunique', Monetary='sum')`
+    but works on factorized integer codes: Recency is one `groupby().max()` on the
+    dates followed by a single subtraction, Frequency counts distinct
+    (customer, invoice) code pairs and Monetary is a weighted `np.bincount`.
+
+    Args:
+        df (pd.DataFrame): Transactions with CustomerID, InvoiceNo, InvoiceDate and
+                           either TotalPrice or Quantity and UnitPrice.
+        reference_date (datetime-like, optional): Date Recency is measured from.
+                                                  Defaults to the latest InvoiceDate plus one day.
+        date_format (str, optional): Format used to parse InvoiceDate if it is text.
+
+    Returns:
+        pd.DataFrame: Recency, Frequency, Monetary and Monetary_log indexed by CustomerID.
+    """
+    customer_codes, customers = pd.factorize(df[CUSTOMER_ID], sort=True)
+
+    # Rows without a CustomerID (code -1) are dropped, as groupby does
+    valid = customer_codes >= 0
+    if not valid.all():
+        df = df[valid]
+        customer_codes = customer_codes[valid]
+    n_customers = len(customers)
+
+    dates = df[INVOICE_DATE]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format=date_format)
+
+    if reference_date is None:
+        reference_date = dates.max() + pd.Timedelta(days=1)
+
+    # Recency: latest purchase per customer, then one vectorized subtraction
+    last_purchase = dates.groupby(customer_codes).max()
+    recency = (pd.Timestamp(reference_date) - last_purchase).dt.days.to_numpy()
+
+    # Frequency: distinct (customer, invoice) integer pairs per customer; a missing
+    # InvoiceNo (code -1) is not an invoice, as nunique ignores it
+    invoice_codes, invoices = pd.factorize(df[INVOICE_NO])
+    has_invoice = invoice_codes >= 0
+    pairs = np.unique(
+        customer_codes[has_invoice].astype("int64") * max(len(invoices), 1)
+        + invoice_codes[has_invoice]
+    )
+    frequency = np.bincount(pairs // max(len(invoices), 1), minlength=n_customers)
+
+    # Monetary: weighted bincount over the customer codes
+    monetary = np.bincount(
+        customer_codes, weights=total_price(df), minlength=n_customers
+    )
+
+    return pd.DataFrame(
+        {
+            RFM["RECENCY"]: recency,
+            RFM["FREQUENCY"]: frequency,
+            RFM["MONETARY"]: monetary,
+            RFM["MONETARY_LOG"]: np.log1p(monetary),
+        },
+        index=pd.Index(customers, name=CUSTOMER_ID),
+    )
+
+
+def total_price(df):
+    """Returns TotalPrice as float64, computing Quantity * UnitPrice when the column is absent."""
+    if TRANSACTIONS["TOTAL_PRICE"] in df.columns:
+        return df[TRANSACTIONS["TOTAL_PRICE"]].to_numpy(dtype="float64")
+
+    quantity = df[TRANSACTIONS["QUANTITY"]].to_numpy(dtype="float64")
+    unit_price = df[TRANSACTIONS["UNIT_PRICE"]].to_numpy(dtype="float64")
+    return quantity * unit_price
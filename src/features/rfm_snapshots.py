@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from utils.constants import TRANSACTIONS, RFM
+from .incremental_rfm import NO_DATE, to_datetime_ns
+from .rfm import total_price
+
+CUSTOMER_ID = TRANSACTIONS["CUSTOMER_ID"]
+INVOICE_NO = TRANSACTIONS["INVOICE_NO"]
+INVOICE_DATE = TRANSACTIONS["INVOICE_DATE"]
+
+NS_PER_DAY = pd.Timedelta(days=1).value
+
+
+def iter_rfm_snapshots(df, reference_dates, date_format=None):
+    """
+    Yields the RFM table as of each reference date from a single sorted sweep.
+
+    The transactions are sorted by date once; each snapshot then only folds in the
+    rows between the previous reference date and its own into per-customer running
+    state (last purchase, distinct invoices, spend). A snapshot costs the new rows
+    plus one pass over the customer arrays, instead of a full groupby per date.
+
+    A snapshot covers the transactions dated before its reference date, so the
+    notebook's table is the snapshot at the latest InvoiceDate plus one day; use
+    month starts (e.g. `pd.date_range(start, end, freq='MS')`) for month-end states.
+
+    Args:
+        df (pd.DataFrame): Transactions with CustomerID, InvoiceNo, InvoiceDate and
+                           either TotalPrice or Quantity and UnitPrice.
+        reference_dates (Iterable): Dates to produce snapshots at, in any order.
+        date_format (str, optional): Format used to parse InvoiceDate if it is text.
+
+    Yields:
+        tuple: (reference date as pd.Timestamp, RFM DataFrame indexed by CustomerID
+               with the customers that purchased before it), in date order.
+    """
+    df = df[df[CUSTOMER_ID].notna()]
+    customer_codes, customers = pd.factorize(df[CUSTOMER_ID], sort=True)
+    invoice_codes, invoices = pd.factorize(df[INVOICE_NO])
+    dates = to_datetime_ns(df[INVOICE_DATE], date_format)
+    amounts = total_price(df)
+
+    order = np.argsort(dates, kind="stable")
+    customer_codes = customer_codes[order]
+    invoice_codes = invoice_codes[order]
+    dates = dates[order]
+    amounts = amounts[order]
+
+    # A (customer, invoice) pair adds to Frequency at its earliest row only; a
+    # missing InvoiceNo (code -1) is not an invoice, as nunique ignores it
+    has_invoice = np.flatnonzero(invoice_codes >= 0)
+    pairs = (
+        customer_codes[has_invoice].astype("int64") * max(len(invoices), 1)
+        + invoice_codes[has_invoice]
+    )
+    _, first_rows = np.unique(pairs, return_index=True)
+    first_of_pair = np.zeros(len(dates), dtype=bool)
+    first_of_pair[has_invoice[first_rows]] = True
+
+    n_customers = len(customers)
+    last_purchase = np.full(n_customers, NO_DATE, dtype="int64")
+    frequency = np.zeros(n_customers, dtype="int64")
+    monetary = np.zeros(n_customers, dtype="float64")
+
+    start = 0
+    for reference_date in sorted(pd.Timestamp(date) for date in reference_dates):
+        reference = reference_date.as_unit("ns").value
+        end = np.searchsorted(dates, reference, side="left")
+
+        codes = customer_codes[start:end]
+        np.maximum.at(last_purchase, codes, dates[start:end])
+        frequency += np.bincount(codes[first_of_pair[start:end]], minlength=n_customers)
+        monetary += np.bincount(
+            codes, weights=amounts[start:end], minlength=n_customers
+        )
+        start = end
+
+        seen = np.flatnonzero(last_purchase != NO_DATE)
+        yield reference_date, pd.DataFrame(
+            {
+                RFM["RECENCY"]: (reference - last_purchase[seen]) // NS_PER_DAY,
+                RFM["FREQUENCY"]: frequency[seen],
+                RFM["MONETARY"]: monetary[seen],
+                RFM["MONETARY_LOG"]: np.log1p(monetary[seen]),
+            },
+            index=pd.Index(customers[seen], name=CUSTOMER_ID),
+        )
@@ -0,0 +1,199 @@
+import numpy as np
+import pandas as pd
+
+from src.features.rfm import total_price
+from utils.constants import RFM, TRANSACTIONS
+
+TOP_N = 5
+
+
+def row_clusters(df, clusters):
+    """
+    Maps every transaction to its customer's cluster without merging the tables.
+
+    CustomerID is factorized once and each distinct customer is looked up once, so
+    the result is a small integer array instead of a labelled copy of `df`.
+
+    Args:
+        df (pd.DataFrame): Transactions with CustomerID.
+        clusters (pd.DataFrame | pd.Series): Cluster labels indexed by CustomerID, either
+                                             as a Series or as the Cluster column of an
+                                             RFM table.
+
+    Returns:
+        np.ndarray: Cluster of every row of `df`; -1 for rows whose customer is missing
+                    or has no cluster (the rows the notebook's inner merge drops).
+    """
+    if isinstance(clusters, pd.DataFrame):
+        clusters = clusters[RFM["CLUSTER"]]
+
+    customer_codes, customers = pd.factorize(df[TRANSACTIONS["CUSTOMER_ID"]])
+    customer_cluster = clusters.reindex(customers).fillna(-1).to_numpy(dtype="int64")
+    # Sentinel slot for rows without a CustomerID (code -1)
+    customer_cluster = np.append(customer_cluster, -1)
+    return customer_cluster[customer_codes]
+
+
+def top_products(df, row_cluster, top_n=TOP_N):
+    """
+    Top products by total spend per cluster, as the notebook's `top_products` table.
+
+    Args:
+        df (pd.DataFrame): Transactions with StockCode, Quantity and TotalPrice
+                           (or Quantity and UnitPrice).
+        row_cluster (np.ndarray): Cluster of every row, from `row_clusters`.
+        top_n (int): Products kept per cluster.
+
+    Returns:
+        pd.DataFrame: Cluster, StockCode, TotalSpend and Quantity, by cluster and
+                      descending spend.
+    """
+    totals = _KeyTotals(df, row_cluster, TRANSACTIONS["STOCK_CODE"])
+    return totals.top(top_n, Quantity=totals.quantity)
+
+
+def top_countries(df, row_cluster, top_n=TOP_N):
+    """
+    Top countries by total spend per cluster with their number of distinct invoices,
+    as the notebook's `top_countries` table.
+
+    Args:
+        df (pd.DataFrame): Transactions with Country, InvoiceNo and TotalPrice
+                           (or Quantity and UnitPrice).
+        row_cluster (np.ndarray): Cluster of every row, from `row_clusters`.
+        top_n (int): Countries kept per cluster.
+
+    Returns:
+        pd.DataFrame: Cluster, Country, TotalSpend and Transactions, by cluster and
+                      descending spend.
+    """
+    totals = _KeyTotals(df, row_cluster, TRANSACTIONS["COUNTRY"])
+    return totals.top(top_n, Transactions=totals.distinct_invoices())
+
+
+def cluster_kpis(df, row_cluster):
+    """
+    Average basket value and number of distinct products per cluster, as the
+    notebook's `cluster_kpis` table.
+
+    Args:
+        df (pd.DataFrame): Transactions with StockCode and TotalPrice
+                           (or Quantity and UnitPrice).
+        row_cluster (np.ndarray): Cluster of every row, from `row_clusters`.
+
+    Returns:
+        pd.DataFrame: Cluster, AvgBasketValue and DistinctSKUs.
+    """
+    return _KeyTotals(df, row_cluster, TRANSACTIONS["STOCK_CODE"]).kpis()
+
+
+def cluster_report(df, clusters, top_n=TOP_N):
+    """
+    Computes `top_products`, `top_countries` and `cluster_kpis` with one customer
+    lookup and one pass over each key column.
+
+    Args:
+        df (pd.DataFrame): Transactions.
+        clusters (pd.DataFrame | pd.Series): Cluster labels indexed by CustomerID.
+        top_n (int): Products and countries kept per cluster.
+
+    Returns:
+        dict: 'top_products', 'top_countries' and 'cluster_kpis' DataFrames.
+    """
+    row_cluster = row_clusters(df, clusters)
+    products = _KeyTotals(df, row_cluster, TRANSACTIONS["STOCK_CODE"])
+    countries = _KeyTotals(df, row_cluster, TRANSACTIONS["COUNTRY"])
+    return {
+        "top_products": products.top(top_n, Quantity=products.quantity),
+        "top_countries": countries.top(
+            top_n, Transactions=countries.distinct_invoices()
+        ),
+        "cluster_kpis": products.kpis(),
+    }
+
+
+class _KeyTotals:
+    """
+    Row count, spend and quantity per (cluster, key) as dense (clusters, keys) matrices,
+    accumulated with one `np.bincount` per measure over factorized codes.
+    """
+
+    def __init__(self, df, row_cluster, key):
+        row_cluster = np.asarray(row_cluster)
+        valid = row_cluster >= 0
+        key_codes, self.keys = pd.factorize(df[key])
+        valid &= key_codes >= 0
+
+        self.df = df
+        self.valid = valid
+        self.key = key
+        self.n_clusters = int(row_cluster.max()) + 1 if valid.any() else 0
+        self.n_keys = len(self.keys)
+        self.cell = (row_cluster[valid] * self.n_keys + key_codes[valid]).astype(
+            "int64"
+        )
+
+        self.count = self._sum(self.cell)
+        self.spend = self._sum(self.cell, total_price(df)[valid])
+        self.quantity = self._sum(
+            self.cell, df[TRANSACTIONS["QUANTITY"]].to_numpy(dtype="float64")[valid]
+        )
+        if pd.api.types.is_integer_dtype(df[TRANSACTIONS["QUANTITY"]]):
+            self.quantity = self.quantity.astype("int64")
+
+    def _sum(self, cells, weights=None):
+        """Sums `weights` (or counts entries) per (cluster, key) cell index."""
+        sums = np.bincount(
+            cells, weights=weights, minlength=self.n_clusters * self.n_keys
+        )
+        return sums.reshape(self.n_clusters, self.n_keys)
+
+    def distinct_invoices(self):
+        """Number of distinct InvoiceNo per (cluster, key)."""
+        invoice_codes, invoices = pd.factorize(self.df[TRANSACTIONS["INVOICE_NO"]])
+        invoice_codes = invoice_codes[self.valid]
+        # Missing invoices are coded -1 and, like in `nunique`, not counted
+        has_invoice = invoice_codes >= 0
+        n_invoices = max(len(invoices), 1)
+        pairs = np.unique(
+            self.cell[has_invoice] * n_invoices + invoice_codes[has_invoice]
+        )
+        return self._sum(pairs // n_invoices)
+
+    def kpis(self):
+        """Mean TotalPrice and number of distinct keys per cluster."""
+        rows = self.count.sum(axis=1)
+        present = np.flatnonzero(rows)
+        return pd.DataFrame(
+            {
+                RFM["CLUSTER"]: present,
+                "AvgBasketValue": self.spend.sum(axis=1)[present] / rows[present],
+                "DistinctSKUs": (self.count[present] > 0).sum(axis=1),
+            }
+        )
+
+    def top(self, top_n, **measures):
+        """
+        Keys with the highest spend per cluster, picked with `np.argpartition`
+        instead of a full sort; only (cluster, key) pairs that occur are candidates.
+        """
+        clusters, keys = [], []
+        for cluster in range(self.n_clusters):
+            candidates = np.flatnonzero(self.count[cluster])
+            if len(candidates) > top_n:
+                spend = self.spend[cluster, candidates]
+                candidates = candidates[np.argpartition(-spend, top_n - 1)[:top_n]]
+            order = np.argsort(-self.spend[cluster, candidates], kind="stable")
+            keys.append(candidates[order])
+            clusters.append(np.full(len(order), cluster))
+
+        clusters = np.concatenate(clusters) if clusters else np.array([], dtype=int)
+        keys = np.concatenate(keys) if keys else np.array([], dtype=int)
+        return pd.DataFrame(
+            {
+                RFM["CLUSTER"]: clusters,
+                self.key: self.keys[keys],
+                "TotalSpend": self.spend[clusters, keys],
+                **{name: values[clusters, keys] for name, values in measures.items()},
+            }
+        )
@@ -0,0 +1,148 @@
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.metrics import davies_bouldin_score, silhouette_score
+
+# Shared feature matrix attached once per worker process by `_attach_shared_matrix`
+_worker_state = {}
+
+
+def evaluate_kmeans(
+    df_scaled,
+    k_values=range(2, 11),
+    workers=None,
+    time_budget=None,
+    random_state=42,
+    n_init=10,
+    silhouette_sample_size=None,
+):
+    """
+    Fits KMeans for every candidate k and scores each fit, in parallel worker processes.
+
+    The scaled feature matrix is placed in shared memory once and every worker maps it
+    without copying. Each worker limits its BLAS/OpenMP pools to one thread so the
+    processes do not oversubscribe the CPU.
+
+    Args:
+        df_scaled (pd.DataFrame | np.ndarray): Scaled features, one row per customer.
+        k_values (iterable): Candidate numbers of clusters.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count
+                                 (capped at the number of candidates); 0 or 1 runs serially.
+        time_budget (float, optional): Seconds after which the sweep stops. Candidates
+                                       that have not finished are dropped from the result.
+        random_state (int): Random state of every KMeans fit.
+        n_init (int): Number of KMeans initializations per k.
+        silhouette_sample_size (int, optional): Compute the silhouette on a random sample
+                                                of this many rows instead of exactly.
+
+    Returns:
+        pd.DataFrame: One row per finished k with 'k', 'inertia', 'silhouette' and
+                      'davies_bouldin', sorted by k.
+    """
+    data = np.ascontiguousarray(np.asarray(df_scaled, dtype="float64"))
+    k_values = list(k_values)
+    options = {
+        "random_state": random_state,
+        "n_init": n_init,
+        "silhouette_sample_size": silhouette_sample_size,
+    }
+
+    workers = min(os.cpu_count() if workers is None else workers, len(k_values))
+    if workers <= 1:
+        scores, skipped = _evaluate_serial(data, k_values, time_budget, options)
+    else:
+        scores, skipped = _evaluate_parallel(
+            data, k_values, workers, time_budget, options
+        )
+
+    if skipped:
+        print(
+            f"Warning: Time budget reached; k = {', '.join(map(str, skipped))} not evaluated."
+        )
+
+    columns = ["k", "inertia", "silhouette", "davies_bouldin"]
+    return pd.DataFrame(scores, columns=columns).sort_values("k", ignore_index=True)
+
+
+def _evaluate_serial(data, k_values, time_budget, options):
+    """Evaluates the candidates one after another in the current process."""
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    scores = []
+    for i, k in enumerate(k_values):
+        if deadline is not None and time.monotonic() >= deadline:
+            return scores, k_values[i:]
+        scores.append(_score_k(data, k, **options))
+    return scores, []
+
+
+def _evaluate_parallel(data, k_values, workers, time_budget, options):
+    """Evaluates the candidates in a process pool sharing one copy of the data."""
+    shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+    try:
+        shared = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        shared[:] = data
+
+        deadline = None if time_budget is None else time.monotonic() + time_budget
+        scores, skipped = [], []
+
+        # Leaving the pool block terminates workers still fitting past the deadline
+        with multiprocessing.get_context().Pool(
+            workers,
+            initializer=_attach_shared_matrix,
+            initargs=(shm.name, data.shape, data.dtype.str),
+        ) as pool:
+            pending = {
+                k: pool.apply_async(_score_shared_k, (k,), options) for k in k_values
+            }
+            for k, result in pending.items():
+                timeout = (
+                    None if deadline is None else max(deadline - time.monotonic(), 0)
+                )
+                try:
+                    scores.append(result.get(timeout))
+                except multiprocessing.TimeoutError:
+                    skipped.append(k)
+
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return scores, skipped
+
+
+def _attach_shared_matrix(name, shape, dtype):
+    """Maps the shared feature matrix into the worker and pins native thread pools to one thread."""
+    from threadpoolctl import threadpool_limits
+
+    threadpool_limits(1)
+    shm = shared_memory.SharedMemory(name=name)
+    _worker_state["shm"] = shm
+    _worker_state["data"] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _score_shared_k(k, **options):
+    """Scores one k on the worker's shared matrix."""
+    return _score_k(_worker_state["data"], k, **options)
+
+
+def _score_k(data, k, random_state, n_init, silhouette_sample_size):
+    """Fits KMeans with k clusters and returns its inertia, silhouette and Davies-Bouldin scores."""
+    km = KMeans(n_clusters=k, random_state=random_state, n_init=n_init)
+    labels = km.fit_predict(data)
+    return {
+        "k": k,
+        "inertia": km.inertia_,
+        "silhouette": silhouette_score(
+            data,
+            labels,
+            sample_size=silhouette_sample_size,
+            random_state=random_state,
+        ),
+        "davies_bouldin": davies_bouldin_score(data, labels),
+    }
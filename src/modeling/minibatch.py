@@ -0,0 +1,125 @@
+import joblib
+from scipy.optimize import linear_sum_assignment
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import adjusted_rand_score, confusion_matrix
+
+from src.data_preprocessing.create_dataframe import create_dataframe
+from .scaling import fit_scaler_streaming, scale_rfm_features
+
+# Rows per chunk when streaming an RFM file
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def train_minibatch_kmeans(
+    data,
+    n_clusters=3,
+    epochs=1,
+    chunksize=DEFAULT_CHUNKSIZE,
+    random_state=42,
+    model_path=None,
+    scaler_path=None,
+):
+    """
+    Trains a MiniBatchKMeans model on RFM data streamed in chunks, in bounded memory.
+
+    A first pass fits the scaler statistics with `partial_fit`; every following pass
+    scales each chunk with `scale_rfm_features` and feeds it to
+    `MiniBatchKMeans.partial_fit`, with the centers seeded by a multi-init KMeans on the
+    first chunk. The model is fitted on the same scaled feature names
+    as the notebook's KMeans, so it can be used in place of `models/kmeans_rfm_model.pkl`.
+
+    Args:
+        data (str | callable): Path of an RFM file (CSV or Parquet), or a callable that
+                               returns a fresh iterator of RFM chunks on every call.
+        n_clusters (int): Number of clusters.
+        epochs (int): Number of passes over the data for the mini-batch updates.
+        chunksize (int): Rows per chunk when `data` is a path.
+        random_state (int): Random state of the model.
+        model_path (str, optional): Where to save the trained model with joblib.
+        scaler_path (str, optional): Where to save the fitted scaler with joblib.
+
+    Returns:
+        tuple: (MiniBatchKMeans, StandardScaler)
+    """
+    if epochs < 1:
+        raise ValueError("epochs must be at least 1.")
+
+    chunks = _chunk_source(data, chunksize)
+    scaler = fit_scaler_streaming(chunks())
+
+    model = None
+    for _ in range(epochs):
+        for chunk in chunks():
+            scaled = scale_rfm_features(chunk, scaler)
+            if model is None:
+                # Seed the centers with a multi-init KMeans on the first chunk (bounded
+                # memory) instead of the single random init of a bare partial_fit
+                if len(scaled) < n_clusters:
+                    continue
+                seed = KMeans(
+                    n_clusters=n_clusters, random_state=random_state, n_init=10
+                )
+                seed.fit(scaled)
+                model = MiniBatchKMeans(
+                    n_clusters=n_clusters,
+                    init=seed.cluster_centers_,
+                    n_init=1,
+                    random_state=random_state,
+                )
+            model.partial_fit(scaled)
+
+    if model is None:
+        raise ValueError(f"Not enough rows to train {n_clusters} clusters.")
+
+    if model_path:
+        joblib.dump(model, model_path)
+    if scaler_path:
+        joblib.dump(scaler, scaler_path)
+
+    return model, scaler
+
+
+def compare_with_full_kmeans(model, scaler, rfm, random_state=42, n_init=10):
+    """
+    Measures what the mini-batch model gives up against a full-batch KMeans fit.
+
+    Both models are evaluated on `rfm` (use a representative sample for large data):
+    the full-batch KMeans is fitted on it in memory with the notebook's settings.
+
+    Args:
+        model (MiniBatchKMeans): The streamed model.
+        scaler (StandardScaler): The scaler fitted alongside it.
+        rfm (pd.DataFrame): RFM rows to compare on.
+        random_state (int): Random state of the full-batch fit.
+        n_init (int): Number of initializations of the full-batch fit.
+
+    Returns:
+        dict: Inertia of both models, the relative inertia gap in percent, the share of
+              rows assigned to matching clusters and the adjusted Rand index.
+    """
+    scaled = scale_rfm_features(rfm, scaler)
+
+    full = KMeans(n_clusters=model.n_clusters, random_state=random_state, n_init=n_init)
+    full_labels = full.fit_predict(scaled)
+    minibatch_labels = model.predict(scaled)
+    minibatch_inertia = -model.score(scaled)
+
+    # Cluster ids are arbitrary; match them by maximum overlap before comparing
+    overlap = confusion_matrix(full_labels, minibatch_labels)
+    rows, cols = linear_sum_assignment(overlap, maximize=True)
+    agreement = overlap[rows, cols].sum() / len(scaled)
+
+    return {
+        "minibatch_inertia": minibatch_inertia,
+        "full_inertia": full.inertia_,
+        "inertia_gap_pct": (minibatch_inertia / full.inertia_ - 1) * 100,
+        "assignment_agreement": agreement,
+        "adjusted_rand_index": adjusted_rand_score(full_labels, minibatch_labels),
+    }
+
+
+def _chunk_source(data, chunksize):
+    """Returns a callable that yields a fresh chunk iterator on every call."""
+    if callable(data):
+        return data
+    return lambda: create_dataframe(data, chunksize=chunksize)
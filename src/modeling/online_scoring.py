@@ -0,0 +1,277 @@
+"""
+Low-latency cluster assignment for single customers, with request micro-batching.
+
+Run from the project root to serve JSON lines over TCP:
+    python -m src.modeling.online_scoring --scaler models/rfm_scaler.pkl --port 8765
+
+Each request line is an RFM record such as {"Recency": 12, "Frequency": 4,
+"Monetary": 310.5}; each response line is {"Cluster": 1}.
+"""
+
+import argparse
+import asyncio
+import json
+from collections.abc import Mapping
+
+import numpy as np
+
+from utils.config import KMEANS_MODEL_PATH, SCALER_PATH
+from utils.constants import RFM
+from .scoring import load_scoring_artifacts
+
+# Largest number of requests scored together and longest extra wait for a batch to fill.
+# Requests that arrive while a batch is scored form the next batch anyway, so by
+# default the scorer does not wait; event loop timers are too coarse for sub-ms delays.
+MAX_BATCH_SIZE = 256
+MAX_DELAY_SECONDS = 0.0
+
+
+class ClusterAssigner:
+    """
+    Nearest-centroid assignment with plain NumPy arrays instead of sklearn objects.
+
+    The scaler's mean and scale and the KMeans centroids are held as contiguous
+    float64 arrays, so scoring a batch is one standardization and one distance matrix
+    product, with none of sklearn's per-call input validation.
+    """
+
+    def __init__(self, centroids, mean, scale):
+        self.centroids = np.ascontiguousarray(centroids, dtype="float64")
+        self.mean = np.ascontiguousarray(mean, dtype="float64")
+        self.scale = np.ascontiguousarray(scale, dtype="float64")
+        self.centroid_norms = np.einsum("ij,ij->i", self.centroids, self.centroids)
+
+    @classmethod
+    def from_artifacts(cls, model_path=KMEANS_MODEL_PATH, scaler_path=SCALER_PATH):
+        """
+        Builds an assigner from the persisted KMeans model and scaler.
+
+        Args:
+            model_path (str): Path of the pickled KMeans model.
+            scaler_path (str): Path of the pickled StandardScaler the model was trained with.
+
+        Returns:
+            ClusterAssigner: The assigner.
+
+        Raises:
+            FileNotFoundError: If the model or the scaler file does not exist.
+        """
+        model, scaler = load_scoring_artifacts(model_path, scaler_path)
+        return cls(model.cluster_centers_, scaler.mean_, scaler.scale_)
+
+    def assign(self, features):
+        """
+        Returns the nearest cluster of every row.
+
+        Args:
+            features (np.ndarray): (n, 3) raw Recency, Frequency and Monetary_log.
+
+        Returns:
+            np.ndarray: Cluster labels, as KMeans.predict would return.
+        """
+        scaled = (np.asarray(features, dtype="float64") - self.mean) / self.scale
+        # ||x - c||^2 without the per-row ||x||^2 term, which does not change the argmin
+        distances = self.centroid_norms - 2.0 * (scaled @ self.centroids.T)
+        return distances.argmin(axis=1)
+
+
+def record_features(record):
+    """
+    Returns the Recency, Frequency and Monetary_log of an RFM record as a float64 row.
+
+    Args:
+        record (dict): Recency, Frequency and Monetary (or Monetary_log).
+
+    Returns:
+        np.ndarray: The three finite features.
+
+    Raises:
+        TypeError: If the record is not a mapping.
+        KeyError: If a field is missing.
+        ValueError: If a value is not a finite number, or Monetary is -1 or less.
+    """
+    if not isinstance(record, Mapping):
+        raise TypeError(f"Expected an RFM record object, got {type(record).__name__}.")
+
+    if record.get(RFM["MONETARY_LOG"]) is not None:
+        monetary_log = _finite_number(record, RFM["MONETARY_LOG"])
+    else:
+        monetary = _finite_number(record, RFM["MONETARY"])
+        if monetary <= -1:
+            raise ValueError(f"{RFM['MONETARY']} must be greater than -1: {monetary}.")
+        monetary_log = np.log1p(monetary)
+
+    return np.array(
+        [
+            _finite_number(record, RFM["RECENCY"]),
+            _finite_number(record, RFM["FREQUENCY"]),
+            monetary_log,
+        ],
+        dtype="float64",
+    )
+
+
+def _finite_number(record, field):
+    """Returns `record[field]` as a float, rejecting missing, non-numeric and infinite values."""
+    value = record[field]
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must be a number, got {value!r}.") from None
+    if not np.isfinite(number):
+        raise ValueError(f"{field} must be finite, got {value!r}.")
+    return number
+
+
+class MicroBatchScorer:
+    """
+    Coalesces concurrent `assign` calls into micro-batches scored in one call.
+
+    The first pending request opens a batch; requests queued by then, or arriving
+    within `max_delay` seconds, join it, up to `max_batch_size`. Under load, batches
+    fill without waiting, so the per-request cost drops to a share of one vectorized
+    call; a lone request waits at most `max_delay`.
+
+    Use as an async context manager, or call `start` and `stop`.
+    """
+
+    def __init__(
+        self,
+        assigner,
+        max_batch_size=MAX_BATCH_SIZE,
+        max_delay=MAX_DELAY_SECONDS,
+    ):
+        self.assigner = assigner
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.batches = 0
+        self.scored = 0
+        self._queue = None
+        self._worker = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    def start(self):
+        """Starts the batching task on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def stop(self):
+        """Scores the requests already queued, then stops the batching task."""
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+    async def assign(self, record):
+        """
+        Returns the cluster of one RFM record.
+
+        Args:
+            record (dict): Recency, Frequency and Monetary (or Monetary_log).
+
+        Returns:
+            int: Cluster label.
+
+        Raises:
+            ValueError: If the record is invalid (see `record_features`, which also
+                        raises KeyError and TypeError); only this call fails, as the
+                        record is rejected before it joins a batch.
+        """
+        features = record_features(record)
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((features, future))
+        return await future
+
+    async def _run(self):
+        """Collects and scores batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            # Let callers that are already scheduled enqueue their requests first
+            await asyncio.sleep(0)
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self._queue.get_nowait())
+
+            try:
+                labels = self.assigner.assign([features for features, _ in batch])
+                for (_, future), label in zip(batch, labels.tolist()):
+                    if not future.done():
+                        future.set_result(label)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                self.batches += 1
+                self.scored += len(batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+
+async def serve(scorer, host="127.0.0.1", port=8765):
+    """
+    Serves cluster assignments as JSON lines over TCP until cancelled.
+
+    Args:
+        scorer (MicroBatchScorer): Started scorer shared by all connections.
+        host (str): Interface to listen on.
+        port (int): TCP port.
+    """
+
+    async def handle(reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    cluster = await scorer.assign(json.loads(line))
+                    response = {RFM["CLUSTER"]: cluster}
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {"error": f"Invalid request: {e}"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+async def _main(args):
+    assigner = ClusterAssigner.from_artifacts(args.model, args.scaler)
+    async with MicroBatchScorer(
+        assigner, args.max_batch_size, args.max_delay
+    ) as scorer:
+        print(f"Serving cluster assignments on {args.host}:{args.port}.")
+        await serve(scorer, args.host, args.port)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve KMeans cluster assignments with request micro-batching."
+    )
+    parser.add_argument("--model", default=KMEANS_MODEL_PATH)
+    parser.add_argument("--scaler", default=SCALER_PATH)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE)
+    parser.add_argument("--max-delay", type=float, default=MAX_DELAY_SECONDS)
+    asyncio.run(_main(parser.parse_args()))
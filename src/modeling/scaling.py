@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from utils.constants import RFM, RFM_FEATURES, SCALED_FEATURES
+
+
+def scale_rfm_features(rfm, scaler=None):
+    """
+    Standardizes the RFM features used for clustering.
+
+    Args:
+        rfm (pd.DataFrame): RFM table with Recency, Frequency and Monetary_log.
+        scaler (StandardScaler, optional): Already fitted scaler. If None, a new one is
+                                           fitted on `rfm`, as in the notebook.
+
+    Returns:
+        pd.DataFrame: Recency_scaled, Frequency_scaled and Monetary_scaled with the index of `rfm`.
+    """
+    features = rfm_feature_frame(rfm)
+    scaler = scaler or StandardScaler().fit(features)
+    scaled_values = scaler.transform(features)
+    return pd.DataFrame(scaled_values, index=rfm.index, columns=SCALED_FEATURES)
+
+
+def fit_rfm_scaler(rfm):
+    """Fits the StandardScaler of the clustering features on an RFM table."""
+    return StandardScaler().fit(rfm_feature_frame(rfm))
+
+
+def fit_scaler_streaming(chunks):
+    """
+    Fits a StandardScaler on RFM chunks with `partial_fit`, so the data never has to fit in memory.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): RFM chunks with Recency, Frequency and Monetary_log
+                                         (or Monetary).
+
+    Returns:
+        StandardScaler: Scaler with the same statistics as a fit on the concatenated chunks.
+    """
+    scaler = StandardScaler()
+    for chunk in chunks:
+        scaler.partial_fit(rfm_feature_frame(chunk))
+
+    if not hasattr(scaler, "mean_"):
+        raise ValueError("No RFM rows found to fit the scaler on.")
+    return scaler
+
+
+def rfm_feature_frame(rfm):
+    """Returns the Recency/Frequency/Monetary_log columns, deriving Monetary_log if absent."""
+    if RFM["MONETARY_LOG"] not in rfm.columns:
+        rfm = rfm.assign(**{RFM["MONETARY_LOG"]: np.log1p(rfm[RFM["MONETARY"]])})
+    return rfm[RFM_FEATURES]
@@ -0,0 +1,223 @@
+"""
+Batch scoring of RFM files with the persisted KMeans model.
+
+Run from the project root:
+    python -m src.modeling.scoring input.csv output.csv --workers 4
+"""
+
+import argparse
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import pandas as pd
+
+from src.data_preprocessing.create_dataframe import create_dataframe
+from utils.config import KMEANS_MODEL_PATH, SCALER_PATH
+from utils.constants import RFM, RFM_FEATURES, SCALED_FEATURES
+from utils.helpers import get_file_extension_from_path
+from .scaling import rfm_feature_frame
+
+# Rows read, scored and written per chunk
+DEFAULT_CHUNKSIZE = 100_000
+
+# Model and scaler loaded once per worker process by `_init_worker`
+_worker_state = {}
+
+
+def load_scoring_artifacts(model_path=KMEANS_MODEL_PATH, scaler_path=SCALER_PATH):
+    """
+    Loads the KMeans model and the StandardScaler fitted on its training RFM table.
+
+    The scaler is never refitted on the data being scored: the same customer has to get
+    the same scaled features, and therefore the same cluster, in every batch.
+
+    Args:
+        model_path (str): Path of the pickled KMeans model.
+        scaler_path (str, optional): Path of the pickled StandardScaler; SCALER_PATH if None.
+
+    Returns:
+        tuple: (model, scaler)
+
+    Raises:
+        FileNotFoundError: If the model or the scaler file does not exist.
+    """
+    scaler_path = scaler_path or SCALER_PATH
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"KMeans model not found at {model_path}.")
+    if not os.path.exists(scaler_path):
+        raise FileNotFoundError(
+            f"Scaler not found at {scaler_path}. Save the StandardScaler fitted with "
+            "the model (the notebook and src.pipeline.segmentation write it) instead "
+            "of refitting one on the data being scored."
+        )
+    return joblib.load(model_path), joblib.load(scaler_path)
+
+
+def score_file(
+    input_path,
+    output_path,
+    model_path=KMEANS_MODEL_PATH,
+    scaler_path=SCALER_PATH,
+    chunksize=DEFAULT_CHUNKSIZE,
+    workers=None,
+):
+    """
+    Assigns a cluster to every row of an RFM file and writes the labelled rows incrementally.
+
+    The input is streamed in chunks; only the three scaled features of each chunk are
+    sent to the worker processes, which hold the model and scaler loaded once. At most
+    two chunks per worker are in flight, so memory stays flat as the input grows.
+
+    Args:
+        input_path (str): RFM file (CSV or Parquet) with Recency, Frequency and
+                          Monetary_log (or Monetary).
+        output_path (str): Output file (CSV or Parquet), written in the layout of
+                           `data/rfm_with_clusters.csv` with a Cluster column.
+        model_path (str): Path of the pickled KMeans model.
+        scaler_path (str): Path of the StandardScaler fitted with the model.
+        chunksize (int): Rows per chunk.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count;
+                                 0 or 1 scores in the current process.
+
+    Returns:
+        int: Number of rows scored.
+    """
+    output_ext = get_file_extension_from_path(output_path)
+    if output_ext not in ["csv", "parquet"]:
+        raise ValueError(f"Unsupported output format: {output_ext}")
+
+    model, scaler = load_scoring_artifacts(model_path, scaler_path)
+
+    workers = os.cpu_count() if workers is None else workers
+    writer = _ChunkWriter(output_path, output_ext)
+    chunks = create_dataframe(input_path, chunksize=chunksize)
+    rows = 0
+
+    try:
+        if workers <= 1:
+            for chunk in chunks:
+                labels = predict_clusters(
+                    model, scaler, rfm_feature_frame(chunk).to_numpy()
+                )
+                rows += writer.write(chunk, labels)
+            return rows
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(model, scaler)
+        ) as pool:
+            pending = deque()
+            for chunk in chunks:
+                features = rfm_feature_frame(chunk).to_numpy()
+                pending.append((chunk, pool.submit(_predict_in_worker, features)))
+
+                # Bound the chunks in flight; results are written in input order
+                if len(pending) >= 2 * workers:
+                    chunk, future = pending.popleft()
+                    rows += writer.write(chunk, future.result())
+
+            while pending:
+                chunk, future = pending.popleft()
+                rows += writer.write(chunk, future.result())
+    finally:
+        writer.close()
+
+    return rows
+
+
+def _init_worker(model, scaler):
+    """Keeps the model and scaler in the worker process for all its tasks."""
+    _worker_state["model"] = model
+    _worker_state["scaler"] = scaler
+
+
+def _predict_in_worker(features):
+    """Scores a feature array with the worker's model and scaler."""
+    return predict_clusters(_worker_state["model"], _worker_state["scaler"], features)
+
+
+def predict_clusters(model, scaler, features):
+    """
+    Scales raw RFM features with the training scaler and returns the cluster labels.
+
+    Args:
+        model (KMeans): Fitted KMeans model.
+        scaler (StandardScaler): Scaler fitted on the model's training RFM table.
+        features (np.ndarray): Recency, Frequency and Monetary_log per row.
+
+    Returns:
+        np.ndarray: Cluster label of every row.
+    """
+    features = pd.DataFrame(features, columns=RFM_FEATURES)
+    scaled = pd.DataFrame(scaler.transform(features), columns=SCALED_FEATURES)
+    return model.predict(scaled)
+
+
+class _ChunkWriter:
+    """Appends labelled chunks to a CSV or Parquet file."""
+
+    def __init__(self, path, file_ext):
+        self.path = path
+        self.file_ext = file_ext
+        self.parquet_writer = None
+        self.started = False
+
+    def write(self, chunk, labels):
+        """Writes one chunk with its Cluster column and returns the number of rows written."""
+        chunk = chunk.assign(**{RFM["CLUSTER"]: labels})
+
+        if self.file_ext == "csv":
+            chunk.to_csv(
+                self.path,
+                mode="a" if self.started else "w",
+                header=not self.started,
+                index=False,
+            )
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self.parquet_writer is None:
+                self.parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self.parquet_writer.write_table(table.cast(self.parquet_writer.schema))
+
+        self.started = True
+        return len(chunk)
+
+    def close(self):
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Assign KMeans clusters to an RFM file in streamed chunks."
+    )
+    parser.add_argument("input_path", help="RFM file to score (CSV or Parquet).")
+    parser.add_argument("output_path", help="Labelled output file (CSV or Parquet).")
+    parser.add_argument(
+        "--model", default=KMEANS_MODEL_PATH, help="Pickled KMeans model."
+    )
+    parser.add_argument(
+        "--scaler", default=SCALER_PATH, help="Pickled StandardScaler of the model."
+    )
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    rows = score_file(
+        args.input_path,
+        args.output_path,
+        model_path=args.model,
+        scaler_path=args.scaler,
+        chunksize=args.chunksize,
+        workers=args.workers,
+    )
+    print(f"Scored {rows} rows into {args.output_path}.")
+
+
+if __name__ == "__main__":
+    main()
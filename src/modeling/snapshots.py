@@ -0,0 +1,127 @@
+"""
+RFM snapshots at a series of reference dates, optionally scored with the saved model.
+
+Run from the project root:
+    python -m src.modeling.snapshots data/data.csv outputs/snapshots --model models/kmeans_rfm_model.pkl
+"""
+
+import argparse
+import os
+
+import pandas as pd
+
+from src.data_preprocessing.create_dataframe import create_dataframe
+from src.features.rfm_snapshots import iter_rfm_snapshots
+from utils.config import SCALER_PATH
+from utils.constants import RFM, TRANSACTIONS
+from .scaling import rfm_feature_frame
+from .scoring import load_scoring_artifacts, predict_clusters
+
+
+def write_rfm_snapshots(
+    df,
+    reference_dates,
+    output_dir,
+    model_path=None,
+    scaler_path=SCALER_PATH,
+    file_format="parquet",
+    date_format=None,
+):
+    """
+    Writes one RFM file per reference date, each as soon as it is produced, so only
+    one snapshot is held in memory.
+
+    Args:
+        df (pd.DataFrame): Cleaned transactions (see `iter_rfm_snapshots`).
+        reference_dates (Iterable): Snapshot dates, e.g. `month_starts(df)`.
+        output_dir (str): Directory of the snapshot files (`rfm_YYYY-MM-DD.<format>`).
+        model_path (str, optional): Pickled KMeans model; when given, every snapshot gets
+                                    a Cluster column.
+        scaler_path (str): Pickled StandardScaler the model was trained with. It is
+                           never refitted here: a scaler fitted on all transactions
+                           would scale every historical snapshot with future data.
+        file_format (str): 'parquet' or 'csv'.
+        date_format (str, optional): Format used to parse InvoiceDate if it is text.
+
+    Returns:
+        list: Paths of the written snapshots, in date order.
+    """
+    if file_format not in ["csv", "parquet"]:
+        raise ValueError(f"Unsupported output format: {file_format}")
+
+    model = scaler = None
+    if model_path is not None:
+        model, scaler = load_scoring_artifacts(model_path, scaler_path)
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for reference_date, rfm in iter_rfm_snapshots(df, reference_dates, date_format):
+        if model is not None and len(rfm):
+            features = rfm_feature_frame(rfm).to_numpy()
+            rfm[RFM["CLUSTER"]] = predict_clusters(model, scaler, features)
+
+        path = os.path.join(output_dir, f"rfm_{reference_date:%Y-%m-%d}.{file_format}")
+        if file_format == "csv":
+            rfm.to_csv(path, index=True)
+        else:
+            rfm.to_parquet(path)
+        paths.append(path)
+
+    return paths
+
+
+def month_starts(df, date_format=None):
+    """
+    Reference dates of month-end snapshots: the first day of every month after the
+    first purchase, up to the one after the last purchase.
+
+    Returns:
+        pd.DatetimeIndex: Month starts.
+    """
+    dates = df[TRANSACTIONS["INVOICE_DATE"]]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format=date_format)
+    first = dates.min().to_period("M").to_timestamp() + pd.offsets.MonthBegin(1)
+    last = dates.max().to_period("M").to_timestamp() + pd.offsets.MonthBegin(1)
+    return pd.date_range(first, last, freq="MS")
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Write RFM snapshots at every month end, optionally with clusters."
+    )
+    parser.add_argument("data_url", help="Cleaned transactions file or store.")
+    parser.add_argument("output_dir", help="Directory of the snapshot files.")
+    parser.add_argument("--model", default=None, help="Pickled KMeans model.")
+    parser.add_argument(
+        "--scaler",
+        default=SCALER_PATH,
+        help="Pickled StandardScaler the model was trained with.",
+    )
+    parser.add_argument("--format", default="parquet", choices=["csv", "parquet"])
+    parser.add_argument("--date-format", default=None)
+    parser.add_argument(
+        "--dates",
+        nargs="+",
+        default=None,
+        help="Reference dates; month starts if omitted.",
+    )
+    args = parser.parse_args(argv)
+
+    df = create_dataframe(args.data_url)
+    reference_dates = args.dates or month_starts(df, args.date_format)
+    paths = write_rfm_snapshots(
+        df,
+        reference_dates,
+        args.output_dir,
+        model_path=args.model,
+        scaler_path=args.scaler,
+        file_format=args.format,
+        date_format=args.date_format,
+    )
+    print(f"Wrote {len(paths)} snapshots to {args.output_dir}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import hashlib
+import inspect
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from utils.config import PIPELINE_DIR, PROJECT_ROOT
+
+# Artifact file extension per output type; anything else is pickled with joblib
+PARQUET, NPZ, PICKLE = "parquet", "npz", "pkl"
+
+# Packages whose sources make up the code version of every stage key
+CODE_DIRS = [os.path.join(PROJECT_ROOT, "src"), os.path.join(PROJECT_ROOT, "utils")]
+
+
+class Stage:
+    """One node of a `Pipeline`: a function of the outputs of its input stages."""
+
+    def __init__(
+        self, name, func, inputs=(), params=None, fingerprint=None, version=None
+    ):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.params = dict(params or {})
+        self.fingerprint = fingerprint
+        self.version = version
+
+
+class Pipeline:
+    """
+    DAG of stages whose outputs are cached as artifacts keyed by upstream hashes.
+
+    A stage's key hashes its name, the source of its function, its parameters, an
+    optional external fingerprint (e.g. of an input file), an optional stage version,
+    the keys of its inputs and the pipeline's code version. Editing a stage or its
+    upstream invalidates it and everything downstream.
+
+    The stage function's own source does not cover the functions it calls (such as
+    `compute_rfm`), so the code version hashes every Python file under CODE_DIRS
+    (`src/` and `utils/`) by default: any code change re-runs all stages. Pass a
+    fixed `code_version` to opt out, and bump a stage's `version` to invalidate it
+    for changes outside those directories (e.g. a library upgrade).
+
+    Outputs are saved as Parquet (DataFrames), NPZ (arrays or dicts of arrays) or
+    joblib pickles (e.g. fitted models). On a re-run, stages whose artifact exists
+    are skipped and only loaded when a stage that has to run needs them.
+
+    Stages whose inputs are ready run concurrently in a thread pool, so independent
+    branches (such as the post-clustering aggregations) overlap.
+    """
+
+    def __init__(self, artifact_dir=PIPELINE_DIR, code_version=None):
+        self.artifact_dir = artifact_dir
+        self.code_version = (
+            source_version(CODE_DIRS) if code_version is None else code_version
+        )
+        self.stages = {}
+
+    def add_stage(
+        self, name, func, inputs=(), params=None, fingerprint=None, version=None
+    ):
+        """
+        Adds a stage. `func` is called with the input outputs as positional arguments
+        (in the order of `inputs`) and `params` as keyword arguments.
+
+        Args:
+            name (str): Unique stage name.
+            func (callable): The stage function.
+            inputs (list): Names of the stages whose outputs it takes; must already exist.
+            params (dict, optional): Keyword arguments, part of the stage key.
+            fingerprint (callable, optional): Returns a string identifying external
+                                              state the stage reads (e.g. a file).
+            version (str, optional): Bumped by hand to invalidate the stage's artifacts.
+
+        Returns:
+            Pipeline: The pipeline, for chaining.
+        """
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' is already defined.")
+        missing = [stage for stage in inputs if stage not in self.stages]
+        if missing:
+            raise ValueError(f"Unknown input stages for '{name}': {', '.join(missing)}")
+
+        self.stages[name] = Stage(name, func, inputs, params, fingerprint, version)
+        return self
+
+    def keys(self):
+        """Returns the artifact key of every stage."""
+        keys = {}
+        for name, stage in self.stages.items():
+            digest = hashlib.sha1(name.encode())
+            digest.update(self.code_version.encode())
+            digest.update(_source_of(stage.func).encode())
+            digest.update(repr(sorted(stage.params.items())).encode())
+            digest.update(repr(stage.version).encode())
+            if stage.fingerprint is not None:
+                digest.update(stage.fingerprint().encode())
+            for upstream in stage.inputs:
+                digest.update(keys[upstream].encode())
+            keys[name] = digest.hexdigest()[:16]
+        return keys
+
+    def run(self, targets=None, force=False, workers=None):
+        """
+        Produces the outputs of `targets` and everything they depend on.
+
+        Args:
+            targets (list, optional): Stages to produce; all stages if None.
+            force (bool): Recompute every required stage, ignoring existing artifacts.
+            workers (int, optional): Threads for concurrent stages; defaults to the CPU count.
+
+        Returns:
+            dict: Stage name -> output for the targets, and 'executed' with the names of
+                  the stages that actually ran (the rest came from artifacts).
+        """
+        targets = list(self.stages) if targets is None else list(targets)
+        keys = self.keys()
+        os.makedirs(self.artifact_dir, exist_ok=True)
+
+        # Stages that must run: missing artifacts, walking up only where needed
+        to_run = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in to_run:
+                continue
+            if force or self._artifact_path(name, keys[name]) is None:
+                to_run.add(name)
+                stack.extend(self.stages[name].inputs)
+
+        values = {}
+        executed = []
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            running = {}
+            while to_run or running:
+                ready = [
+                    name
+                    for name in self.stages
+                    if name in to_run
+                    and not any(
+                        upstream in to_run for upstream in self.stages[name].inputs
+                    )
+                    and name not in running.values()
+                ]
+                for name in ready:
+                    stage = self.stages[name]
+                    args = [
+                        self._value(upstream, keys, values) for upstream in stage.inputs
+                    ]
+                    running[pool.submit(stage.func, *args, **stage.params)] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    values[name] = future.result()
+                    self._save(name, keys[name], values[name])
+                    to_run.discard(name)
+                    executed.append(name)
+
+        outputs = {name: self._value(name, keys, values) for name in targets}
+        outputs["executed"] = executed
+        return outputs
+
+    def _value(self, name, keys, values):
+        """Returns a stage's output from memory or its artifact."""
+        if name not in values:
+            values[name] = self._load(self._artifact_path(name, keys[name]))
+        return values[name]
+
+    def _artifact_path(self, name, key):
+        """Path of an existing artifact for the stage and key, or None."""
+        for file_ext in [PARQUET, NPZ, PICKLE]:
+            path = os.path.join(self.artifact_dir, f"{name}-{key}.{file_ext}")
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _save(self, name, key, value):
+        """Writes an output atomically in the format matching its type."""
+        if isinstance(value, pd.DataFrame):
+            file_ext = PARQUET
+        elif isinstance(value, np.ndarray) or (
+            isinstance(value, dict)
+            and value
+            and all(isinstance(v, np.ndarray) for v in value.values())
+        ):
+            file_ext = NPZ
+        else:
+            file_ext = PICKLE
+
+        path = os.path.join(self.artifact_dir, f"{name}-{key}.{file_ext}")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            if file_ext == PARQUET:
+                value.to_parquet(f)
+            elif file_ext == NPZ:
+                arrays = value if isinstance(value, dict) else {"array": value}
+                np.savez(f, **arrays)
+            else:
+                joblib.dump(value, f)
+        os.replace(tmp_path, path)
+
+    def _load(self, path):
+        """Reads an artifact written by `_save`."""
+        if path.endswith(PARQUET):
+            return pd.read_parquet(path)
+        if path.endswith(NPZ):
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+            return arrays["array"] if list(arrays) == ["array"] else arrays
+        return joblib.load(path)
+
+
+def source_version(paths):
+    """
+    Hash of the Python sources under `paths`: relative file names and contents, in a
+    stable order, so it changes with any edit, including uncommitted ones.
+
+    Args:
+        paths (list): Directories to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha1()
+    for path in paths:
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for file_name in sorted(files):
+                if not file_name.endswith(".py"):
+                    continue
+                file_path = os.path.join(root, file_name)
+                digest.update(os.path.relpath(file_path, PROJECT_ROOT).encode())
+                with open(file_path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _source_of(func):
+    """Source code of a function, or its qualified name if the source is unavailable."""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return f"{func.__module__}.{func.__qualname__}"
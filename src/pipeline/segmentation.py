@@ -0,0 +1,241 @@
+"""
+End-to-end customer segmentation as a cached pipeline, without the notebook.
+
+Run from the project root:
+    python -m src.pipeline.segmentation --data data/data.csv --output-dir data
+
+Stages (see `build_segmentation_pipeline`):
+    load -> clean -> transform -> rfm -> scaler -> scale -> kmeans -> clusters
+    -> row_clusters -> cluster_summary | top_products | top_countries | cluster_kpis
+"""
+
+import argparse
+import os
+
+import joblib
+import pandas as pd
+from sklearn.cluster import KMeans
+
+from src.data_preprocessing.create_dataframe import create_dataframe
+from src.eda.outliers.transformations import best_transformation_with_outliers
+from src.eda.skewness.analyze_skewness import analyze_skewness
+from src.features.rfm import compute_rfm
+from src.modeling.cluster_analytics import (
+    TOP_N,
+    cluster_kpis,
+    row_clusters,
+    top_countries,
+    top_products,
+)
+from src.modeling.scaling import fit_rfm_scaler, scale_rfm_features
+from utils.config import (
+    DATA_DIR,
+    DATA_PATH,
+    KMEANS_MODEL_PATH,
+    PIPELINE_DIR,
+    SCALER_PATH,
+)
+from utils.constants import RFM, TRANSACTIONS
+from utils.helpers import get_file_fingerprint
+from .runner import Pipeline
+
+# Format of InvoiceDate in the Online Retail CSV
+DATE_FORMAT = "%m/%d/%y %H:%M"
+
+# Text columns read as strings, so chunks of digit-only codes are not parsed as numbers
+TEXT_COLUMNS = [
+    TRANSACTIONS["INVOICE_NO"],
+    TRANSACTIONS["STOCK_CODE"],
+    TRANSACTIONS["DESCRIPTION"],
+    TRANSACTIONS["COUNTRY"],
+]
+
+# Stage outputs written by the command line entry point
+OUTPUT_STAGES = [
+    "clusters",
+    "cluster_summary",
+    "top_products",
+    "top_countries",
+    "cluster_kpis",
+]
+
+
+def load_transactions(data_path):
+    """Reads the raw transactions."""
+    return create_dataframe(data_path, dtype={column: str for column in TEXT_COLUMNS})
+
+
+def clean_transactions(df, date_format=DATE_FORMAT):
+    """
+    Cleans the transactions as in the notebook: drops rows without CustomerID and
+    duplicate rows, fills missing descriptions, parses InvoiceDate and keeps positive
+    quantities and prices.
+    """
+    df = df.dropna(subset=[TRANSACTIONS["CUSTOMER_ID"]])
+    df = df.fillna({TRANSACTIONS["DESCRIPTION"]: "Unknown"})
+    df = df.drop_duplicates()
+    df[TRANSACTIONS["INVOICE_DATE"]] = pd.to_datetime(
+        df[TRANSACTIONS["INVOICE_DATE"]], format=date_format
+    )
+    return df[(df[TRANSACTIONS["QUANTITY"]] > 0) & (df[TRANSACTIONS["UNIT_PRICE"]] > 0)]
+
+
+def transform_transactions(df):
+    """
+    Applies the skewness-based transformations with outlier transformation and adds
+    TotalPrice, as in the notebook.
+    """
+    columns = [column for column in df.columns if column != TRANSACTIONS["CUSTOMER_ID"]]
+    skewness = analyze_skewness(df, columns, plot=False)
+    df, _ = best_transformation_with_outliers(
+        df, skewness, handle_outliers=True, method="transform"
+    )
+    df[TRANSACTIONS["TOTAL_PRICE"]] = (
+        df[TRANSACTIONS["QUANTITY"]] * df[TRANSACTIONS["UNIT_PRICE"]]
+    )
+    return df
+
+
+def fit_kmeans(scaled, n_clusters=3):
+    """Fits the final KMeans model on the scaled RFM features."""
+    return KMeans(n_clusters=n_clusters, random_state=42, n_init=10).fit(scaled)
+
+
+def assign_clusters(rfm, model):
+    """Returns the RFM table with the Cluster label of every customer."""
+    return rfm.assign(**{RFM["CLUSTER"]: model.labels_})
+
+
+def summarize_clusters(clusters):
+    """Mean Recency, Frequency and Monetary and the customer count per cluster."""
+    return (
+        clusters.groupby(RFM["CLUSTER"])
+        .agg(
+            Recency_mean=(RFM["RECENCY"], "mean"),
+            Frequency_mean=(RFM["FREQUENCY"], "mean"),
+            Monetary_mean=(RFM["MONETARY"], "mean"),
+            Count=(RFM["MONETARY"], "count"),
+        )
+        .reset_index()
+    )
+
+
+def build_segmentation_pipeline(
+    data_path=DATA_PATH,
+    n_clusters=3,
+    date_format=DATE_FORMAT,
+    top_n=TOP_N,
+    artifact_dir=PIPELINE_DIR,
+):
+    """
+    Builds the notebook's segmentation flow as a `Pipeline`.
+
+    The load stage is keyed by the input file's fingerprint, so a changed data file
+    re-runs everything while an unchanged one is served from the artifacts. The four
+    aggregations after clustering only depend on upstream stages and run concurrently.
+
+    Args:
+        data_path (str): Transactions file (any format `create_dataframe` reads).
+        n_clusters (int): Number of KMeans clusters.
+        date_format (str, optional): Format of InvoiceDate; None lets pandas infer it.
+        top_n (int): Number of products and countries kept per cluster.
+        artifact_dir (str): Directory of the stage artifacts.
+
+    Returns:
+        Pipeline: The segmentation pipeline.
+    """
+    pipeline = Pipeline(artifact_dir)
+    pipeline.add_stage(
+        "load",
+        load_transactions,
+        params={"data_path": os.path.abspath(data_path)},
+        fingerprint=lambda: get_file_fingerprint(data_path),
+    )
+    pipeline.add_stage(
+        "clean", clean_transactions, ["load"], params={"date_format": date_format}
+    )
+    pipeline.add_stage("transform", transform_transactions, ["clean"])
+    pipeline.add_stage("rfm", compute_rfm, ["transform"])
+    pipeline.add_stage("scaler", fit_rfm_scaler, ["rfm"])
+    pipeline.add_stage("scale", scale_rfm_features, ["rfm", "scaler"])
+    pipeline.add_stage(
+        "kmeans", fit_kmeans, ["scale"], params={"n_clusters": n_clusters}
+    )
+    pipeline.add_stage("clusters", assign_clusters, ["rfm", "kmeans"])
+    pipeline.add_stage("row_clusters", row_clusters, ["transform", "clusters"])
+
+    pipeline.add_stage("cluster_summary", summarize_clusters, ["clusters"])
+    pipeline.add_stage(
+        "top_products",
+        top_products,
+        ["transform", "row_clusters"],
+        params={"top_n": top_n},
+    )
+    pipeline.add_stage(
+        "top_countries",
+        top_countries,
+        ["transform", "row_clusters"],
+        params={"top_n": top_n},
+    )
+    pipeline.add_stage("cluster_kpis", cluster_kpis, ["transform", "row_clusters"])
+    return pipeline
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run the customer segmentation pipeline with cached stages."
+    )
+    parser.add_argument("--data", default=DATA_PATH, help="Transactions file.")
+    parser.add_argument(
+        "--output-dir", default=DATA_DIR, help="Directory of the CSV outputs."
+    )
+    parser.add_argument(
+        "--model", default=KMEANS_MODEL_PATH, help="Where to save the KMeans model."
+    )
+    parser.add_argument(
+        "--scaler",
+        default=SCALER_PATH,
+        help="Where to save the StandardScaler the model was trained with.",
+    )
+    parser.add_argument("--clusters", type=int, default=3)
+    parser.add_argument(
+        "--date-format",
+        default=DATE_FORMAT,
+        help="Format of InvoiceDate; pass '' to let pandas infer it.",
+    )
+    parser.add_argument("--artifact-dir", default=PIPELINE_DIR)
+    parser.add_argument("--force", action="store_true", help="Re-run every stage.")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    pipeline = build_segmentation_pipeline(
+        args.data,
+        n_clusters=args.clusters,
+        date_format=args.date_format or None,
+        artifact_dir=args.artifact_dir,
+    )
+    outputs = pipeline.run(
+        OUTPUT_STAGES + ["kmeans", "scaler"], force=args.force, workers=args.workers
+    )
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    outputs["clusters"].to_csv(os.path.join(args.output_dir, "rfm_with_clusters.csv"))
+    for name in OUTPUT_STAGES[1:]:
+        outputs[name].to_csv(os.path.join(args.output_dir, f"{name}.csv"), index=False)
+
+    # The scaler is saved with the model so scoring reuses the training statistics
+    for path, name in [(args.model, "kmeans"), (args.scaler, "scaler")]:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        joblib.dump(outputs[name], path)
+
+    executed = ", ".join(outputs["executed"]) or "none (all cached)"
+    print(f"Stages run: {executed}.")
+    print(
+        f"Wrote outputs to {args.output_dir}, the model to {args.model} "
+        f"and the scaler to {args.scaler}."
+    )
+
+
+if __name__ == "__main__":
+    main()
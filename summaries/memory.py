@@ -0,0 +1,35 @@
+from utils.constants import MEMORY_REPORT
+from utils.memory import format_bytes
+from utils.summary_constants import MemoryConstants
+
+
+def memory_step(report):
+    """
+    Generates a memory usage summary from a dtype compaction report.
+
+    Args:
+        report (dict): The report returned by `compact_dtypes`.
+
+    Returns:
+        str: Memory summary.
+    """
+    if not report:
+        return MemoryConstants.MEMORY_NOT_FOUND
+
+    before = report[MEMORY_REPORT["TOTAL_BEFORE"]]
+    after = report[MEMORY_REPORT["TOTAL_AFTER"]]
+    savings = (1 - after / before) * 100 if before else 0.0
+
+    details = report[MEMORY_REPORT["DETAILS"]].copy()
+    details["MemoryBefore"] = details["MemoryBefore"].map(format_bytes)
+    details["MemoryAfter"] = details["MemoryAfter"].map(format_bytes)
+
+    summary = [
+        MemoryConstants.TOTALS.format(
+            BEFORE=format_bytes(before), AFTER=format_bytes(after), SAVINGS=savings
+        ),
+        MemoryConstants.DETAILS,
+        details.to_string(index=False),
+    ]
+
+    return "\n".join(summary)
@@ -0,0 +1,55 @@
+import pandas as pd
+
+from utils.constants import PERFORMANCE_TRACE
+from utils.memory import format_bytes
+from utils.summary_constants import PerformanceConstants
+
+
+def performance_step(trace):
+    """
+    Generates a timing and memory summary from an instrumentation trace.
+
+    Args:
+        trace (list): Step records, e.g. `tracer.records` or the result of `load_trace`.
+
+    Returns:
+        str: Performance summary.
+    """
+    if not trace:
+        return PerformanceConstants.TRACE_NOT_FOUND
+
+    records = pd.DataFrame(trace)
+    top_level = records[records[PERFORMANCE_TRACE["DEPTH"]] == 0]
+
+    details = pd.DataFrame(
+        {
+            "Step": [
+                "  " * depth + step
+                for depth, step in zip(
+                    records[PERFORMANCE_TRACE["DEPTH"]],
+                    records[PERFORMANCE_TRACE["STEP"]],
+                )
+            ],
+            "Wall (s)": records[PERFORMANCE_TRACE["WALL"]].round(3),
+            "CPU (s)": records[PERFORMANCE_TRACE["CPU"]].round(3),
+            "Peak memory": records[PERFORMANCE_TRACE["PEAK_BYTES"]].map(format_bytes),
+            "Rows in": records[PERFORMANCE_TRACE["ROWS_IN"]].astype("Int64"),
+            "Rows out": records[PERFORMANCE_TRACE["ROWS_OUT"]].astype("Int64"),
+        }
+    )
+
+    summary = [
+        PerformanceConstants.TOTALS.format(
+            STEPS=len(records),
+            WALL=top_level[PERFORMANCE_TRACE["WALL"]].sum(),
+            CPU=top_level[PERFORMANCE_TRACE["CPU"]].sum(),
+        ),
+        PerformanceConstants.DETAILS,
+        # Left-align the step names so the nesting indentation stays visible
+        details.to_string(
+            index=False,
+            formatters={"Step": f"{{:<{details['Step'].str.len().max()}}}".format},
+        ),
+    ]
+
+    return "\n".join(summary)
@@ -1,7 +1,9 @@
 from .summary_factory import SummaryFactory
 from .overview import overview_step
+from .memory import memory_step
 from .observations import observations_step
 from .skewness import skewness_summary
+from .performance import performance_step
 
 from utils.constants import SUMMARIES
 
@@ -10,8 +12,10 @@ summary_factory = SummaryFactory()
 
 # Register summary steps
 summary_factory.register_step(SUMMARIES["OVERVIEW"], overview_step)
+summary_factory.register_step(SUMMARIES["MEMORY"], memory_step)
 summary_factory.register_step(SUMMARIES["OBSERVATIONS"], observations_step)
 summary_factory.register_step(SUMMARIES["SKEWNESS"], skewness_summary)
+summary_factory.register_step(SUMMARIES["PERFORMANCE"], performance_step)
 
 # Expose factory for use in other modules
 __all__ = ["summary_factory"]
@@ -0,0 +1,36 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Make `src` and `utils` importable when pytest is run from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import notebook_reference, synthetic_retail  # noqa: E402
+
+
+@pytest.fixture
+def make_transactions():
+    """
+    Factory of synthetic Online Retail transactions with a TotalPrice column
+    (see `benchmarks.synthetic_retail`).
+
+    The factory takes `rows`, `seed` and `missing_invoices`, the share of rows whose
+    InvoiceNo is set to None.
+    """
+
+    def factory(rows=20_000, seed=0, missing_invoices=0.0):
+        df = synthetic_retail.generate_transactions(rows, seed, total_price=True)
+        if missing_invoices:
+            missing = np.random.default_rng(seed).random(rows) < missing_invoices
+            df.loc[missing, "InvoiceNo"] = None
+        return df
+
+    return factory
+
+
+@pytest.fixture
+def notebook_rfm():
+    """The RFM aggregation as written in the notebook, to check against."""
+    return notebook_reference.notebook_rfm
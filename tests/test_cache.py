@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.cache import (
+    ResultCache,
+    cached_result,
+    dataframe_fingerprint,
+    value_nbytes,
+)
+
+
+def make_frame(rows=10_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"a": rng.random(rows), "b": rng.integers(0, 9, rows)})
+
+
+def memory_cache(max_memory_bytes):
+    return ResultCache().configure(max_memory_bytes=max_memory_bytes, cache_dir=None)
+
+
+def test_memory_tier_is_bounded_in_bytes():
+    frame_bytes = value_nbytes(make_frame())
+    cache = memory_cache(int(2.5 * frame_bytes))
+    for key in ["x", "y", "z"]:
+        cache.put(key, make_frame())
+
+    assert list(cache.memory) == ["y", "z"]
+    assert cache.memory_bytes == 2 * frame_bytes <= cache.max_memory_bytes
+    assert cache.get("x") == (False, None)
+
+
+def test_value_larger_than_memory_tier_is_not_kept():
+    cache = memory_cache(1_000)
+    cache.put("x", make_frame())
+    assert not cache.memory and cache.memory_bytes == 0
+
+
+def test_value_nbytes_counts_nested_frames_deeply():
+    df = make_frame().assign(text=pd.Series(["some text"] * 10_000, dtype=object))
+    values = df["a"].to_numpy()
+    nbytes = value_nbytes({"frame": df, "parts": (df["text"], values)})
+
+    deep = df.memory_usage(deep=True).sum() + df["text"].memory_usage(deep=True)
+    assert deep + values.nbytes <= nbytes < deep + values.nbytes + 1_000
+    assert df.memory_usage(deep=True).sum() > df.memory_usage().sum()
+
+
+def test_hits_share_data_without_leaking_mutations():
+    cache = memory_cache(10 * 1024**2)
+    df = make_frame()
+    expected = df.copy()
+    cache.put("x", {"frame": df, "values": df["a"].to_numpy()})
+
+    # Changing the caller's original does not change the cached result
+    df.loc[0, "a"] = -1.0
+    _, first = cache.get("x")
+    pd.testing.assert_frame_equal(first["frame"], expected)
+
+    # Hits are not deep copies, and changing one does not change the next hit
+    _, second = cache.get("x")
+    assert np.shares_memory(
+        first["frame"]["a"].to_numpy(), second["frame"]["a"].to_numpy()
+    )
+    first["frame"].loc[0, "a"] = -2.0
+    _, third = cache.get("x")
+    pd.testing.assert_frame_equal(third["frame"], expected)
+
+    with pytest.raises(ValueError):
+        third["values"][0] = -3.0
+
+
+def test_cached_result_decorator_serves_hits():
+    cache = memory_cache(10 * 1024**2)
+    calls = []
+
+    @cached_result(cache)
+    def column_means(df):
+        calls.append(1)
+        return df.mean()
+
+    df = make_frame()
+    pd.testing.assert_series_equal(column_means(df), column_means(df))
+    assert len(calls) == 1 and cache.hits == 1
+
+
+def test_fingerprint_hashes_every_row_by_default():
+    df = pd.DataFrame({"a": np.arange(100_000, dtype="float64")})
+    edited = df.copy()
+    # Falls between the blocks a 16 x 1024-row sample would hash
+    edited.loc[3_000, "a"] = -1.0
+
+    assert dataframe_fingerprint(edited) != dataframe_fingerprint(df)
+    assert dataframe_fingerprint(edited, blocks=16) == dataframe_fingerprint(
+        df, blocks=16
+    )
+
+
+def test_cached_result_sees_edits_outside_sampled_blocks():
+    cache = memory_cache(10 * 1024**2)
+
+    @cached_result(cache)
+    def column_sums(df):
+        return df.sum()
+
+    df = pd.DataFrame({"a": np.ones(100_000)})
+    column_sums(df)
+    edited = df.copy()
+    edited.loc[3_000, "a"] = 2.0
+
+    assert column_sums(edited)["a"] == 100_001.0
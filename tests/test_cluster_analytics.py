@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from src.modeling.cluster_analytics import top_countries
+
+
+def test_top_countries_does_not_count_missing_invoices():
+    rng = np.random.default_rng(0)
+    rows = 2_000
+    df = pd.DataFrame(
+        {
+            "InvoiceNo": rng.integers(0, 300, rows).astype(str).astype(object),
+            "Country": rng.choice(["UK", "France", "Germany", "Spain"], rows),
+            "Quantity": rng.integers(1, 5, rows),
+            "TotalPrice": rng.random(rows),
+        }
+    )
+    df.loc[rng.random(rows) < 0.2, "InvoiceNo"] = None
+    row_cluster = rng.integers(0, 3, rows)
+
+    result = top_countries(df, row_cluster, top_n=10)
+
+    expected = (
+        df.assign(Cluster=row_cluster)
+        .groupby(["Cluster", "Country"])["InvoiceNo"]
+        .nunique()
+    )
+    actual = result.set_index(["Cluster", "Country"])["Transactions"]
+    pd.testing.assert_series_equal(
+        actual.sort_index(), expected.sort_index(), check_names=False
+    )
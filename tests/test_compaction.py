@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from src.data_preprocessing.compaction import compact_dtypes
+from src.eda.correlation.analyze_correlation import analyze_correlation_matrix
+from src.eda.skewness.analyze_skewness import analyze_skewness
+
+COLUMNS = ["Quantity", "UnitPrice", "CustomerID"]
+
+
+def test_compact_dtypes_shrinks_numeric_columns(make_transactions):
+    df = make_transactions(rows=5_000)
+    compacted, _ = compact_dtypes(df, allow_precision_loss=True)
+
+    assert compacted["Quantity"].dtype.itemsize < 8
+    assert compacted["UnitPrice"].dtype == "float32"
+    assert isinstance(compacted["Country"].dtype, pd.CategoricalDtype)
+
+
+def test_skewness_keeps_compacted_numeric_columns(make_transactions, capsys):
+    df = make_transactions(rows=5_000)
+    compacted, _ = compact_dtypes(df, allow_precision_loss=True)
+
+    expected = analyze_skewness(df, COLUMNS, plot=False)
+    result = analyze_skewness(compacted, COLUMNS, plot=False)
+
+    assert "non-numeric" not in capsys.readouterr().out
+    assert set(result["skewness_values"]) == set(COLUMNS)
+    for col in COLUMNS:
+        assert np.isclose(
+            result["skewness_values"][col], expected["skewness_values"][col], atol=1e-4
+        )
+
+
+def test_correlation_keeps_compacted_numeric_columns(make_transactions, capsys):
+    df = make_transactions(rows=5_000)
+    compacted, _ = compact_dtypes(df, allow_precision_loss=True)
+
+    expected = analyze_correlation_matrix(df, COLUMNS, plot=False)
+    result = analyze_correlation_matrix(compacted, COLUMNS, plot=False)
+
+    assert "non-numeric" not in capsys.readouterr().out
+    assert list(result["correlation_matrix"].columns) == COLUMNS
+    np.testing.assert_allclose(
+        result["correlation_matrix"].to_numpy(),
+        expected["correlation_matrix"].to_numpy(),
+        atol=1e-4,
+    )
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.data_preprocessing.create_dataframe import create_dataframe
+
+
+def write_parts(directory):
+    paths = []
+    for i in range(2):
+        path = Path(directory) / f"part-{i}.csv"
+        pd.DataFrame({"a": [2 * i, 2 * i + 1]}).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def test_path_objects_are_read_like_strings(tmp_path):
+    first, second = write_parts(tmp_path)
+
+    assert create_dataframe(first)["a"].tolist() == [0, 1]
+    assert create_dataframe(str(first))["a"].tolist() == [0, 1]
+    chunks = create_dataframe(first, chunksize=1)
+    assert [chunk["a"].tolist() for chunk in chunks] == [[0], [1]]
+
+
+def test_lists_tuples_and_globs_read_several_files(tmp_path):
+    paths = write_parts(tmp_path)
+
+    for data_url in [paths, tuple(paths), str(tmp_path / "part-*.csv")]:
+        df = create_dataframe(data_url, workers=0)
+        assert df["a"].tolist() == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+@pytest.mark.parametrize("names", [("a", "b"), ("b", "a")])
+def test_globs_widen_files_like_concatenating_them(tmp_path, workers, names):
+    first, second = (tmp_path / f"{name}.csv" for name in names)
+    first.write_text("q\n1\n2\n")
+    second.write_text("q\n2.5\n3.7\n")
+
+    df = create_dataframe(str(tmp_path / "*.csv"), workers=workers)
+
+    expected = pd.concat(
+        [pd.read_csv(path) for path in sorted([first, second])], ignore_index=True
+    )
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def write_mixed_csv(path):
+    # Integers first, so the first chunk of two rows is parsed as int64
+    path.write_text("q,s\n1,a\n2,b\n3.5,c\n4.9,d\n")
+    return path
+
+
+def test_chunks_widen_instead_of_truncating(tmp_path):
+    path = write_mixed_csv(tmp_path / "mixed.csv")
+
+    chunks = list(create_dataframe(path, chunksize=2))
+
+    assert [chunk["q"].tolist() for chunk in chunks] == [[1, 2], [3.5, 4.9]]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), create_dataframe(path)
+    )
+
+
+def test_later_chunks_are_cast_to_the_first_dtype_when_lossless(tmp_path):
+    path = tmp_path / "floats.csv"
+    path.write_text("q\n1.5\n2.5\n3\n4\n")
+
+    chunks = list(create_dataframe(path, chunksize=2))
+
+    assert [str(chunk["q"].dtype) for chunk in chunks] == ["float64", "float64"]
+
+
+def test_parquet_cache_round_trips_a_widened_column(tmp_path, monkeypatch):
+    from src.data_preprocessing import create_dataframe as module
+
+    monkeypatch.setattr(module, "CACHE_CHUNKSIZE", 2)
+    path = write_mixed_csv(tmp_path / "mixed.csv")
+    cache_dir = tmp_path / "cache"
+
+    for _ in range(2):
+        cached = create_dataframe(path, use_cache=True, cache_dir=str(cache_dir))
+        pd.testing.assert_frame_equal(cached, create_dataframe(path), check_dtype=False)
+        assert cached["q"].tolist() == [1, 2, 3.5, 4.9]
+    assert len(list(cache_dir.iterdir())) == 1
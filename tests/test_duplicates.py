@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_preprocessing.duplicates import (
+    BloomFilter,
+    DuplicateDetector,
+    count_duplicates,
+    drop_duplicates_streaming,
+)
+
+
+def make_rows(rows=3_000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "InvoiceNo": rng.integers(0, 400, rows),
+            "UnitPrice": rng.choice([0.5, 1.25, np.nan], rows),
+            "Country": rng.choice(["United Kingdom", "France", None], rows),
+        }
+    )
+    # Whole-NaN rows repeat too
+    df.loc[::250, ["UnitPrice", "Country"]] = np.nan
+    return df
+
+
+def split(df, chunks=7):
+    """Uneven chunks, so duplicates span chunk boundaries."""
+    bounds = np.linspace(0, len(df), chunks + 1).astype(int)
+    return [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+@pytest.mark.parametrize("bloom_capacity", [None, 10_000])
+@pytest.mark.parametrize("columns", [None, ["InvoiceNo", "Country"]])
+def test_streaming_drop_matches_drop_duplicates(bloom_capacity, columns):
+    df = make_rows()
+
+    result = pd.concat(
+        drop_duplicates_streaming(split(df), columns, bloom_capacity=bloom_capacity)
+    )
+
+    pd.testing.assert_frame_equal(result, df.drop_duplicates(subset=columns))
+
+
+@pytest.mark.parametrize("bloom_capacity", [None, 10_000])
+@pytest.mark.parametrize("columns", [None, ["UnitPrice"]])
+def test_count_matches_duplicated(bloom_capacity, columns):
+    df = make_rows()
+    expected = int(df.duplicated(subset=columns).sum())
+
+    assert count_duplicates(df, columns, bloom_capacity) == expected
+    assert count_duplicates(split(df), columns, bloom_capacity) == expected
+
+
+def test_bloom_false_positives_never_drop_unique_rows():
+    df = make_rows()
+    # A filter far below the data's size answers "possibly seen" for most new rows
+    detector = DuplicateDetector(bloom_capacity=8, bloom_error=0.5)
+
+    kept = pd.concat(chunk[detector.update(chunk)] for chunk in split(df))
+
+    unseen = np.arange(1_000_000, 1_001_000, dtype="uint64")
+    assert detector.bloom.might_contain(unseen).mean() > 0.9
+    pd.testing.assert_frame_equal(kept, df.drop_duplicates())
+
+
+def test_bloom_filter_has_no_false_negatives():
+    keys = np.random.default_rng(1).integers(0, 2**63, 5_000).astype("uint64")
+    bloom = BloomFilter(capacity=1_000)
+
+    bloom.add(keys)
+
+    assert bloom.might_contain(keys).all()
+
+
+def test_merged_detectors_count_like_one_pass():
+    df = make_rows()
+    first, second = DuplicateDetector(), DuplicateDetector()
+    first.update(df.iloc[:1_000])
+    second.update(df.iloc[1_000:])
+
+    merged = first.merge(second)
+
+    assert merged.duplicates == int(df.duplicated().sum())
+    assert merged.unique_count == len(df.drop_duplicates())
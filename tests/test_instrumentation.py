@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda.outliers.transformations import best_transformation_with_outliers
+from utils.constants import PERFORMANCE_TRACE
+from utils.instrumentation import tracer
+from utils.memory import track_peak_memory
+
+SKEW_CATEGORIES = {
+    "high_skew": ["UnitPrice", "CustomerID"],
+    "moderate_skew": ["Quantity"],
+}
+
+
+@pytest.fixture
+def enabled_tracer():
+    tracer.clear()
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+    tracer.clear()
+
+
+def measured_peak(df):
+    result = best_transformation_with_outliers(
+        df, SKEW_CATEGORIES, memory_budget=1024**3
+    )
+    return result.attrs["peak_memory_bytes"]
+
+
+def test_tracer_does_not_change_the_memory_budget_peak(
+    make_transactions, enabled_tracer
+):
+    df = make_transactions(rows=500_000)
+    enabled_tracer.disable()
+    untraced = measured_peak(df)
+
+    enabled_tracer.enable()
+    traced = measured_peak(df)
+
+    # Only the tracer's own records are allocated on top
+    assert traced == pytest.approx(untraced, rel=0.01)
+    steps = [record[PERFORMANCE_TRACE["STEP"]] for record in enabled_tracer.records]
+    assert steps[0] == "best_transformation_with_outliers"
+    assert "apply_transformation" in steps
+
+
+def test_steps_inside_a_block_keep_its_peak(enabled_tracer):
+    with track_peak_memory() as memory:
+        buffer = np.ones(2_000_000)
+        del buffer
+        with enabled_tracer.step("inner"):
+            small = np.ones(1_000)
+            del small
+
+    assert memory["peak_bytes"] >= 16_000_000
+
+
+def test_blocks_inside_a_step_keep_its_peak(enabled_tracer):
+    with enabled_tracer.step("outer") as record:
+        with track_peak_memory() as first:
+            buffer = np.ones(2_000_000)
+            del buffer
+        with track_peak_memory() as second:
+            small = np.ones(1_000)
+            del small
+
+    assert first["peak_bytes"] >= 16_000_000
+    assert second["peak_bytes"] < 1_000_000
+    assert record[PERFORMANCE_TRACE["PEAK_BYTES"]] >= first["peak_bytes"]
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.modeling import k_selection
+from src.modeling.k_selection import evaluate_kmeans
+
+
+@pytest.fixture
+def features():
+    rng = np.random.default_rng(0)
+    centers = rng.normal(0.0, 5.0, (4, 3))
+    return np.concatenate([rng.normal(center, 1.0, (150, 3)) for center in centers])
+
+
+def test_parallel_and_serial_scores_are_identical(features):
+    kwargs = dict(k_values=range(2, 6), random_state=7, n_init=3)
+
+    serial = evaluate_kmeans(features, workers=0, **kwargs)
+    parallel = evaluate_kmeans(features, workers=2, **kwargs)
+
+    assert serial["k"].tolist() == [2, 3, 4, 5]
+    pd.testing.assert_frame_equal(parallel, serial, check_exact=True)
+
+
+def test_shared_memory_is_unlinked_when_a_worker_fails(features, monkeypatch):
+    created = []
+
+    class RecordingSharedMemory(k_selection.shared_memory.SharedMemory):
+        def __init__(self, *args, create=False, **kwargs):
+            super().__init__(*args, create=create, **kwargs)
+            if create:
+                created.append(self.name)
+
+    monkeypatch.setattr(
+        k_selection.shared_memory, "SharedMemory", RecordingSharedMemory
+    )
+
+    # More clusters than rows fails inside the worker
+    with pytest.raises(ValueError):
+        evaluate_kmeans(features[:5], k_values=[2, 10], workers=2, n_init=1)
+
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        k_selection.shared_memory.SharedMemory(name=created[0])
@@ -0,0 +1,54 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.modeling.online_scoring import (
+    ClusterAssigner,
+    MicroBatchScorer,
+    record_features,
+)
+from utils.config import RFM_CLUSTERS_PATH
+
+# The shipped model was pickled with an older scikit-learn
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"Recency": None, "Frequency": 1, "Monetary": 10.0},
+        {"Recency": 5, "Frequency": "many", "Monetary": 10.0},
+        {"Recency": 5, "Frequency": 1, "Monetary": float("inf")},
+        {"Recency": 5, "Frequency": 1, "Monetary": -1.0},
+    ],
+)
+def test_invalid_records_are_rejected(record):
+    with pytest.raises(ValueError):
+        record_features(record)
+
+
+def test_bad_request_fails_only_its_caller():
+    rfm = pd.read_csv(RFM_CLUSTERS_PATH).head(20)
+    records = rfm[["Recency", "Frequency", "Monetary"]].to_dict("records")
+    bad = {"Recency": None, "Frequency": 1, "Monetary": 10.0}
+    assigner = ClusterAssigner.from_artifacts()
+
+    async def score():
+        async with MicroBatchScorer(assigner) as scorer:
+            return await asyncio.gather(
+                *(
+                    scorer.assign(record)
+                    for record in [*records[:10], bad, *records[10:]]
+                ),
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(score())
+
+    assert isinstance(results.pop(10), ValueError)
+    assert results == rfm["Cluster"].tolist()
+    np.testing.assert_array_equal(
+        assigner.assign([record_features(record) for record in records]), results
+    )
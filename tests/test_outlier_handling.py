@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda.outliers.outlier_handling import handle_outliers_in_data
+
+
+def baseline_handle_outliers(df, columns, method, threshold=1.5):
+    """The per-column IQR loop that handle_outliers_in_data replaced."""
+    df_result = df.copy()
+    outliers_list = []
+    for col in columns:
+        Q1, Q3 = df[col].quantile([0.25, 0.75])
+        IQR = Q3 - Q1
+        lower, upper = Q1 - threshold * IQR, Q3 + threshold * IQR
+        outliers = df[(df[col] < lower) | (df[col] > upper)]
+        if not outliers.empty:
+            outliers_list.append(outliers)
+
+        if method == "remove":
+            df_result = df_result[(df_result[col] >= lower) & (df_result[col] <= upper)]
+        elif method == "flag":
+            df_result[f"{col}_outlier"] = (df_result[col] < lower) | (
+                df_result[col] > upper
+            )
+        else:
+            df_result[col] = df_result[col].clip(lower=lower, upper=upper)
+
+    df_outliers = (
+        pd.concat(outliers_list, ignore_index=True).drop_duplicates()
+        if outliers_list
+        else pd.DataFrame()
+    )
+    return df_result, df_outliers
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    rows = 2_000
+    df = pd.DataFrame(
+        {
+            "a": rng.lognormal(0.0, 1.0, rows),
+            "b": rng.normal(0.0, 1.0, rows),
+            "c": rng.standard_t(2, rows),
+            "label": rng.choice(["x", "y"], rows),
+        }
+    )
+    df.loc[rng.random(rows) < 0.05, "a"] = np.nan
+    df.loc[rng.random(rows) < 0.05, "c"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("method", ["remove", "flag", "transform"])
+def test_matches_per_column_iqr(frame, method):
+    columns = ["a", "b", "c"]
+    expected, expected_outliers = baseline_handle_outliers(frame, columns, method)
+
+    result, mask = handle_outliers_in_data(frame, columns, method=method)
+
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(
+        frame[mask].reset_index(drop=True).sort_values(columns, ignore_index=True),
+        expected_outliers.sort_values(columns, ignore_index=True),
+    )
+    assert mask.index.equals(frame.index)
+
+
+def test_defaults_to_numeric_columns_and_leaves_input_unchanged(frame):
+    original = frame.copy()
+    expected, _ = baseline_handle_outliers(frame, ["a", "b", "c"], "transform")
+
+    result, _ = handle_outliers_in_data(frame, method="transform")
+
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(frame, original)
@@ -0,0 +1,39 @@
+from src.pipeline import runner
+from src.pipeline.runner import Pipeline, source_version
+
+
+def double(x=1):
+    return x * 2
+
+
+def build(artifact_dir, code_version, version=None):
+    pipeline = Pipeline(artifact_dir, code_version=code_version)
+    return pipeline.add_stage("double", double, params={"x": 2}, version=version)
+
+
+def test_rerun_is_served_from_artifacts(tmp_path):
+    assert build(tmp_path, "v1").run()["executed"] == ["double"]
+    outputs = build(tmp_path, "v1").run()
+    assert outputs["executed"] == []
+    assert outputs["double"] == 4
+
+
+def test_code_version_invalidates_stages(tmp_path):
+    build(tmp_path, "v1").run()
+    assert build(tmp_path, "v2").run()["executed"] == ["double"]
+
+
+def test_stage_version_invalidates_stage(tmp_path):
+    build(tmp_path, "v1").run()
+    assert build(tmp_path, "v1", version=2).run()["executed"] == ["double"]
+
+
+def test_source_version_tracks_called_code(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "PROJECT_ROOT", str(tmp_path))
+    helper = tmp_path / "src" / "helper.py"
+    helper.parent.mkdir()
+    helper.write_text("def f():\n    return 1\n")
+    before = source_version([str(tmp_path / "src")])
+
+    helper.write_text("def f():\n    return 2\n")
+    assert source_version([str(tmp_path / "src")]) != before
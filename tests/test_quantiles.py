@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from utils.quantiles import (
+    ExactQuantiles,
+    KLLSketch,
+    QUANTILE_BACKENDS,
+    create_quantile_estimator,
+)
+
+QUANTILES = [0.25, 0.5, 0.75]
+
+
+def rank_error(sorted_values, estimate, q):
+    """Distance between `q` and the rank interval occupied by `estimate`."""
+    n = len(sorted_values)
+    low = np.searchsorted(sorted_values, estimate, side="left") / n
+    high = np.searchsorted(sorted_values, estimate, side="right") / n
+    return 0.0 if low <= q <= high else min(abs(low - q), abs(high - q))
+
+
+@pytest.mark.parametrize(
+    "backend, cls", [("exact", ExactQuantiles), ("kll", KLLSketch)]
+)
+def test_create_quantile_estimator_dispatch(backend, cls):
+    estimator = create_quantile_estimator(backend, 0.01)
+    assert isinstance(estimator, cls)
+    assert estimator.count == 0
+    assert np.isnan(estimator.quantile(0.5))
+
+
+def test_create_quantile_estimator_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="Unsupported quantile backend"):
+        create_quantile_estimator("tdigest")
+    assert set(QUANTILE_BACKENDS) == {"exact", "kll"}
+
+
+def test_kll_rejects_invalid_error():
+    with pytest.raises(ValueError):
+        create_quantile_estimator("kll", 1.5)
+
+
+def test_exact_matches_numpy_across_chunks():
+    values = np.random.default_rng(0).lognormal(1.0, 1.2, 10_000)
+    values[::97] = np.nan
+    estimator = create_quantile_estimator("exact")
+    for chunk in np.array_split(values, 13):
+        estimator.update(chunk)
+
+    assert estimator.count == np.count_nonzero(~np.isnan(values))
+    np.testing.assert_allclose(
+        estimator.quantile(QUANTILES), np.nanquantile(values, QUANTILES)
+    )
+
+
+@pytest.mark.parametrize("error", [0.05, 0.01])
+@pytest.mark.parametrize(
+    "distribution",
+    [
+        lambda rng, n: rng.lognormal(1.0, 1.2, n),
+        lambda rng, n: rng.geometric(0.08, n).astype("float64"),
+        lambda rng, n: rng.random(n),
+    ],
+    ids=["lognormal", "discrete", "uniform"],
+)
+def test_kll_stays_within_error_bound_with_bounded_memory(distribution, error):
+    rng = np.random.default_rng(42)
+    values = distribution(rng, 200_000)
+    sketch = KLLSketch(error=error, seed=0)
+    for chunk in np.array_split(values, 50):
+        sketch.update(chunk)
+
+    sorted_values = np.sort(values)
+    for estimate, q in zip(sketch.quantile(QUANTILES), QUANTILES):
+        assert rank_error(sorted_values, estimate, q) <= error
+    assert sketch.nbytes < values.nbytes / 20
+
+
+def test_kll_merge_matches_error_bound_of_single_sketch():
+    rng = np.random.default_rng(7)
+    parts = [rng.normal(size=50_000) for _ in range(4)]
+    merged = KLLSketch(error=0.01, seed=0)
+    for i, part in enumerate(parts):
+        merged.merge(KLLSketch(error=0.01, seed=i).update(part))
+
+    values = np.sort(np.concatenate(parts))
+    assert merged.count == len(values)
+    for estimate, q in zip(merged.quantile(QUANTILES), QUANTILES):
+        assert rank_error(values, estimate, q) <= 0.01
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.incremental_rfm import IncrementalRFM
+from src.features.rfm import compute_rfm
+from src.features.rfm_snapshots import iter_rfm_snapshots
+
+# Cancellations leave some customers with negative spend, whose Monetary_log is NaN
+# as in the notebook
+pytestmark = pytest.mark.filterwarnings(
+    "ignore:invalid value encountered in log1p:RuntimeWarning"
+)
+
+
+@pytest.mark.parametrize("missing_invoices", [0.0, 0.1])
+def test_compute_rfm_matches_notebook(
+    make_transactions, notebook_rfm, missing_invoices
+):
+    df = make_transactions(missing_invoices=missing_invoices)
+    pd.testing.assert_frame_equal(compute_rfm(df), notebook_rfm(df), check_dtype=False)
+
+
+def test_missing_invoice_is_not_counted_as_an_invoice(notebook_rfm):
+    df = pd.DataFrame(
+        {
+            "CustomerID": [1.0, 2.0, 2.0],
+            "InvoiceNo": ["A", None, "B"],
+            "InvoiceDate": pd.to_datetime(["2011-01-01", "2011-01-02", "2011-01-03"]),
+            "TotalPrice": [10.0, 5.0, 2.5],
+        }
+    )
+    rfm = compute_rfm(df)
+
+    assert rfm["Frequency"].tolist() == [1, 1]
+    assert rfm["Monetary"].tolist() == [10.0, 7.5]
+    pd.testing.assert_frame_equal(rfm, notebook_rfm(df), check_dtype=False)
+
+
+def test_compute_rfm_computes_total_price_and_parses_dates(
+    make_transactions, notebook_rfm
+):
+    df = make_transactions(rows=2_000)
+    raw = df.drop(columns="TotalPrice").assign(
+        Quantity=2, UnitPrice=df["TotalPrice"] / 2
+    )
+    raw["InvoiceDate"] = raw["InvoiceDate"].dt.strftime("%m/%d/%Y %H:%M")
+
+    expected = notebook_rfm(df.assign(InvoiceDate=df["InvoiceDate"].dt.floor("min")))
+    pd.testing.assert_frame_equal(
+        compute_rfm(raw, date_format="%m/%d/%Y %H:%M"), expected, check_dtype=False
+    )
+
+
+def test_incremental_rfm_matches_compute_rfm_with_missing_invoices(make_transactions):
+    df = make_transactions(missing_invoices=0.1)
+    store = IncrementalRFM()
+    df = df.sort_values("InvoiceDate")
+    for start in range(0, len(df), 3_000):
+        store.update(df.iloc[start : start + 3_000])
+
+    pd.testing.assert_frame_equal(store.to_frame(), compute_rfm(df), check_dtype=False)
+
+
+@pytest.mark.parametrize("missing_invoices", [0.0, 0.1])
+def test_rfm_snapshots_match_compute_rfm(make_transactions, missing_invoices):
+    df = make_transactions(missing_invoices=missing_invoices)
+    df.loc[df.index[:3], "InvoiceNo"] = None
+    cutoff = pd.Timestamp("2011-07-01")
+    end = df["InvoiceDate"].max() + pd.Timedelta(days=1)
+
+    snapshots = dict(iter_rfm_snapshots(df, [end, cutoff]))
+
+    for reference_date, history in [
+        (cutoff, df[df["InvoiceDate"] < cutoff]),
+        (end, df),
+    ]:
+        expected = compute_rfm(
+            history.dropna(subset=["CustomerID"]), reference_date=reference_date
+        )
+        pd.testing.assert_frame_equal(
+            snapshots[reference_date], expected, check_dtype=False
+        )
+
+
+def test_incremental_rfm_save_and_load_without_suffix(make_transactions, tmp_path):
+    df = make_transactions(missing_invoices=0.1).sort_values("InvoiceDate")
+    half = len(df) // 2
+    store = IncrementalRFM().update(df.iloc[:half])
+
+    written = store.save(tmp_path / "rfm_state")
+    assert written == str(tmp_path / "rfm_state.npz")
+
+    restored = IncrementalRFM.load(tmp_path / "rfm_state").update(df.iloc[half:])
+    pd.testing.assert_frame_equal(
+        restored.to_frame(), compute_rfm(df), check_dtype=False
+    )
+
+
+def test_incremental_rfm_keeps_few_sorted_runs(make_transactions):
+    df = make_transactions(rows=50_000, missing_invoices=0.1).sort_values("InvoiceDate")
+    store = IncrementalRFM()
+    for start in range(0, len(df), 500):
+        store.update(df.iloc[start : start + 500])
+
+    for runs in [store.customers, store.invoice_keys]:
+        sizes = [len(run[0]) for run in runs.runs]
+        assert all(larger >= 2 * smaller for larger, smaller in zip(sizes, sizes[1:]))
+        keys = np.concatenate([run[0] for run in runs.runs])
+        assert len(np.unique(keys)) == len(keys)
+    pd.testing.assert_frame_equal(store.to_frame(), compute_rfm(df), check_dtype=False)
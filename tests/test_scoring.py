@@ -0,0 +1,28 @@
+import pandas as pd
+import pytest
+
+from src.modeling.scoring import load_scoring_artifacts, score_file
+from utils.config import RFM_CLUSTERS_PATH
+
+# The shipped model was pickled with an older scikit-learn
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+def test_score_file_reproduces_training_clusters_in_any_batch(tmp_path):
+    rfm = pd.read_csv(RFM_CLUSTERS_PATH)
+    subset = rfm.sample(50, random_state=0)
+    subset_path = tmp_path / "subset.csv"
+    subset.drop(columns="Cluster").to_csv(subset_path, index=False)
+
+    for path, expected in [(RFM_CLUSTERS_PATH, rfm), (str(subset_path), subset)]:
+        output_path = tmp_path / "scored.csv"
+        rows = score_file(path, str(output_path), chunksize=1_000, workers=0)
+        scored = pd.read_csv(output_path)
+
+        assert rows == len(expected)
+        assert scored["Cluster"].tolist() == expected["Cluster"].tolist()
+
+
+def test_missing_scaler_fails_loudly(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Scaler not found"):
+        load_scoring_artifacts(scaler_path=str(tmp_path / "missing.pkl"))
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+from src.features.rfm import compute_rfm
+from src.modeling.scoring import load_scoring_artifacts, predict_clusters
+from src.modeling.snapshots import write_rfm_snapshots
+from utils.config import KMEANS_MODEL_PATH
+
+# The shipped model was pickled with an older scikit-learn
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+def test_snapshots_are_scored_with_the_training_scaler(make_transactions, tmp_path):
+    df = make_transactions(rows=5_000)
+    cutoff = pd.Timestamp("2011-07-01")
+
+    [path] = write_rfm_snapshots(
+        df, [cutoff], str(tmp_path), model_path=KMEANS_MODEL_PATH
+    )
+    snapshot = pd.read_parquet(path)
+
+    model, scaler = load_scoring_artifacts(KMEANS_MODEL_PATH)
+    history = df[(df["InvoiceDate"] < cutoff) & df["CustomerID"].notna()]
+    rfm = compute_rfm(history, reference_date=cutoff)
+    expected = predict_clusters(
+        model, scaler, rfm[["Recency", "Frequency", "Monetary_log"]].to_numpy()
+    )
+    assert snapshot["Cluster"].tolist() == expected.tolist()
+
+
+def test_snapshots_require_the_persisted_scaler(make_transactions, tmp_path):
+    with pytest.raises(FileNotFoundError, match="Scaler not found"):
+        write_rfm_snapshots(
+            make_transactions(rows=100),
+            ["2011-07-01"],
+            str(tmp_path),
+            model_path=KMEANS_MODEL_PATH,
+            scaler_path=str(tmp_path / "missing.pkl"),
+        )
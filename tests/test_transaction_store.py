@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_preprocessing.create_dataframe import create_dataframe
+from src.data_preprocessing.transaction_store import (
+    CLEAN_TRANSACTION_FILTERS,
+    write_transaction_store,
+)
+
+
+@pytest.fixture
+def transactions():
+    return pd.DataFrame(
+        {
+            "InvoiceNo": ["1", "2", "3", "4", "5"],
+            "InvoiceDate": pd.to_datetime(
+                ["2011-01-03", "2011-01-04", "2011-02-01", "2011-02-02", "2011-03-01"]
+            ),
+            "CustomerID": [12346.0, np.nan, -1.0, 0.0, 12347.0],
+            "Quantity": [1, 2, 3, 4, -5],
+            "UnitPrice": [1.0, 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+
+
+def test_clean_filters_only_drop_missing_customers(tmp_path, transactions):
+    source = tmp_path / "transactions.csv"
+    transactions.to_csv(source, index=False)
+    store = tmp_path / "store"
+    write_transaction_store(str(source), str(store))
+
+    expected = [12346.0, -1.0, 0.0]
+    from_store = create_dataframe(str(store), filters=CLEAN_TRANSACTION_FILTERS)
+    from_csv = create_dataframe(str(source), filters=CLEAN_TRANSACTION_FILTERS)
+    assert sorted(from_store["CustomerID"]) == sorted(expected)
+    assert sorted(from_csv["CustomerID"]) == sorted(expected)
+
+    batches = create_dataframe(
+        str(store), chunksize=2, filters=[("CustomerID", "is null", None)]
+    )
+    assert pd.concat(list(batches))["CustomerID"].isna().tolist() == [True]
+
+
+def test_store_refuses_chunks_that_do_not_fit_its_schema(tmp_path, transactions):
+    source = tmp_path / "transactions.csv"
+    transactions.to_csv(source, index=False)
+    # The third chunk of two rows holds a fractional quantity after int64 chunks
+    source.write_text(source.read_text().replace(",-5,", ",4.5,"))
+
+    with pytest.raises(ValueError, match="does not fit the store schema"):
+        write_transaction_store(str(source), str(tmp_path / "store"), chunksize=2)
+
+    write_transaction_store(
+        str(source), str(tmp_path / "store"), chunksize=2, dtype={"Quantity": float}
+    )
+    stored = create_dataframe(str(tmp_path / "store"))
+    assert sorted(stored["Quantity"]) == [1, 2, 3, 4, 4.5]
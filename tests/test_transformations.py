@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda.outliers.transformations import (
+    apply_transformation,
+    best_transformation_with_outliers,
+)
+
+SKEW_CATEGORIES = {"high_skew": ["a", "b"], "moderate_skew": ["c"]}
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    rows = 200_000
+    return pd.DataFrame(
+        {
+            "a": rng.lognormal(0.0, 1.0, rows),
+            "b": rng.exponential(2.0, rows),
+            "c": rng.gamma(2.0, 1.0, rows),
+            "d": rng.normal(0.0, 1.0, rows),
+            "e": rng.normal(0.0, 1.0, rows),
+        }
+    )
+
+
+@pytest.mark.parametrize("handle_outliers", [False, True])
+def test_inplace_mutates_the_frame_and_matches_the_copy(frame, handle_outliers):
+    original = frame.copy()
+    kwargs = dict(handle_outliers=handle_outliers, method="transform")
+
+    expected = best_transformation_with_outliers(original, SKEW_CATEGORIES, **kwargs)
+    result = best_transformation_with_outliers(
+        frame, SKEW_CATEGORIES, inplace=True, **kwargs
+    )
+
+    if handle_outliers:
+        (expected, expected_mask), (result, mask) = expected, result
+        pd.testing.assert_series_equal(mask, expected_mask)
+    assert result is frame
+    pd.testing.assert_frame_equal(frame, expected)
+
+
+def test_copy_mode_leaves_the_frame_unchanged(frame):
+    original = frame.copy()
+    best_transformation_with_outliers(frame, SKEW_CATEGORIES)
+    pd.testing.assert_frame_equal(frame, original)
+
+
+def test_float32_output(frame):
+    expected = best_transformation_with_outliers(frame, SKEW_CATEGORIES)
+    result = best_transformation_with_outliers(frame, SKEW_CATEGORIES, dtype="float32")
+
+    assert (result[["a", "b", "c"]].dtypes == "float32").all()
+    assert (result[["d", "e"]].dtypes == "float64").all()
+    np.testing.assert_allclose(
+        result[["a", "b", "c"]], expected[["a", "b", "c"]], rtol=1e-6
+    )
+
+
+# log1p(-1) and 1 / 0 warn, as they do on the Series path
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("transformation_type", ["log", "sqrt", "square", "reciprocal"])
+def test_buffer_output_matches_series_output(transformation_type):
+    df = pd.DataFrame({"x": [0.0, 0.5, 2.0, -1.0, np.nan]})
+    out = np.empty(len(df))
+
+    result = apply_transformation(df, "x", transformation_type, out=out)
+
+    assert result is out
+    expected = apply_transformation(df, "x", transformation_type)
+    np.testing.assert_allclose(out, expected.to_numpy(), equal_nan=True)
+
+
+def test_memory_budget_is_checked_and_reported(frame, capsys):
+    frame_bytes = int(frame.memory_usage(index=False).sum())
+
+    inplace = best_transformation_with_outliers(
+        frame.copy(), SKEW_CATEGORIES, inplace=True, memory_budget=frame_bytes
+    )
+    assert "exceeded the memory budget" not in capsys.readouterr().out
+    # One column-sized buffer at a time, no full-frame copy
+    assert inplace.attrs["peak_memory_bytes"] < frame_bytes / 2
+    assert inplace.attrs["memory_budget_bytes"] == frame_bytes
+
+    copied = best_transformation_with_outliers(
+        frame, SKEW_CATEGORIES, memory_budget=frame_bytes // 2
+    )
+    assert "exceeded the memory budget" in capsys.readouterr().out
+    assert copied.attrs["peak_memory_bytes"] >= frame_bytes
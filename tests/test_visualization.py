@@ -0,0 +1,49 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+
+from utils.chart_summaries import summarize_box, summary_boxplot
+import utils.visualization as visualization
+from utils.visualization import LARGE_DATA_ROWS, plot_functions, visualize_chart
+
+
+def large_hist_chart():
+    values = pd.Series(np.random.default_rng(0).lognormal(size=LARGE_DATA_ROWS))
+    return [
+        {"plot_function": plot_functions["hist"], "title": "UnitPrice", "x": values}
+    ]
+
+
+def test_visualize_chart_reduces_only_on_request(monkeypatch):
+    calls = []
+    original = visualization.reduce_chart_objs
+
+    def spy(chart_objs, **kwargs):
+        calls.append(kwargs)
+        return original(chart_objs, **kwargs)
+
+    monkeypatch.setattr(visualization, "reduce_chart_objs", spy)
+    for reduce in [False, "auto", True]:
+        plt.close(visualize_chart(large_hist_chart(), reduce=reduce))
+
+    assert calls == [{}, {"min_rows": 0}]
+
+
+def test_summary_boxplot_is_horizontal():
+    values = np.random.default_rng(0).normal(size=1_000)
+    ax = summary_boxplot(summarize_box(values))
+
+    # A horizontal box spans the quartiles along x
+    x_limits = ax.get_xlim()
+    assert (
+        x_limits[0]
+        <= np.percentile(values, 25)
+        < np.percentile(values, 75)
+        <= x_limits[1]
+    )
+    assert ax.get_yticks().size == 0
+    plt.close(ax.figure)
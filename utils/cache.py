@@ -0,0 +1,335 @@
+import copy
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.config import RESULT_CACHE_DIR
+
+# Rows per block when fingerprint sampling is opted into
+FINGERPRINT_BLOCK_ROWS = 1024
+
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024**2
+DEFAULT_MAX_DISK_BYTES = 512 * 1024**2
+
+# Values returned from the cache as they are; anything not shareable is deep-copied
+IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), np.generic)
+
+
+class _Uncacheable(Exception):
+    """Raised while building a key for arguments that cannot be fingerprinted."""
+
+
+def dataframe_fingerprint(df, blocks=None, block_rows=FINGERPRINT_BLOCK_ROWS):
+    """
+    Computes a fingerprint of a DataFrame or Series.
+
+    Hashes the shape, column labels, dtypes and every row, index included, with
+    `pd.util.hash_pandas_object`.
+
+    Sampling is opt-in: with `blocks`, only that many evenly spaced blocks of
+    `block_rows` rows are hashed. That is cheaper on large frames, but an edit that
+    falls outside every sampled block is not detected and serves a stale result.
+
+    Args:
+        df (pd.DataFrame | pd.Series): The data to fingerprint.
+        blocks (int, optional): Number of row blocks to sample. Defaults to hashing all rows.
+        block_rows (int): Rows per block when sampling.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = hashlib.sha1()
+    digest.update(repr(df.shape).encode())
+    if isinstance(df, pd.DataFrame):
+        digest.update(repr(list(zip(df.columns, map(str, df.dtypes)))).encode())
+    else:
+        digest.update(repr((df.name, str(df.dtype))).encode())
+
+    rows = len(df)
+    if blocks is None or rows <= blocks * block_rows:
+        starts = [0] if rows else []
+        block_rows = rows
+    else:
+        starts = np.linspace(0, rows - block_rows, blocks).astype("int64")
+
+    for start in starts:
+        block = df.iloc[start : start + block_rows]
+        digest.update(
+            pd.util.hash_pandas_object(block, index=True).to_numpy().tobytes()
+        )
+
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of function results: an in-memory LRU and an optional on-disk tier.
+
+    Both tiers are bounded in bytes: the memory tier by the `memory_usage(deep=True)`
+    size of the cached frames (see `value_nbytes`), evicting the least recently used
+    entries beyond `max_memory_bytes`, and the disk tier by the size of its pickle
+    files beyond `max_disk_bytes`. The cache is disabled until
+    `configure(enabled=True)` is called.
+
+    DataFrame arguments are keyed by a hash of all their rows. Setting
+    `fingerprint_blocks` samples that many row blocks instead (see
+    `dataframe_fingerprint`), trading exactness for speed on large frames.
+
+    Cached values are not deep-copied. Hits return shallow copies of DataFrames and
+    Series, which pandas' copy-on-write keeps independent of the cached ones, and
+    read-only views of NumPy arrays.
+    """
+
+    def __init__(
+        self,
+        enabled=False,
+        max_memory_bytes=DEFAULT_MAX_MEMORY_BYTES,
+        cache_dir=None,
+        max_disk_bytes=DEFAULT_MAX_DISK_BYTES,
+        fingerprint_blocks=None,
+    ):
+        self.memory = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.configure(
+            enabled, max_memory_bytes, cache_dir, max_disk_bytes, fingerprint_blocks
+        )
+
+    def configure(
+        self,
+        enabled=True,
+        max_memory_bytes=DEFAULT_MAX_MEMORY_BYTES,
+        cache_dir=RESULT_CACHE_DIR,
+        max_disk_bytes=DEFAULT_MAX_DISK_BYTES,
+        fingerprint_blocks=None,
+    ):
+        """Enables or disables the cache and sets its limits. Pass cache_dir=None for memory only."""
+        self.enabled = enabled
+        self.max_memory_bytes = max_memory_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.fingerprint_blocks = fingerprint_blocks
+        self._evict_memory()
+        return self
+
+    def get(self, key):
+        """Returns (True, value) on a hit and (False, None) on a miss."""
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return True, _share(self.memory[key][0])
+
+        path = self._disk_path(key)
+        if path and os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                print(f"Warning: Ignoring unreadable cache file {path}.")
+            else:
+                # Mark as recently used for disk eviction and promote to memory
+                os.utime(path)
+                self._put_memory(key, value)
+                self.hits += 1
+                return True, _share(value)
+
+        self.misses += 1
+        return False, None
+
+    def put(self, key, value):
+        """Stores a value in both tiers."""
+        self._put_memory(key, _share(value, detach=True))
+
+        path = self._disk_path(key)
+        if path:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            self._evict_disk()
+
+    def clear(self):
+        """Removes every entry from both tiers."""
+        self.memory.clear()
+        self.memory_bytes = 0
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def _put_memory(self, key, value):
+        nbytes = value_nbytes(value)
+        if key in self.memory:
+            self.memory_bytes -= self.memory.pop(key)[1]
+        # A value larger than the whole tier would only evict everything else
+        if nbytes > self.max_memory_bytes:
+            return
+        self.memory[key] = (value, nbytes)
+        self.memory_bytes += nbytes
+        self._evict_memory()
+
+    def _evict_memory(self):
+        """Drops the least recently used entries until the tier fits in max_memory_bytes."""
+        while self.memory and self.memory_bytes > self.max_memory_bytes:
+            _, (_, nbytes) = self.memory.popitem(last=False)
+            self.memory_bytes -= nbytes
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl") if self.cache_dir else None
+
+    def _evict_disk(self):
+        """Deletes the least recently used files until the tier fits in max_disk_bytes."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pkl"):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(os.path.join(self.cache_dir, name))
+            total -= size
+
+
+def value_nbytes(value):
+    """
+    Approximate memory held by a cached value, in bytes: `memory_usage(deep=True)` for
+    DataFrames and Series, `nbytes` for arrays, summed over dicts, lists and tuples.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            value_nbytes(k) + value_nbytes(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(value_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def _copy_on_write():
+    """Whether pandas copy-on-write is active (always from pandas 3)."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+def _share(value, detach=False):
+    """
+    Returns a cached value without deep-copying it: shallow copies of frames and Series,
+    which copy-on-write keeps independent of each other, and read-only views of arrays.
+
+    With `detach` (when a fresh result enters the cache), arrays are copied once, since
+    the caller keeps a writable reference to the original.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not _copy_on_write())
+    if isinstance(value, np.ndarray):
+        value = value.copy() if detach else value.view()
+        value.flags.writeable = False
+        return value
+    if type(value) is dict:
+        return {k: _share(v, detach) for k, v in value.items()}
+    if type(value) in (list, tuple):
+        return type(value)(_share(item, detach) for item in value)
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    return copy.deepcopy(value)
+
+
+# Shared cache used by the EDA functions; call result_cache.configure() to enable it
+result_cache = ResultCache()
+
+
+def cached_result(cache=result_cache, bypass_kwargs=()):
+    """
+    Decorator that serves a function's result from `cache` when the inputs are unchanged.
+
+    DataFrame and Series arguments are keyed by `dataframe_fingerprint` (sampled only
+    when the cache sets `fingerprint_blocks`), everything else by its repr. Calls with iterator arguments (e.g. chunk streams), or with a
+    truthy value for any argument named in `bypass_kwargs`, are never cached.
+
+    Args:
+        cache (ResultCache): Cache to use.
+        bypass_kwargs (tuple): Argument names that disable caching when truthy
+                               (e.g. 'inplace', since the caller needs its frame mutated).
+
+    Returns:
+        callable: The decorator.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not cache.enabled:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if any(bound.arguments.get(name) for name in bypass_kwargs):
+                return func(*args, **kwargs)
+
+            try:
+                key = _cache_key(func, bound.arguments, cache.fingerprint_blocks)
+            except _Uncacheable:
+                return func(*args, **kwargs)
+
+            hit, value = cache.get(key)
+            if hit:
+                return value
+
+            value = func(*args, **kwargs)
+            cache.put(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _cache_key(func, arguments, fingerprint_blocks=None):
+    """Builds the cache key from the function identity and its fingerprinted arguments."""
+    digest = hashlib.sha1(f"{func.__module__}.{func.__qualname__}".encode())
+    for name, value in arguments.items():
+        digest.update(name.encode())
+        digest.update(_argument_token(value, fingerprint_blocks).encode())
+    return digest.hexdigest()
+
+
+def _argument_token(value, fingerprint_blocks=None):
+    """Returns a stable string standing for one argument value."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return dataframe_fingerprint(value, blocks=fingerprint_blocks)
+    if isinstance(value, np.ndarray):
+        return hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest()
+    if inspect.isgenerator(value) or (
+        hasattr(value, "__next__") and hasattr(value, "__iter__")
+    ):
+        raise _Uncacheable()
+    if isinstance(value, dict):
+        return repr(
+            sorted(
+                (k, _argument_token(v, fingerprint_blocks)) for k, v in value.items()
+            )
+        )
+    if isinstance(value, (list, tuple, set)):
+        items = sorted(value, key=repr) if isinstance(value, set) else value
+        return repr([_argument_token(item, fingerprint_blocks) for item in items])
+    return repr(value)
@@ -0,0 +1,179 @@
+import numpy as np
+
+# Values used to estimate the KDE curve of a histogram
+KDE_SAMPLE_SIZE = 20_000
+# Points the KDE curve is evaluated at
+KDE_GRID_POINTS = 200
+# Upper limit on the number of bins chosen by a NumPy binning rule such as 'auto'
+MAX_BINS = 200
+# Outliers drawn per box plot; the rest are thinned out (the extremes are always kept)
+MAX_FLIERS = 2_000
+
+
+class HistogramSummary(dict):
+    """Pre-binned histogram of a column: 'edges', 'counts' and optional 'kde_x'/'kde_y'."""
+
+
+class BoxSummary(dict):
+    """Box plot statistics of a column in the layout of `matplotlib.axes.Axes.bxp`."""
+
+
+def summarize_histogram(
+    values, bins="auto", kde=False, kde_sample_size=KDE_SAMPLE_SIZE, random_state=0
+):
+    """
+    Bins a column with NumPy and, optionally, estimates its KDE on a sample.
+
+    The KDE uses Scott's bandwidth factor for the full number of values, so the curve
+    of the sample follows the one a full-data KDE would draw, and is scaled to counts
+    like seaborn's `histplot(kde=True)`.
+
+    Args:
+        values (array-like): The column to summarize; NaNs are ignored.
+        bins (int | str): Number of bins or a NumPy binning rule; a rule yields at
+                          most MAX_BINS bins.
+        kde (bool): Whether to estimate the KDE curve.
+        kde_sample_size (int): Maximum number of values the KDE is estimated on.
+        random_state (int): Seed of the KDE sample.
+
+    Returns:
+        HistogramSummary: The bin edges and counts, and the KDE curve when requested.
+    """
+    values = _finite(values)
+    if isinstance(bins, str):
+        edges = np.histogram_bin_edges(values, bins=bins)
+        bins = edges if len(edges) <= MAX_BINS + 1 else MAX_BINS
+    counts, edges = np.histogram(values, bins=bins)
+    summary = HistogramSummary(edges=edges, counts=counts)
+
+    if kde and len(values) > 1 and values.min() < values.max():
+        from scipy.stats import gaussian_kde
+
+        sample = values
+        if len(values) > kde_sample_size:
+            rng = np.random.default_rng(random_state)
+            sample = rng.choice(values, kde_sample_size, replace=False)
+
+        estimator = gaussian_kde(sample, bw_method=len(values) ** (-1 / 5))
+        grid = np.linspace(values.min(), values.max(), KDE_GRID_POINTS)
+        bin_width = np.diff(edges).mean()
+        summary["kde_x"] = grid
+        summary["kde_y"] = estimator(grid) * len(values) * bin_width
+
+    return summary
+
+
+def summarize_box(values, whis=1.5, max_fliers=MAX_FLIERS, random_state=0):
+    """
+    Computes the quartiles, whiskers and outliers of a column for a box plot.
+
+    Args:
+        values (array-like): The column to summarize; NaNs are ignored.
+        whis (float): Whisker reach as a multiple of the IQR.
+        max_fliers (int): Maximum number of outliers kept for drawing.
+        random_state (int): Seed used when thinning out the outliers.
+
+    Returns:
+        BoxSummary: 'q1', 'med', 'q3', 'whislo', 'whishi' and 'fliers'.
+    """
+    values = _finite(values)
+    if len(values) == 0:
+        raise ValueError("Cannot summarize an empty column for a box plot.")
+
+    q1, med, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    lower, upper = q1 - whis * (q3 - q1), q3 + whis * (q3 - q1)
+
+    inside = values[(values >= lower) & (values <= upper)]
+    fliers = values[(values < lower) | (values > upper)]
+    if len(fliers) > max_fliers:
+        rng = np.random.default_rng(random_state)
+        kept = rng.choice(fliers, max_fliers - 2, replace=False)
+        fliers = np.concatenate([kept, [fliers.min(), fliers.max()]])
+
+    return BoxSummary(
+        q1=q1,
+        med=med,
+        q3=q3,
+        whislo=inside.min() if len(inside) else q1,
+        whishi=inside.max() if len(inside) else q3,
+        fliers=fliers,
+    )
+
+
+def binned_histplot(x, color=None, element="bars", kde=False, ax=None, **kwargs):
+    """
+    Draws a `HistogramSummary` in the style of `sns.histplot`.
+
+    Args:
+        x (HistogramSummary): The pre-binned histogram.
+        color (str, optional): Fill and line color.
+        element (str): 'bars', 'step' or 'poly', as in seaborn.
+        kde (bool): Whether to draw the KDE curve, if the summary has one.
+        ax (matplotlib.axes.Axes, optional): Axes to draw on; defaults to the current axes.
+        **kwargs: Other seaborn options are accepted and ignored.
+
+    Returns:
+        matplotlib.axes.Axes: The axes drawn on.
+    """
+    from matplotlib import pyplot as plt
+
+    ax = ax or plt.gca()
+    edges, counts = x["edges"], x["counts"]
+
+    if element == "poly":
+        centers = (edges[:-1] + edges[1:]) / 2
+        ax.fill_between(centers, counts, color=color, alpha=0.25)
+        ax.plot(centers, counts, color=color, linewidth=0.8)
+    else:
+        # A single patch for all bins; one Rectangle per bin is slow to draw
+        ax.stairs(counts, edges, fill=True, color=color, alpha=0.5)
+
+    if kde and "kde_x" in x:
+        ax.plot(x["kde_x"], x["kde_y"], color=color)
+
+    ax.set_ylabel("Count")
+    return ax
+
+
+def summary_boxplot(x, color=None, ax=None, **kwargs):
+    """
+    Draws a horizontal `BoxSummary` in the style of `sns.boxplot`.
+
+    Args:
+        x (BoxSummary): The box plot statistics.
+        color (str, optional): Box color.
+        ax (matplotlib.axes.Axes, optional): Axes to draw on; defaults to the current axes.
+        **kwargs: Other seaborn options are accepted and ignored.
+
+    Returns:
+        matplotlib.axes.Axes: The axes drawn on.
+    """
+    from matplotlib import pyplot as plt
+
+    ax = ax or plt.gca()
+    ax.bxp(
+        [dict(x)],
+        **_horizontal_bxp_kwargs(),
+        patch_artist=True,
+        boxprops={"facecolor": color or "C0", "alpha": 0.8},
+        medianprops={"color": "black"},
+        flierprops={"marker": "d", "markersize": 4, "markerfacecolor": "gray"},
+    )
+    ax.set_yticks([])
+    return ax
+
+
+def _horizontal_bxp_kwargs():
+    """`Axes.bxp` option for horizontal boxes: `orientation` since matplotlib 3.10, `vert` before."""
+    import matplotlib
+
+    major, minor = (int(part) for part in matplotlib.__version__.split(".")[:2])
+    if (major, minor) >= (3, 10):
+        return {"orientation": "horizontal"}
+    return {"vert": False}
+
+
+def _finite(values):
+    """Returns the values as a float64 array without NaNs and infinities."""
+    values = np.asarray(values, dtype="float64")
+    return values[np.isfinite(values)]
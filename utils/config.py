@@ -6,3 +6,18 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 # Data paths
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 DATA_PATH = os.path.join(DATA_DIR, "data.csv")
+RFM_STATE_PATH = os.path.join(DATA_DIR, "rfm_state.npz")
+RFM_CLUSTERS_PATH = os.path.join(DATA_DIR, "rfm_with_clusters.csv")
+
+# Model paths
+MODELS_DIR = os.path.join(PROJECT_ROOT, "models")
+KMEANS_MODEL_PATH = os.path.join(MODELS_DIR, "kmeans_rfm_model.pkl")
+SCALER_PATH = os.path.join(MODELS_DIR, "rfm_scaler.pkl")
+
+# Cache paths
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".cache")
+RESULT_CACHE_DIR = os.path.join(CACHE_DIR, "results")
+PIPELINE_DIR = os.path.join(CACHE_DIR, "pipeline")
+
+# Plotting: set SEGMENTATION_HEADLESS=1 to skip charts in batch jobs
+HEADLESS = os.environ.get("SEGMENTATION_HEADLESS", "0") == "1"
@@ -27,8 +27,51 @@ SUMMARIES = {
     "OBSERVATIONS": "observations",
     "SKEWNESS": "skewness",
     "STATISTICS": "statistics",
+    "MEMORY": "memory",
+    "PERFORMANCE": "performance",
 }
 
+MEMORY_REPORT = {
+    "DETAILS": "details",
+    "TOTAL_BEFORE": "total_before",
+    "TOTAL_AFTER": "total_after",
+}
+
+PERFORMANCE_TRACE = {
+    "STEP": "step",
+    "DEPTH": "depth",
+    "STARTED_AT": "started_at",
+    "WALL": "wall_s",
+    "CPU": "cpu_s",
+    "PEAK_BYTES": "peak_bytes",
+    "ROWS_IN": "rows_in",
+    "ROWS_OUT": "rows_out",
+}
+
+TRANSACTIONS = {
+    "INVOICE_NO": "InvoiceNo",
+    "STOCK_CODE": "StockCode",
+    "DESCRIPTION": "Description",
+    "QUANTITY": "Quantity",
+    "INVOICE_DATE": "InvoiceDate",
+    "UNIT_PRICE": "UnitPrice",
+    "CUSTOMER_ID": "CustomerID",
+    "COUNTRY": "Country",
+    "TOTAL_PRICE": "TotalPrice",
+}
+
+RFM = {
+    "RECENCY": "Recency",
+    "FREQUENCY": "Frequency",
+    "MONETARY": "Monetary",
+    "MONETARY_LOG": "Monetary_log",
+    "CLUSTER": "Cluster",
+}
+
+# Features the KMeans model is trained on, before and after scaling
+RFM_FEATURES = ["Recency", "Frequency", "Monetary_log"]
+SCALED_FEATURES = ["Recency_scaled", "Frequency_scaled", "Monetary_scaled"]
+
 CLEAN_TEXT = {
     "STOP_WORDS": "english",
-    }
\ No newline at end of file
+}
@@ -1,5 +1,9 @@
+import hashlib
+import os
 from pathlib import Path
 
+import numpy as np
+
 
 def get_file_extension_from_path(input_path: str) -> str:
     """
@@ -12,3 +16,46 @@ def get_file_extension_from_path(input_path: str) -> str:
         str: File extension in lowercase.
     """
     return Path(input_path).suffix.lstrip(".").lower()
+
+
+def get_file_fingerprint(input_path: str, **kwargs) -> str:
+    """
+    Builds a short fingerprint of a local file from its path, size and modification time.
+
+    Args:
+        input_path (str): Local file path.
+        **kwargs: Extra values (e.g. reader arguments) folded into the fingerprint.
+
+    Returns:
+        str: Hex digest that changes whenever the file or the extra values change.
+    """
+    stat = os.stat(input_path)
+    key = "|".join(
+        [
+            os.path.abspath(input_path),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            repr(sorted(kwargs.items())),
+        ]
+    )
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def sorted_isin(values, sorted_keys):
+    """
+    Vectorized membership test of `values` in an already sorted key array.
+
+    One `np.searchsorted` instead of the hash table `np.isin` builds, for key arrays
+    that are kept sorted anyway (e.g. seen-sets of row or invoice fingerprints).
+
+    Args:
+        values (np.ndarray): Values to look up.
+        sorted_keys (np.ndarray): Keys in ascending order.
+
+    Returns:
+        np.ndarray: Boolean mask, True where the value is one of the keys.
+    """
+    if len(sorted_keys) == 0:
+        return np.zeros(len(values), dtype=bool)
+    positions = np.minimum(np.searchsorted(sorted_keys, values), len(sorted_keys) - 1)
+    return sorted_keys[positions] == values
@@ -0,0 +1,152 @@
+import datetime
+import functools
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+
+from utils.constants import PERFORMANCE_TRACE
+from utils.memory import track_peak_memory
+
+
+class Tracer:
+    """
+    Opt-in recorder of per-step wall time, CPU time, tracemalloc peak and row counts.
+
+    Disabled until `enable()` is called; while disabled, instrumented functions run
+    with no overhead beyond one attribute check. tracemalloc slows down Python-level
+    allocations, so enable the tracer for diagnostic runs only.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self._depth = 0
+        self._started_tracemalloc = False
+
+    def enable(self):
+        """Starts recording (and tracemalloc, if it is not running yet)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.enabled = True
+        return self
+
+    def disable(self):
+        """Stops recording; the records are kept until `clear`."""
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        return self
+
+    def clear(self):
+        """Removes all records."""
+        self.records = []
+
+    def save(self, path):
+        """Writes the records to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.records, f, indent=2)
+        return path
+
+    @contextmanager
+    def step(self, name, rows_in=None):
+        """
+        Records one step. Steps can be nested; a step's peak includes its sub-steps.
+
+        Args:
+            name (str): Step name.
+            rows_in (int, optional): Number of input rows.
+
+        Yields:
+            dict: The record, so the caller can set PERFORMANCE_TRACE['ROWS_OUT'].
+        """
+        if not self.enabled:
+            yield {}
+            return
+
+        record = {
+            PERFORMANCE_TRACE["STEP"]: name,
+            PERFORMANCE_TRACE["DEPTH"]: self._depth,
+            PERFORMANCE_TRACE["STARTED_AT"]: datetime.datetime.now().isoformat(
+                timespec="seconds"
+            ),
+            PERFORMANCE_TRACE["ROWS_IN"]: rows_in,
+            PERFORMANCE_TRACE["ROWS_OUT"]: None,
+        }
+        # Appended on entry so the records are in start order, parents before sub-steps
+        self.records.append(record)
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        memory = {"peak_bytes": 0}
+        self._depth += 1
+        try:
+            # Shares the peak bookkeeping of `track_peak_memory` blocks inside the step
+            with track_peak_memory() as memory:
+                yield record
+        finally:
+            self._depth -= 1
+            record[PERFORMANCE_TRACE["WALL"]] = time.perf_counter() - wall_start
+            record[PERFORMANCE_TRACE["CPU"]] = time.process_time() - cpu_start
+            record[PERFORMANCE_TRACE["PEAK_BYTES"]] = memory["peak_bytes"]
+
+
+# Shared tracer used by the instrumented pipeline functions; call tracer.enable() to record
+tracer = Tracer()
+
+
+def instrumented(name=None, tracer=tracer):
+    """
+    Decorator that records every call of a function as a step of `tracer`.
+
+    Input rows are taken from the first DataFrame or Series argument, output rows
+    from the result (or the first element of a tuple result). Chunk iterators have
+    no row count.
+
+    Args:
+        name (str, optional): Step name; defaults to the function name.
+        tracer (Tracer): Tracer to record into.
+
+    Returns:
+        callable: The decorator.
+    """
+
+    def decorator(func):
+        step_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+
+            rows_in = next(
+                (
+                    count
+                    for count in map(_row_count, [*args, *kwargs.values()])
+                    if count is not None
+                ),
+                None,
+            )
+            with tracer.step(step_name, rows_in) as record:
+                result = func(*args, **kwargs)
+                output = result[0] if isinstance(result, tuple) and result else result
+                record[PERFORMANCE_TRACE["ROWS_OUT"]] = _row_count(output)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def load_trace(path):
+    """Reads a trace written by `Tracer.save`."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def _row_count(value):
+    """Number of rows of a DataFrame or Series, else None."""
+    return len(value) if isinstance(value, (pd.DataFrame, pd.Series)) else None
@@ -0,0 +1,54 @@
+import tracemalloc
+from contextlib import contextmanager
+
+# Open `track_peak_memory` blocks, innermost last: {'start': bytes, 'peak': bytes}
+_frames = []
+
+
+@contextmanager
+def track_peak_memory():
+    """
+    Measures the peak memory allocated inside the `with` block using tracemalloc.
+
+    NumPy buffers are reported to tracemalloc, so this captures array and DataFrame
+    allocations as well as Python objects.
+
+    Blocks can be nested, including inside `Tracer` steps, which use this function:
+    tracemalloc has a single global peak, so before a block resets it the peak reached
+    so far is folded into the enclosing block, and on exit the block's own peak is
+    folded back. Every block therefore reports the same peak as it would on its own.
+
+    Yields:
+        dict: Filled on exit with 'peak_bytes', the peak allocation above the level
+              at entry.
+    """
+    report = {"peak_bytes": 0}
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+
+    current, peak = tracemalloc.get_traced_memory()
+    if _frames:
+        _frames[-1]["peak"] = max(_frames[-1]["peak"], peak)
+    tracemalloc.reset_peak()
+    frame = {"start": current, "peak": current}
+    _frames.append(frame)
+    try:
+        yield report
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        frame["peak"] = max(frame["peak"], peak)
+        _frames.pop()
+        if _frames:
+            _frames[-1]["peak"] = max(_frames[-1]["peak"], frame["peak"])
+        report["peak_bytes"] = max(frame["peak"] - frame["start"], 0)
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def format_bytes(num_bytes):
+    """Formats a byte count as a human readable string (e.g. '12.34 MB')."""
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(num_bytes) < 1024 or unit == "GB":
+            return f"{num_bytes:.2f} {unit}"
+        num_bytes /= 1024
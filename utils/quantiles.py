@@ -0,0 +1,171 @@
+import numpy as np
+
+# Default rank error of the sketch backends (fraction of the row count)
+DEFAULT_QUANTILE_ERROR = 0.01
+
+# k ≈ KLL_CONSTANT / error keeps the observed rank error of quartiles within `error`
+KLL_CONSTANT = 3.0
+KLL_MIN_K = 8
+KLL_LEVEL_DECAY = 2 / 3
+
+
+class ExactQuantiles:
+    """
+    Exact quantiles over values that arrive in chunks.
+
+    Keeps every non-null value, so memory grows with the data. Matches pandas'
+    `quantile` (linear interpolation) and serves as the reference backend.
+    """
+
+    def __init__(self, error=None):
+        self.arrays = []
+        self.count = 0
+
+    def update(self, values):
+        """Adds an array of values; NaNs are ignored."""
+        values = _clean(values)
+        self.arrays.append(values)
+        self.count += len(values)
+        return self
+
+    def merge(self, other):
+        """Combines another ExactQuantiles into this one."""
+        self.arrays.extend(other.arrays)
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        """Returns the quantile(s) `q` of all values seen so far."""
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        return np.quantile(np.concatenate(self.arrays), q)
+
+    @property
+    def nbytes(self):
+        """Memory held by the stored values, in bytes."""
+        return sum(array.nbytes for array in self.arrays)
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch (Karnin, Lang and Liberty, 2016).
+
+    Values are kept in a stack of compactors; items at level h stand for 2**h
+    original values. When a level overflows it is sorted and every other item
+    is promoted to the next level, so memory stays at O(k) regardless of how
+    many values are added. Quantiles have a rank error of about `error` * count.
+    """
+
+    def __init__(self, error=DEFAULT_QUANTILE_ERROR, seed=None):
+        error = DEFAULT_QUANTILE_ERROR if error is None else error
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1.")
+
+        self.k = max(KLL_MIN_K, int(np.ceil(KLL_CONSTANT / error)))
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """Adds an array of values; NaNs are ignored."""
+        values = _clean(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Combines another KLLSketch into this one, level by level."""
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+
+        self.k = max(self.k, other.k)
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """Returns the estimated quantile(s) `q` of all values seen so far."""
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level), 2**h, dtype="int64")
+                for h, level in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+
+        ranks = np.asarray(q, dtype="float64") * (cumulative[-1] - 1)
+        positions = np.searchsorted(cumulative, ranks, side="right")
+        result = items[np.minimum(positions, len(items) - 1)]
+        return result if np.ndim(q) else result.item()
+
+    @property
+    def nbytes(self):
+        """Memory held by the sketch items, in bytes."""
+        return sum(level.nbytes for level in self.levels)
+
+    def _capacity(self, level):
+        """Capacity of a level; lower levels shrink geometrically below the top one."""
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * KLL_LEVEL_DECAY**depth)))
+
+    def _compress(self):
+        """Compacts every overflowing level into the one above it, bottom-up."""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                items = np.sort(items)
+                # An odd item out stays behind so the promoted half has exact weight
+                leftover, items = items[: len(items) % 2], items[len(items) % 2 :]
+                promoted = items[self._rng.integers(2) :: 2]
+
+                self.levels[level] = leftover
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], promoted]
+                )
+            level += 1
+
+
+# Registered quantile backends
+QUANTILE_BACKENDS = {
+    "exact": ExactQuantiles,
+    "kll": KLLSketch,
+}
+
+
+def create_quantile_estimator(backend="exact", error=None):
+    """
+    Creates a quantile estimator for the given backend.
+
+    Args:
+        backend (str): One of the keys of QUANTILE_BACKENDS ('exact' or 'kll').
+        error (float, optional): Target rank error for sketch backends. Ignored by 'exact'.
+
+    Returns:
+        ExactQuantiles | KLLSketch: An empty estimator with update/merge/quantile methods.
+
+    Raises:
+        ValueError: If the backend is not registered.
+    """
+    if backend not in QUANTILE_BACKENDS:
+        raise ValueError(
+            f"Unsupported quantile backend '{backend}'. Choose from {', '.join(QUANTILE_BACKENDS)}."
+        )
+    return QUANTILE_BACKENDS[backend](error=error)
+
+
+def _clean(values):
+    """Returns values as a float64 array without NaNs."""
+    values = np.asarray(values, dtype="float64")
+    return values[~np.isnan(values)]
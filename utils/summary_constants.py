@@ -14,3 +14,15 @@ class OverviewConstants:
     NO_DUPLICATE_ROWS = "There are no duplicate rows in the dataset."
     DATA_TYPES = "Data Types:\n"
     SUMMARY_STATISTICS = "Summary Statistics:"
+
+
+class MemoryConstants:
+    MEMORY_NOT_FOUND = "No memory report is available."
+    TOTALS = "Memory usage went from {BEFORE} to {AFTER} ({SAVINGS:.2f}% saved).\n"
+    DETAILS = "Per-column memory usage:"
+
+
+class PerformanceConstants:
+    TRACE_NOT_FOUND = "No performance trace is available."
+    TOTALS = "{STEPS} steps recorded; top-level steps took {WALL:.3f}s wall time and {CPU:.3f}s CPU time.\n"
+    DETAILS = "Per-step performance (nested steps are indented):"
@@ -1,19 +1,142 @@
-from matplotlib import pyplot as plt
-import seaborn as sns
-
-plot_functions = {
-    "scatter": sns.scatterplot,
-    "line": sns.lineplot,
-    "bar": sns.barplot,
-    "box": sns.boxplot,
-    "hist": sns.histplot,
-    "pie": plt.pie,
-    "count": sns.countplot,
-    "heatmap": sns.heatmap,
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.chart_summaries import (
+    binned_histplot,
+    summarize_box,
+    summarize_histogram,
+    summary_boxplot,
+)
+from utils.config import HEADLESS
+
+# Histograms and box plots of columns longer than this are drawn from NumPy summaries
+LARGE_DATA_ROWS = 100_000
+
+# Plot function names resolved to matplotlib/seaborn callables on first use
+PLOT_FUNCTION_NAMES = {
+    "scatter": ("seaborn", "scatterplot"),
+    "line": ("seaborn", "lineplot"),
+    "bar": ("seaborn", "barplot"),
+    "box": ("seaborn", "boxplot"),
+    "hist": ("seaborn", "histplot"),
+    "pie": ("matplotlib.pyplot", "pie"),
+    "count": ("seaborn", "countplot"),
+    "heatmap": ("seaborn", "heatmap"),
 }
 
 
-def visualize_chart(chart_objs, nrows=1, ncols=1, legend=None, **kwargs):
+class _LazyPlotFunctions(Mapping):
+    """
+    Mapping of chart names to plotting functions that imports seaborn and matplotlib
+    only when a function is first looked up, so importing this module stays cheap.
+    """
+
+    def __init__(self, names):
+        self._names = names
+        self._functions = {}
+
+    def __getitem__(self, key):
+        if key not in self._functions:
+            import importlib
+
+            module_name, attribute = self._names[key]
+            self._functions[key] = getattr(
+                importlib.import_module(module_name), attribute
+            )
+        return self._functions[key]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+plot_functions = _LazyPlotFunctions(PLOT_FUNCTION_NAMES)
+
+
+class LazyFigure:
+    """
+    Handle to a chart that is drawn only when `render` (or `savefig`) is called.
+
+    Lets compute functions hand back their chart without paying for it in headless runs.
+    """
+
+    def __init__(self, draw, *args, **kwargs):
+        self._draw = draw
+        self._args = args
+        self._kwargs = kwargs
+        self._figure = None
+
+    def render(self):
+        """Draws the chart once and returns the matplotlib figure."""
+        if self._figure is None:
+            self._figure = self._draw(*self._args, **self._kwargs)
+        return self._figure
+
+    def savefig(self, path, **kwargs):
+        """Renders the chart and saves it to `path`."""
+        return self.render().savefig(path, **kwargs)
+
+
+def resolve_plot_mode(plot):
+    """Returns the plot mode to use: True, False or 'lazy'. None follows the HEADLESS setting."""
+    if plot is None:
+        return not HEADLESS
+    if plot not in (True, False, "lazy"):
+        raise ValueError(
+            f"Invalid plot mode '{plot}'. Choose from True, False or 'lazy'."
+        )
+    return plot
+
+
+def reduce_chart_objs(chart_objs, min_rows=LARGE_DATA_ROWS):
+    """
+    Replaces the raw columns of histogram and box plot charts with NumPy summaries.
+
+    Histograms become pre-binned counts with a KDE estimated on a sample, box plots
+    their quartiles, whiskers and a bounded set of outliers, so the plotting layer
+    only receives a few hundred values per chart. Other charts are returned unchanged.
+
+    Parameters:
+    - chart_objs (list): Chart dictionaries as accepted by `visualize_chart`.
+    - min_rows (int): Only columns with at least this many values are reduced.
+
+    Returns:
+    - list: The chart dictionaries, with reduced charts as copies.
+    """
+    reduced = []
+    for chart in chart_objs:
+        plot_function = chart["plot_function"]
+        x = chart["x"]
+        if chart.get("y") is not None or not hasattr(x, "__len__") or len(x) < min_rows:
+            reduced.append(chart)
+            continue
+
+        chart_kwargs = dict(chart.get("kwargs", {}))
+        if plot_function == plot_functions["hist"]:
+            x = summarize_histogram(
+                x,
+                bins=chart_kwargs.pop("bins", "auto"),
+                kde=chart_kwargs.get("kde", False),
+            )
+            plot_function = binned_histplot
+        elif plot_function == plot_functions["box"]:
+            x = summarize_box(x, whis=chart_kwargs.pop("whis", 1.5))
+            plot_function = summary_boxplot
+        else:
+            reduced.append(chart)
+            continue
+
+        reduced.append(
+            {**chart, "plot_function": plot_function, "x": x, "kwargs": chart_kwargs}
+        )
+
+    return reduced
+
+
+def visualize_chart(chart_objs, nrows=1, ncols=1, legend=None, reduce=False, **kwargs):
     """
     Create a custom visualization chart with optional subplots.
 
@@ -22,12 +145,23 @@ def visualize_chart(chart_objs, nrows=1, ncols=1, legend=None, **kwargs):
                           chart-specific information like 'plot_function', 'titles', etc.
     - nrows (int): Number of rows for the subplot grid. Default is 1.
     - ncols (int): Number of columns for the subplot grid. Default is 1.
+    - reduce (bool | str): Draw histograms and box plots from NumPy summaries (see
+                           `reduce_chart_objs`). False (default) plots the raw values,
+                           True reduces every such chart and 'auto' only those with at
+                           least LARGE_DATA_ROWS values.
     - **kwargs: Additional common keyword arguments passed to the plotting function.
 
     Returns:
     - fig (matplotlib.figure.Figure): The created figure object.
     """
 
+    from matplotlib import pyplot as plt
+
+    if reduce == "auto":
+        chart_objs = reduce_chart_objs(chart_objs)
+    elif reduce:
+        chart_objs = reduce_chart_objs(chart_objs, min_rows=0)
+
     width = 18 if ncols == 1 else ncols * 5.43
     height = 6 if nrows == 1 else nrows * 4
 
@@ -81,3 +215,57 @@ def visualize_chart(chart_objs, nrows=1, ncols=1, legend=None, **kwargs):
     fig = plt.gcf()
 
     return fig
+
+
+def export_charts(figures, output_dir, file_format="png", workers=None, dpi=100):
+    """
+    Renders chart grids to image files in parallel worker processes with the Agg backend.
+
+    Histograms and box plots are reduced to NumPy summaries in the calling process
+    first, so only the summaries are sent to the workers.
+
+    Parameters:
+    - figures (dict): Maps a file name (without extension) to the keyword arguments of
+                      `visualize_chart`: 'chart_objs' and optionally 'nrows' and 'ncols'.
+    - output_dir (str): Directory the files are written to; created if missing.
+    - file_format (str): 'png' or 'svg'.
+    - workers (int, optional): Number of worker processes. Defaults to the CPU count
+                               (capped at the number of figures); 0 or 1 renders in the
+                               current process.
+    - dpi (int): Resolution of PNG files.
+
+    Returns:
+    - list: Paths of the written files, in the order of `figures`.
+    """
+    if file_format not in ["png", "svg"]:
+        raise ValueError(f"Unsupported chart format: {file_format}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = []
+    for name, figure in figures.items():
+        figure = {**figure, "chart_objs": reduce_chart_objs(figure["chart_objs"])}
+        jobs.append((figure, os.path.join(output_dir, f"{name}.{file_format}"), dpi))
+
+    workers = min(os.cpu_count() if workers is None else workers, len(jobs))
+    if workers <= 1:
+        return [_render_to_file(*job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_use_agg_backend) as pool:
+        return list(pool.map(_render_to_file, *zip(*jobs)))
+
+
+def _use_agg_backend():
+    """Switches matplotlib to the non-interactive Agg backend."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_to_file(figure, path, dpi):
+    """Draws one chart grid, saves it to `path` and closes it."""
+    from matplotlib import pyplot as plt
+
+    fig = visualize_chart(**figure, reduce=False)
+    fig.savefig(path, dpi=dpi)
+    plt.close(fig)
+    return path